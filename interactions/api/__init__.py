@@ -5,7 +5,10 @@ This section of the library maintains and
 handles all the Gateway and HTTP work.
 """
 from .cache import *  # noqa: F401 F403
+from .codec import *  # noqa: F401 F403
+from .dispatch import ComponentPattern  # noqa: F401
 from .error import *  # noqa: F401 F403
 from .gateway import *  # noqa: F401 F403
 from .http import *  # noqa: F401 F403
 from .models import *  # noqa: F401 F403
+from .tracing import *  # noqa: F401 F403
@@ -1,8 +1,17 @@
-from collections import defaultdict
+import os
+import pickle
+import sqlite3
+from collections.abc import MutableMapping
+from io import BytesIO
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -21,29 +30,310 @@ if TYPE_CHECKING:
 
 __all__ = (
     "Storage",
+    "StorageBackend",
+    "SQLiteBackend",
     "Cache",
 )
 
 _T = TypeVar("_T")
 _P = TypeVar("_P")
 
+_SNAPSHOT_HEADER = ("interactions.Cache", 1)
+
+
+class _Storages(dict):
+    """The storages of a :class:`Cache`, created with its backend factory on first access."""
+
+    __slots__ = ("_cache", "_backend", "_config")
+
+    def __init__(
+        self, cache: "Cache", backend: Optional["BackendFactory"], config: Dict[type, int]
+    ) -> None:
+        super().__init__()
+        self._cache = cache
+        self._backend = backend
+        self._config = config
+
+        for type_ in config:
+            self[type_]  # noqa
+
+    def __missing__(self, type_: type) -> "Storage":
+        limit = self._config.get(type_)
+        storage = self[type_] = Storage(
+            limit, self._backend(self._cache, type_, limit) if self._backend else None
+        )
+        return storage
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles the HTTP client and the cache referenced by objects as references instead of values."""
+
+    def __init__(self, file: BinaryIO, cache: "Cache") -> None:
+        super().__init__(file, protocol=5)
+        self._cache = cache
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self._cache:
+            return "cache"
+        if obj is not None and obj is getattr(self._cache, "_http", None):
+            return "http"
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Resolves the references of :class:`_SnapshotPickler` to the HTTP client and the cache restoring."""
+
+    def __init__(self, file: BinaryIO, cache: "Cache") -> None:
+        super().__init__(file)
+        self._cache = cache
+
+    def persistent_load(self, pid: str) -> Any:
+        if pid == "cache":
+            return self._cache
+        if pid == "http":
+            return getattr(self._cache, "_http", None)
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+class StorageBackend(MutableMapping):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing where the items of a :class:`Storage` are kept.
+
+    A backend is a mutable mapping of IDs to items. The default backend is the in-memory
+    :class:`.LRUDict`, other backends subclass this class and are created by the ``backend`` factory
+    of the :class:`Cache`, which is called with the cache, the type of the stored items and their limit.
+
+    .. note::
+        Backends keeping items out of the process return copies of them. Changes made to an item
+        are only kept once it is stored again, which :meth:`Storage.merge`, :meth:`Storage.write_back`
+        and the cache methods do.
+    """
+
+    __slots__ = ()
+
+
+BackendFactory = Callable[["Cache", Type[_T], Optional[int]], MutableMapping]
+
+
+def _encode_key(key: "Key") -> str:
+    return ":".join(str(int(_)) for _ in key) if isinstance(key, tuple) else str(int(key))
+
+
+def _decode_key(key: str) -> "Key":
+    ids = tuple(interactions.Snowflake(_) for _ in key.split(":"))
+    return ids if len(ids) > 1 else ids[0]
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing a :class:`StorageBackend` keeping items in a SQLite database, which can be shared by
+    several processes, for example one per shard.
+
+    Items are encoded with the pickle protocol 5 codec of :meth:`Cache.snapshot`, so the HTTP client they
+    reference is the one of the process reading them. When a limit is set, the items written the longest ago
+    are removed first.
+
+    .. warning::
+        Reads and writes are synchronous, like those of every :class:`StorageBackend`, and run on the event loop:
+        each one pickles the item and queries the database. Keep the database on a local disk, and prefer limiting
+        the cached types with the ``config`` of the :class:`Cache` over caching everything in it.
+
+    The number of items, used by ``len()`` and the limit, is counted by each process from its own writes, so
+    it is only an estimate while other processes write to the same database.
+
+    .. code-block:: python
+
+        client = interactions.Client(cache_backend=interactions.SQLiteBackend.factory("cache.db"))
+
+    :ivar str path: The path of the database.
+    :ivar Type type: The type of the stored items.
+    :ivar Optional[int] limit: The maximum number of items to store.
+    """
+
+    __slots__ = ("path", "type", "limit", "_cache", "_name", "_conn", "_count")
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        cache: "Cache",
+        type_: Type[_T],
+        limit: Optional[int] = None,
+    ) -> None:
+        """
+        :param Union[str, os.PathLike] path: The path of the database.
+        :param Cache cache: The cache the backend belongs to.
+        :param Type type_: The type of the stored items.
+        :param Optional[int] limit: The maximum number of items to store.
+        """
+        self.path: str = os.fspath(path)
+        self.type = type_
+        self.limit = limit or None
+        self._cache = cache
+        self._name: str = f"{type_.__module__}.{type_.__qualname__}"
+
+        # autocommit, so other processes see every write
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items "
+            "(type TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, PRIMARY KEY (type, key))"
+        )
+        self._count: int = self._conn.execute(
+            "SELECT COUNT(*) FROM items WHERE type = ?", (self._name,)
+        ).fetchone()[0]
+
+    @classmethod
+    def factory(cls, path: Union[str, os.PathLike]) -> BackendFactory:
+        """
+        Returns a backend factory creating the storages of a cache in the same database.
+
+        :param Union[str, os.PathLike] path: The path of the database.
+        :rtype: Callable[[Cache, Type, Optional[int]], SQLiteBackend]
+        """
+        return lambda cache, type_, limit: cls(path, cache, type_, limit)
+
+    def _dumps(self, item: _T) -> bytes:
+        buffer = BytesIO()
+        _SnapshotPickler(buffer, self._cache).dump(item)
+        return buffer.getvalue()
+
+    def _loads(self, data: bytes) -> _T:
+        return _SnapshotUnpickler(BytesIO(data), self._cache).load()
+
+    def __getitem__(self, key: "Key") -> _T:
+        row = self._conn.execute(
+            "SELECT value FROM items WHERE type = ? AND key = ?", (self._name, _encode_key(key))
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._loads(row[0])
+
+    def _write(self, rows: List[Tuple[str, str, bytes]]) -> None:
+        """Replaces rows in one transaction, counting the new ones."""
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for row in rows:
+                # deleting first moves the row to the end of the eviction order and tells whether it is new
+                replaced = self._conn.execute(
+                    "DELETE FROM items WHERE type = ? AND key = ?", row[:2]
+                ).rowcount
+                self._conn.execute("INSERT INTO items (type, key, value) VALUES (?, ?, ?)", row)
+                self._count += not replaced
+
+        if self.limit is not None and self._count > self.limit:
+            self._evict()
+
+    def __setitem__(self, key: "Key", value: _T) -> None:
+        self._write([(self._name, _encode_key(key), self._dumps(value))])
+
+    def __delitem__(self, key: "Key") -> None:
+        cursor = self._conn.execute(
+            "DELETE FROM items WHERE type = ? AND key = ?", (self._name, _encode_key(key))
+        )
+        if not cursor.rowcount:
+            raise KeyError(key)
+        self._count -= 1
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            _key = _encode_key(key)
+        except (TypeError, ValueError):
+            return False
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM items WHERE type = ? AND key = ?", (self._name, _key)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator["Key"]:
+        for (key,) in self._conn.execute(
+            "SELECT key FROM items WHERE type = ? ORDER BY rowid", (self._name,)
+        ):
+            yield _decode_key(key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _evict(self) -> None:
+        excess = self._count - self.limit
+        removed = self._conn.execute(
+            "DELETE FROM items WHERE rowid IN "
+            "(SELECT rowid FROM items WHERE type = ? ORDER BY rowid LIMIT ?)",
+            (self._name, excess),
+        ).rowcount
+        if removed == excess:
+            self._count -= removed
+        else:  # another process removed items meanwhile
+            self._count = self._conn.execute(
+                "SELECT COUNT(*) FROM items WHERE type = ?", (self._name,)
+            ).fetchone()[0]
+
+    def update(self, data: Dict["Key", _T] = (), /, **kwargs) -> None:
+        self._write(
+            [
+                (self._name, _encode_key(key), self._dumps(value))
+                for key, value in dict(data, **kwargs).items()
+            ]
+        )
+
+    def values(self) -> List[_T]:
+        return [
+            self._loads(value)
+            for (value,) in self._conn.execute(
+                "SELECT value FROM items WHERE type = ? ORDER BY rowid", (self._name,)
+            )
+        ]
+
+    def items(self) -> List[Tuple["Key", _T]]:
+        return [
+            (_decode_key(key), self._loads(value))
+            for key, value in self._conn.execute(
+                "SELECT key, value FROM items WHERE type = ? ORDER BY rowid", (self._name,)
+            )
+        ]
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM items WHERE type = ?", (self._name,))
+        self._count = 0
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._conn.close()
+
 
 class Storage(Generic[_T]):
     """
     A class representing a set of items stored as a cache state.
 
-    :ivar Dict[Union[Snowflake, Tuple[Snowflake, Snowflake]], Any] values: The list of items stored.
+    :ivar MutableMapping values: The items stored, an :class:`.LRUDict` unless another backend is used.
+    :ivar Dict[Union[Snowflake, Tuple[Snowflake, Snowflake]], float] _expiry: When the items added with a TTL expire, as :func:`time.monotonic` values.
     """
 
-    __slots__ = ("values",)
+    __slots__ = ("values", "_expiry")
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} object containing {len(self.values)} items.>"
 
-    def __init__(self, limit: Optional[int] = None) -> None:
+    def __init__(
+        self, limit: Optional[int] = None, backend: Optional[MutableMapping] = None
+    ) -> None:
         """
         :param Optional[int] limit: The maximum number of items to store
+        :param Optional[StorageBackend] backend:
+            .. versionadded:: 4.5.0
+
+            Where to keep the items. Defaults to an in-memory :class:`.LRUDict` respecting the limit.
         """
+        self._expiry: Dict["Key", float] = {}
+        if backend is not None:
+            self.values: MutableMapping["Key", _T] = backend
+            return
         if not limit:
             limit = float("inf")
         self.values: interactions.LRUDict["Key", _T] = interactions.LRUDict(max_items=limit)
@@ -55,7 +345,7 @@ class Storage(Generic[_T]):
         :param Any item: The item to merge.
         :param Optional[Union[Snowflake, Tuple[Snowflake, Snowflake]]] id: The unique id of the item.
         """
-        if not self.values.get(id or item.id):
+        if not self.get(id or item.id):
             return self.add(item, id)
 
         _id = id or item.id
@@ -81,14 +371,76 @@ class Storage(Generic[_T]):
                 else:
                     setattr(old_item, attrib, getattr(item, attrib))
 
-    def add(self, item: _T, id: Optional["Key"] = None) -> None:
+        self.write_back(old_item, _id)
+        if self._expiry:
+            self._expiry.pop(_id, None)
+
+    def add(self, item: _T, id: Optional["Key"] = None, ttl: Optional[float] = None) -> None:
         """
         Adds a new item to the storage.
 
+        .. versionchanged:: 4.5.0
+            Added the ``ttl`` argument.
+
         :param Any item: The item to add.
         :param Optional[Union[Snowflake, Tuple[Snowflake, Snowflake]]] id: The unique id of the item.
+        :param Optional[float] ttl: How long the item stays in the storage, in seconds. Defaults to forever.
+        """
+        _id = id or item.id
+        self.values[_id] = item
+
+        if ttl is not None:
+            self._expiry[_id] = monotonic() + ttl
+            if len(self._expiry) > 2 * len(self.values) + 64:
+                self._prune()
+        elif self._expiry:
+            self._expiry.pop(_id, None)
+
+    def write_back(self, item: _T, id: Optional["Key"] = None) -> None:
+        """
+        .. versionadded:: 4.5.0
+
+        Stores an item again after changing it in place. Backends keeping items out of the process return copies
+        of them, so the changes would be lost otherwise. Items kept in memory are not copied, so this does nothing
+        for them.
+
+        :param Any item: The changed item.
+        :param Optional[Union[Snowflake, Tuple[Snowflake, Snowflake]]] id: The unique id of the item.
+        """
+        if not isinstance(self.values, interactions.LRUDict):
+            self.values[id or item.id] = item
+
+    def ttl(self, id: "Key") -> Optional[float]:
         """
-        self.values[id or item.id] = item
+        .. versionadded:: 4.5.0
+
+        Returns how long an item added with a TTL stays in the storage.
+
+        :param Union[Snowflake, Tuple[Snowflake, Snowflake]] id: The ID of the item.
+        :return: The remaining time in seconds, or ``None`` if the item does not expire.
+        :rtype: Optional[float]
+        """
+        deadline = self._expiry.get(id)
+        return None if deadline is None else max(deadline - monotonic(), 0.0)
+
+    def _expired(self, id: "Key") -> bool:
+        """Removes an item if its TTL is over, and returns whether it was."""
+        deadline = self._expiry.get(id)
+        if deadline is None or deadline > monotonic():
+            return False
+
+        del self._expiry[id]
+        self.values.pop(id, None)
+        return True
+
+    def _prune(self) -> None:
+        """Forgets the expiry of items which are expired or were evicted by the backend."""
+        now = monotonic()
+        for id in [
+            id for id, deadline in self._expiry.items() if deadline <= now or id not in self.values
+        ]:
+            del self._expiry[id]
+            self.values.pop(id, None)
 
     @overload
     def get(self, id: "Key") -> Optional[_T]:
@@ -107,14 +459,22 @@ class Storage(Generic[_T]):
         :return: The item from the storage if any.
         :rtype: Optional[Any]
         """
+        if self._expiry and self._expired(id):
+            return default
         return self.values.get(id, default)
 
     def update(self, data: Dict["Key", _T]):
         """
         Updates multiple items from the storage.
 
+        .. versionchanged:: 4.5.0
+            The updated items do not expire anymore, like the ones added without a TTL.
+
         :param dict data: The data to update with.
         """
+        if self._expiry:
+            for key in data:
+                self._expiry.pop(key, None)
         self.values.update(data)
 
     @overload
@@ -126,6 +486,8 @@ class Storage(Generic[_T]):
         ...
 
     def pop(self, key: "Key", default: Optional[_P] = None) -> Union[_T, _P, None]:
+        if self._expiry:
+            self._expiry.pop(key, None)
         return self.values.pop(key, default)
 
     @property
@@ -141,9 +503,13 @@ class Storage(Generic[_T]):
         return self.values.__getitem__(item)
 
     def __setitem__(self, key: "Key", value: _T) -> None:
+        if self._expiry:
+            self._expiry.pop(key, None)
         return self.values.__setitem__(key, value)
 
     def __delitem__(self, key: "Key") -> None:
+        if self._expiry:
+            self._expiry.pop(key, None)
         return self.values.__delitem__(key)
 
 
@@ -153,22 +519,103 @@ class Cache:
     This cache collects all of the HTTP requests made for
     the represented instances of the class.
 
-    :ivar defaultdict[Type, Storage] storages: A dictionary denoting the Type and the objects that correspond to the Type.
+    :ivar Dict[Type, Storage] storages: A dictionary denoting the Type and the objects that correspond to the Type.
+    :ivar Optional[float] http_ttl: How long objects fetched over HTTP by :func:`.get` stay cached, in seconds.
     """
 
-    __slots__ = ("_http", "storages", "config")
+    __slots__ = ("_http", "storages", "config", "http_ttl")
 
-    def __init__(self, config: Dict[Type[_T], int] = None) -> None:
-        self._http: interactions.HTTPClient
-        self.storages: Dict[Type[_T], Storage[_T]] = defaultdict(Storage)
+    def __init__(
+        self,
+        config: Dict[Type[_T], int] = None,
+        backend: Optional[BackendFactory] = None,
+        http_ttl: Optional[float] = 60.0,
+    ) -> None:
+        """
+        :param Optional[Dict[Type, int]] config: The maximum number of items to store per type.
+        :param Optional[Callable[[Cache, Type, Optional[int]], StorageBackend]] backend:
+            .. versionadded:: 4.5.0
+
+            A factory creating the backend of each storage, such as :meth:`SQLiteBackend.factory`.
+            Defaults to keeping the items in memory.
+        :param Optional[float] http_ttl:
+            .. versionadded:: 4.5.0
 
-        if config is not None:
-            for type_, limit in config.items():
-                self.storages[type_] = Storage(limit)
+            How long objects fetched over HTTP by :func:`.get` stay cached, in seconds, unless a gateway event
+            updates or deletes them first. ``None`` does not cache them. Defaults to ``60``.
+        """
+        self.http_ttl = http_ttl
+        self._http: interactions.HTTPClient
+        self.storages: Dict[Type[_T], Storage[_T]] = _Storages(self, backend, config or {})
 
     def __getitem__(self, item: Type[_T]) -> Storage[_T]:
         return self.storages[item]
 
+    def _store_guild(self, guild: "Guild") -> None:
+        """Stores a guild again after changing its IDs, which out-of-process backends need."""
+        self.storages[interactions.Guild].write_back(guild)
+
+    def snapshot(self, path: Union[str, os.PathLike]) -> None:
+        """
+        .. versionadded:: 4.5.0
+
+        Writes the items of every storage to a file, to be restored with :meth:`restore` on the next start.
+
+        The storages are written one after another with pickle protocol 5. The HTTP client and the cache
+        referenced by the objects are stored as references and are bound to the restoring cache.
+        The file is replaced atomically, so a crash while writing keeps the previous snapshot intact.
+
+        :param Union[str, os.PathLike] path: The path of the snapshot file.
+        """
+        _tmp = f"{os.fspath(path)}.tmp"
+
+        with open(_tmp, "wb") as file:
+            _SnapshotPickler(file, self).dump(_SNAPSHOT_HEADER)
+
+            for type_, storage in list(self.storages.items()):
+                if not storage.values:
+                    continue
+                # a pickler per storage keeps every record self-contained
+                _SnapshotPickler(file, self).dump((type_, list(storage.values.items())))
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(_tmp, path)
+
+    def restore(self, path: Union[str, os.PathLike]) -> int:
+        """
+        .. versionadded:: 4.5.0
+
+        Restores the storages from a file written by :meth:`snapshot`.
+
+        Restored items replace cached items with the same ID, and the item limits of this cache apply.
+        This should be called once the HTTP client of the cache exists, so that restored objects are bound to it.
+
+        .. warning::
+            Only restore snapshots you wrote yourself, as loading a pickle can execute arbitrary code.
+
+        :param Union[str, os.PathLike] path: The path of the snapshot file.
+        :return: The amount of restored items.
+        :rtype: int
+        """
+        count: int = 0
+
+        with open(path, "rb") as file:
+            if _SnapshotUnpickler(file, self).load() != _SNAPSHOT_HEADER:
+                raise pickle.UnpicklingError(f"{os.fspath(path)} is not a cache snapshot")
+
+            while True:
+                try:
+                    type_, items = _SnapshotUnpickler(file, self).load()
+                except EOFError:
+                    break
+
+                self.storages[type_].update(dict(items))
+                count += len(items)
+
+        return count
+
     def _get_object(
         self,
         type: Type[_T],
@@ -206,6 +653,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id or channel.guild_id):
             guild._channel_ids.add(channel.id)
+            self._store_guild(guild)
 
         return channel
 
@@ -219,6 +667,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id or channel.guild_id):
             guild._channel_ids.remove(channel_id)
+            self._store_guild(guild)
 
         return channel
 
@@ -230,6 +679,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id or thread.guild_id):
             guild._thread_ids.add(thread.id)
+            self._store_guild(guild)
 
         return thread
 
@@ -243,6 +693,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id or thread.guild_id):
             guild._thread_ids.remove(thread_id)
+            self._store_guild(guild)
 
         return thread
 
@@ -255,17 +706,34 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._member_ids.add(member.id)
+            self._store_guild(guild)
 
         return member
 
-    def add_members(self, data: List[dict], guild_id: "Snowflake") -> List["Member"]:
-        return [self.add_member(member, guild_id) for member in data]
+    def add_members(
+        self, data: List[dict], guild_id: "Snowflake", merge: bool = True
+    ) -> List["Member"]:
+        if merge:
+            return [self.add_member(member, guild_id) for member in data]
+
+        # Replaces cached members in one update instead of merging them attribute by attribute
+        members = [interactions.Member(**member, _client=self._http) for member in data]
+        self.storages[interactions.Member].update(
+            {(guild_id, member.id): member for member in members}
+        )
+
+        if guild := self.get_guild(guild_id):
+            guild._member_ids.update(member.id for member in members)
+            self._store_guild(guild)
+
+        return members
 
     def remove_member(self, user_id: "Snowflake", guild_id: "Snowflake"):
         member = self.storages[interactions.Member].pop((guild_id, user_id))
 
         if guild := self.get_guild(guild_id):
             guild._member_ids.remove(user_id)
+            self._store_guild(guild)
 
         return member
 
@@ -277,6 +745,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._role_ids.add(role.id)
+            self._store_guild(guild)
 
         return role
 
@@ -288,6 +757,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._role_ids.remove(role_id)
+            self._store_guild(guild)
 
         return role
 
@@ -299,6 +769,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._emoji_ids.add(emoji.id)
+            self._store_guild(guild)
 
         return emoji
 
@@ -310,6 +781,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._emoji_ids.remove(emoji_id)
+            self._store_guild(guild)
 
         return emoji
 
@@ -321,6 +793,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._sticker_ids.add(sticker.id)
+            self._store_guild(guild)
 
         return sticker
 
@@ -332,6 +805,7 @@ class Cache:
 
         if guild := self.get_guild(guild_id):
             guild._sticker_ids.remove(sticker_id)
+            self._store_guild(guild)
 
         return sticker
 
@@ -0,0 +1,63 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ("JSONCodec", "OrjsonCodec", "default_codec")
+
+
+class JSONCodec:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing how JSON payloads of the HTTP and Gateway clients are encoded and decoded.
+
+    This implementation uses the standard library. Subclass it and implement :meth:`dumps` and :meth:`loads`
+    to plug in another library.
+    """
+
+    __slots__ = ()
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object to UTF-8 JSON.
+
+        :param Any obj: The object to encode.
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document. Raw response bodies are passed as is, without being decoded to a string first.
+
+        :param Union[bytes, str] data: The document to decode.
+        :rtype: Any
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing a :class:`JSONCodec` using `orjson <https://github.com/ijl/orjson>`_.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is required to use the OrjsonCodec.")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+default_codec: JSONCodec = JSONCodec() if orjson is None else OrjsonCodec()
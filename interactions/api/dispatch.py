@@ -1,10 +1,26 @@
+import re
 from asyncio import AbstractEventLoop, Future, get_event_loop
+from inspect import isawaitable
 from logging import Logger
-from typing import Callable, Coroutine, Dict, List, Optional
+from typing import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..base import get_logger
+from .error import LibraryException
 
-__all__ = ("Listener",)
+__all__ = ("Listener", "ComponentPattern", "ComponentRouter", "WaiterRegistry")
 
 log: Logger = get_logger("dispatch")
 
@@ -17,12 +33,26 @@ class Listener:
     :ivar dict events: A list of events being dispatched.
     """
 
-    __slots__ = ("loop", "events", "extra_events")
+    __slots__ = ("loop", "events", "extra_events", "waiters")
 
     def __init__(self) -> None:
         self.loop: AbstractEventLoop = get_event_loop()
         self.events: Dict[str, List[Callable[..., Coroutine]]] = {}
         self.extra_events: Dict[str, List[Future]] = {}  # used in `Client.wait_for`
+        self.waiters: Dict[str, WaiterRegistry] = {}  # used in `Client.wait_for_component` and co.
+
+    def get_waiters(self, name: str) -> "WaiterRegistry":
+        """
+        .. versionadded:: 4.5.0
+
+        Returns the indexed waiters of an event, creating them if needed.
+
+        :param str name: The name of the event.
+        :rtype: WaiterRegistry
+        """
+        if (waiters := self.waiters.get(name)) is None:
+            waiters = self.waiters[name] = WaiterRegistry(self.loop)
+        return waiters
 
     def dispatch(self, name: str, /, *args, **kwargs) -> None:
         r"""
@@ -43,14 +73,14 @@ class Listener:
                         kwargs[converters[key]] = value
 
             self.loop.create_task(event(*args, **kwargs))
-            log.debug(f"DISPATCH: {event}")
+            log.debug("DISPATCH: %s", event)
 
         # wait_for events
         futs = self.extra_events.get(name, [])
         if not futs:
             return
 
-        log.debug(f"Resolving {len(futs)} futures")
+        log.debug("Resolving %s futures", len(futs))
 
         for fut in futs:
             if fut.done():
@@ -78,7 +108,7 @@ class Listener:
         event.append(coro)
 
         self.events[_name] = event
-        log.debug(f"REGISTER: {self.events[_name]}")
+        log.debug("REGISTER: %s", self.events[_name])
 
     def add(self, name: str) -> Future:
         """
@@ -93,3 +123,342 @@ class Listener:
         futures.append(fut)
         self.extra_events[name] = futures
         return fut
+
+
+class _Waiter:
+    """A pending future of a :class:`WaiterRegistry` along with its check."""
+
+    __slots__ = ("future", "check", "keys")
+
+    def __init__(
+        self,
+        future: Future,
+        check: Optional[Callable[..., Union[bool, Awaitable[bool]]]],
+        keys: Tuple[Hashable, ...],
+    ) -> None:
+        self.future = future
+        self.check = check
+        self.keys = keys
+
+
+class WaiterRegistry:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing futures waiting for an event, indexed by keys such as ``custom_id`` s or message IDs.
+
+    When the event is resolved with a set of keys, only the waiters registered under one of these keys, or under no
+    key at all, are checked. A waiter stays registered until its check passes or its future is done, at which point
+    it removes itself from the index. This includes futures cancelled by a timeout.
+
+    :ivar AbstractEventLoop loop: The coroutine event loop established on.
+    """
+
+    __slots__ = ("loop", "_index")
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        self.loop = loop
+        self._index: Dict[Optional[Hashable], Dict[_Waiter, None]] = {}
+
+    def __len__(self) -> int:
+        return len({waiter for waiters in self._index.values() for waiter in waiters})
+
+    def add(
+        self,
+        keys: Iterable[Hashable] = (),
+        check: Optional[Callable[..., Union[bool, Awaitable[bool]]]] = None,
+    ) -> Future:
+        """
+        Returns a Future that resolves with the arguments of the first resolution matching the keys and the check.
+
+        :param Iterable[Hashable] keys: The keys to wait for. Without keys, every resolution is checked.
+        :param Optional[Callable[..., Union[bool, Awaitable[bool]]]] check: A function or coroutine to call with the arguments of the resolution
+        :rtype: asyncio.Future
+        """
+        waiter = _Waiter(self.loop.create_future(), check, tuple(keys) or (None,))
+
+        for key in waiter.keys:
+            self._index.setdefault(key, {})[waiter] = None
+        waiter.future.add_done_callback(lambda _: self._remove(waiter))
+
+        return waiter.future
+
+    def _remove(self, waiter: _Waiter) -> None:
+        for key in waiter.keys:
+            if (waiters := self._index.get(key)) is not None:
+                waiters.pop(waiter, None)
+                if not waiters:
+                    del self._index[key]
+
+    def resolve(self, keys: Iterable[Hashable], *args) -> None:
+        r"""
+        Resolves the waiters registered under any of the keys whose check passes.
+
+        :param Iterable[Hashable] keys: The keys of the event.
+        :param Any \*args: The arguments to resolve the waiters with.
+        """
+        waiters: Dict[_Waiter, None] = dict(self._index.get(None, {}))
+        for key in keys:
+            waiters.update(self._index.get(key, {}))
+
+        for waiter in waiters:
+            if waiter.future.done():
+                continue
+            if waiter.check is None:
+                waiter.future.set_result(args)
+                continue
+
+            try:
+                res = waiter.check(*args)
+            except Exception as e:
+                waiter.future.set_exception(e)
+                continue
+
+            if isawaitable(res):
+                self.loop.create_task(self._resolve_awaitable(waiter, res, args))
+            elif res:
+                waiter.future.set_result(args)
+
+    @staticmethod
+    async def _resolve_awaitable(waiter: _Waiter, res: Awaitable[bool], args: tuple) -> None:
+        try:
+            res = await res
+        except Exception as e:
+            if not waiter.future.done():
+                waiter.future.set_exception(e)
+            return
+
+        if res and not waiter.future.done():
+            waiter.future.set_result(args)
+
+
+class _TrieNode:
+    """A node of the prefix tree of the :class:`ComponentRouter`."""
+
+    __slots__ = ("children", "param", "route")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}  # literal character: node
+        self.param: Optional["_TrieNode"] = None  # node after a placeholder, whatever its name
+        # event and placeholder names of a pattern
+        self.route: Optional[Tuple[str, Tuple[str, ...]]] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.children or self.param or self.route)
+
+
+class ComponentPattern(str):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing a ``custom_id`` pattern with ``{name}`` placeholders, like
+    ``ComponentPattern("page:{page}:next")``. Plain strings are always matched exactly, even if they contain braces.
+    """
+
+    __slots__ = ()
+
+
+class ComponentRouter:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing how component ``custom_id`` s are matched against patterns.
+
+    Patterns are either :class:`ComponentPattern` s with ``{name}`` placeholders, or compiled regular expressions
+    with named groups. The text a placeholder or named group matched is passed to the callback as keyword argument of
+    that name.
+
+    Placeholder patterns are stored in a tree branching on their literal characters and on their placeholders, so
+    patterns which do not share a prefix with the ``custom_id`` are never looked at. Literal characters take
+    precedence over placeholders, and placeholders match as few characters as possible. As a placeholder may end at
+    several places, every node of the tree is tried at most once per position of the ``custom_id``. Regular
+    expressions are tried afterwards, in the order they were added.
+
+    :ivar Dict[str, str] names: The event name of every registered pattern.
+    """
+
+    __slots__ = ("_root", "_regexes", "names")
+
+    _placeholder: Pattern = re.compile(r"{(\w+)}")
+
+    def __init__(self) -> None:
+        self._root: _TrieNode = _TrieNode()
+        self._regexes: List[Tuple[Pattern, str]] = []
+        self.names: Dict[str, str] = {}
+
+    @staticmethod
+    def is_pattern(pattern: Union[str, Pattern]) -> bool:
+        """
+        Checks whether a ``custom_id`` given to a component decorator is a pattern.
+
+        :param Union[str, Pattern] pattern: The ``custom_id`` or pattern.
+        :rtype: bool
+        """
+        return isinstance(pattern, (ComponentPattern, re.Pattern))
+
+    @staticmethod
+    def event_name(pattern: Union[str, Pattern]) -> str:
+        """
+        Returns the name of the event that the callbacks of a pattern are registered under.
+
+        :param Union[str, Pattern] pattern: The pattern.
+        :rtype: str
+        """
+        return f"component_{pattern.pattern if isinstance(pattern, re.Pattern) else pattern}"
+
+    def _path(self, pattern: str) -> List[Tuple[_TrieNode, Optional[str]]]:
+        """
+        Returns the nodes from the root to the node of a string pattern, with the literal character leading to the
+        next one, or ``None`` for a placeholder.
+        """
+        parts = self._placeholder.split(pattern)  # static, name, static, name, ..., static
+        path: List[Tuple[_TrieNode, Optional[str]]] = []
+        node = self._root
+
+        for i, part in enumerate(parts):
+            for key in part if i % 2 == 0 else (None,):
+                path.append((node, key))
+                if key is None:
+                    node.param = node.param or _TrieNode()
+                    node = node.param
+                else:
+                    node = node.children.setdefault(key, _TrieNode())
+
+        path.append((node, None))
+        return path
+
+    def add(self, pattern: Union[str, Pattern]) -> str:
+        """
+        Adds a pattern to the router.
+
+        :param Union[str, Pattern] pattern: The pattern to add.
+        :return: The name of the event to register the callbacks of the pattern under.
+        :rtype: str
+        :raises LibraryException: The pattern only differs from another one by the names of its placeholders.
+        """
+        name = self.event_name(pattern)
+        key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        if key in self.names:
+            return name
+
+        if isinstance(pattern, re.Pattern):
+            self.names[key] = name
+            self._regexes.append((pattern, name))
+            return name
+
+        path = self._path(pattern)
+        node = path[-1][0]
+        if node.route is not None:
+            # i.e. "page:{id}" and "page:{number}", which cannot be told apart
+            self._prune(path)
+            raise LibraryException(
+                code=4,
+                message=f"The pattern {key!r} matches the same custom_ids as "
+                f"{node.route[0][len('component_') :]!r}.",
+            )
+
+        self.names[key] = name
+        node.route = name, tuple(self._placeholder.findall(pattern))
+        return name
+
+    @staticmethod
+    def _prune(path: List[Tuple[_TrieNode, Optional[str]]]) -> None:
+        """Removes the nodes of a path left empty, from its end."""
+        for (parent, _key), (node, _) in zip(reversed(path[:-1]), reversed(path)):
+            if node:
+                break
+            if _key is None:
+                parent.param = None
+            else:
+                del parent.children[_key]
+
+    def remove(self, pattern: Union[str, Pattern]) -> bool:
+        """
+        Removes a pattern from the router, i.e. when the extension registering it is unloaded.
+
+        :param Union[str, Pattern] pattern: The pattern to remove.
+        :return: Whether the pattern was registered.
+        :rtype: bool
+        """
+        key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        if self.names.pop(key, None) is None:
+            return False
+
+        for regex in self._regexes:
+            if regex[0].pattern == key:
+                self._regexes.remove(regex)
+                return True
+
+        path = self._path(key)
+        path[-1][0].route = None
+        self._prune(path)
+        return True
+
+    def copy(self) -> "ComponentRouter":
+        """
+        Returns a router with the same patterns, i.e. to restore them if an extension fails to reload.
+
+        :rtype: ComponentRouter
+        """
+        router = ComponentRouter()
+        regexes: Dict[str, Pattern] = {regex.pattern: regex for regex, _ in self._regexes}
+        for key in self.names:
+            router.add(regexes.get(key, ComponentPattern(key)))
+        return router
+
+    def _walk(
+        self,
+        node: _TrieNode,
+        custom_id: str,
+        pos: int,
+        values: List[str],
+        failed: Set[Tuple[int, int]],
+    ) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """
+        Finds the pattern matching the rest of a ``custom_id`` from a node, collecting the placeholder values.
+        The nodes which did not match from a position are remembered in ``failed``, so they are not tried again.
+        """
+        if pos == len(custom_id):
+            return node.route
+        if (id(node), pos) in failed:
+            return None
+
+        child = node.children.get(custom_id[pos])
+        if child is not None and (route := self._walk(child, custom_id, pos + 1, values, failed)):
+            return route
+
+        if (child := node.param) is not None:
+            for end in range(pos + 1, len(custom_id) + 1):
+                # a placeholder can only end where the rest of its pattern can start
+                if (
+                    end < len(custom_id)
+                    and custom_id[end] not in child.children
+                    and not child.param
+                ):
+                    continue
+                values.append(custom_id[pos:end])
+                if route := self._walk(child, custom_id, end, values, failed):
+                    return route
+                values.pop()
+
+        failed.add((id(node), pos))
+        return None
+
+    def match(self, custom_id: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Finds the pattern a ``custom_id`` matches. Literal characters take precedence over placeholders.
+
+        :param str custom_id: The ``custom_id`` of the component.
+        :return: The event name of the pattern and the parsed segments, if any pattern matched.
+        :rtype: Optional[Tuple[str, Dict[str, str]]]
+        """
+        values: List[str] = []
+        if route := self._walk(self._root, custom_id, 0, values, set()):
+            name, params = route
+            return name, dict(zip(params, values))
+
+        for regex, name in self._regexes:
+            if match := regex.fullmatch(custom_id):
+                return name, match.groupdict()
+
+        return None
@@ -10,12 +10,16 @@ class LibraryException(Exception):
     """
     A class object representing all errors.
     If you want more information on what a specific code means, use `e.lookup(code)`
+
+    .. versionchanged:: 4.5.0
+        Errors of HTTP requests have the HTTP ``status`` of the response.
     """
 
     code: Optional[int]
     severity: int
+    status: Optional[int]
 
-    __slots__ = {"code", "severity", "message", "data"}
+    __slots__ = {"code", "severity", "message", "data", "status"}
 
     @staticmethod
     def _parse(_data: dict) -> List[tuple]:
@@ -304,6 +308,7 @@ class LibraryException(Exception):
         self.code: int = code
         self.severity: int = severity
         self.data: dict = kwargs.pop("data", None)
+        self.status: Optional[int] = kwargs.pop("status", None)
         self.message: str = message or self.lookup(self.code)
         _fmt_error: List[tuple] = []
 
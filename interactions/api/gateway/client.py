@@ -1,8 +1,3 @@
-try:
-    from orjson import dumps, loads
-except ImportError:
-    from json import dumps, loads
-
 from asyncio import (
     FIRST_COMPLETED,
     Event,
@@ -16,6 +11,7 @@ from asyncio import (
     wait,
     wait_for,
 )
+from logging import DEBUG
 from sys import platform, version_info
 from time import perf_counter
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
@@ -27,13 +23,16 @@ from ...base import __version__, get_logger
 from ...client.enums import IntEnum
 from ...client.models import Option  # noqa
 from ...utils.missing import MISSING
+from ..codec import JSONCodec, default_codec
 from ..dispatch import Listener
 from ..error import LibraryException
 from ..http.client import HTTPClient
 from ..models.flags import Intents
 from ..models.presence import ClientPresence
+from ..tracing import tracer
 from .heartbeat import _Heartbeat
 from .processors import Processor
+from .queue import _SendQueue
 from .ratelimit import WSRateLimit
 
 if TYPE_CHECKING:
@@ -101,6 +100,8 @@ class WebSocketClient:
     :ivar Lock reconnect_lock: The lock used for reconnecting the client.
     :ivar Lock _closing_lock: The lock used for closing the client.
     :ivar Optional[Task] __stopping: The task containing stopping the client, if any.
+    :ivar JSONCodec _codec: The codec encoding and decoding the payloads of the connection.
+    :ivar _SendQueue _queue: The queue of the packets waiting to be sent.
     """
 
     __slots__ = (
@@ -133,6 +134,8 @@ class WebSocketClient:
         "reconnect_lock",
         "_closing_lock",
         "__stopping",
+        "_codec",
+        "_queue",
     )
 
     def __init__(
@@ -143,6 +146,8 @@ class WebSocketClient:
         sequence: Optional[int] = MISSING,
         shards: Optional[List[Tuple[int]]] = MISSING,
         presence: Optional[ClientPresence] = MISSING,
+        resume_url: Optional[str] = MISSING,
+        codec: Optional[JSONCodec] = None,
     ) -> None:
         """
         :param str token: The token of the application for connecting to the Gateway.
@@ -151,6 +156,8 @@ class WebSocketClient:
         :param Optional[int] sequence: The identifier sequence if trying to reconnect. Defaults to ``None``.
         :param Optional[List[Tuple[int]]] shards: The list of shards for the application's initial connection, if provided. Defaults to ``None``.
         :param Optional[ClientPresence] presence: The presence shown on an application once first connected. Defaults to ``None``.
+        :param Optional[str] resume_url: The URL to resume the session on if trying to reconnect. Defaults to ``None``.
+        :param Optional[JSONCodec] codec: The JSON codec to use. Defaults to orjson if installed, or the standard library otherwise.
         """
         try:
             self._loop = get_event_loop() if version_info < (3, 10) else get_running_loop()
@@ -162,11 +169,13 @@ class WebSocketClient:
         self._ratelimiter = (
             WSRateLimit(loop=self._loop) if version_info < (3, 10) else WSRateLimit()
         )
+        self._queue: _SendQueue = _SendQueue(self._loop, self._ratelimiter, self._send_queued)
         self.__heartbeater: _Heartbeat = _Heartbeat(
             loop=self._loop if version_info < (3, 10) else None
         )
         self._http: Optional[HTTPClient] = None
         self._cache: "Cache" = cache
+        self._codec: JSONCodec = codec or default_codec
         self._event_processor: Optional[Processor] = None
 
         self._client: Optional["ClientWebSocketResponse"] = None
@@ -197,7 +206,7 @@ class WebSocketClient:
         self._last_send: float = perf_counter()
         self._last_ack: float = perf_counter()
 
-        self.resume_url: Optional[str] = None
+        self.resume_url: Optional[str] = None if resume_url is MISSING else resume_url
         self.ws_url: Optional[str] = None
         self.reconnect_lock = Lock(loop=self._loop) if version_info < (3, 10) else Lock()
 
@@ -232,7 +241,7 @@ class WebSocketClient:
 
     async def _manage_heartbeat(self) -> None:
         """Manages the heartbeat loop."""
-        log.debug(f"Sending heartbeat every {self.__heartbeater.delay / 1000} seconds...")
+        log.debug("Sending heartbeat every %s seconds...", self.__heartbeater.delay / 1000)
         while not self.__heartbeat_event.is_set():
 
             log.debug("Sending heartbeat...")
@@ -253,9 +262,22 @@ class WebSocketClient:
             else:
                 return  # break loop because something went wrong.
 
+    @property
+    def resumable(self) -> bool:
+        """
+        .. versionadded:: 4.5.0
+
+        Whether the client knows a session it can try to resume.
+        """
+        return bool(self.session_id and self.sequence is not None and self.resume_url)
+
     async def run(self) -> None:
         """
         Handles the client's connection with the Gateway.
+
+        .. versionchanged:: 4.5.0
+            If a session to resume was given, the client resumes it instead of identifying.
+            Discord answers with an invalid session if it cannot be resumed, upon which the client identifies.
         """
 
         if self._http is None:
@@ -264,9 +286,14 @@ class WebSocketClient:
         if self._event_processor is None:
             self._event_processor = Processor(self._http)
 
-        url = await self._http.get_gateway()
-        self.ws_url = url
+        to_resume: bool = self.resumable
+        if to_resume:
+            url = f"{self.resume_url}?v=10&encoding=json&compress=zlib-stream"
+        else:
+            url = await self._http.get_gateway()
+            self.ws_url = url
         self._client = await self._http._req._session.ws_connect(url, **self._options)
+        self._ratelimiter.reset()  # the ratelimit is per connection
 
         data = await self.__receive_packet(True)  # First data is the hello packet.
 
@@ -274,7 +301,10 @@ class WebSocketClient:
 
         self._task = create_task(self.run_heartbeat())
 
-        await self.__identify(self.__shard, self.__presence)
+        if to_resume:
+            await self.__resume()
+        else:
+            await self.__identify(self.__shard, self.__presence)
 
         self.__closed.set()
         self.__heartbeater.event.set()
@@ -315,7 +345,7 @@ class WebSocketClient:
             self.sequence = seq
 
         if op != OpCodeType.DISPATCH:
-            log.debug(data)
+            log.debug("%s", data)
 
             if op == OpCodeType.HEARTBEAT:
                 await self.__heartbeat()
@@ -334,7 +364,12 @@ class WebSocketClient:
                 await self._reconnect(True)
 
         elif event == "RESUMED":
-            log.debug(f"RESUMED (session_id: {self.session_id}, seq: {self.sequence})")
+            self.ready.set()
+            if not self.__started:
+                # resumed a session persisted by a previous process
+                self.__started = True
+                self._dispatch.dispatch("on_start")
+            log.debug("RESUMED (session_id: %s, seq: %s)", self.session_id, self.sequence)
         elif event == "READY":
             self.ready.set()
             self._dispatch.dispatch("on_ready")
@@ -345,10 +380,17 @@ class WebSocketClient:
             if not self.__started:
                 self.__started = True
                 self._dispatch.dispatch("on_start")
-            log.debug(f"READY (session_id: {self.session_id}, seq: {self.sequence})")
+            log.debug("READY (session_id: %s, seq: %s)", self.session_id, self.sequence)
         else:
-            log.debug(f"{event}: {str(data).encode('utf-8')}")
-            self._dispatch_event(event, data)
+            if log.isEnabledFor(DEBUG):
+                log.debug("%s: %s", event, str(data).encode("utf-8"))
+
+            if tracer.sampled("gateway"):
+                _start = perf_counter()
+                self._dispatch_event(event, data)
+                tracer.emit("gateway", "dispatch", _start, event=event)
+            else:
+                self._dispatch_event(event, data)
 
     async def wait_until_ready(self) -> None:
         """Waits for the client to become ready according to the Gateway."""
@@ -395,6 +437,10 @@ class WebSocketClient:
                 self.__unavailable_guilds.remove(guild_id)
             else:
                 self._dispatch.dispatch("on_guild_join", *args)
+        elif name == "guild_members_chunk" and (
+            waiters := self._dispatch.waiters.get("on_guild_members_chunk")
+        ):
+            waiters.resolve((args[0].nonce,), *args)
 
         self._dispatch.dispatch(f"on_{name}", *args)
 
@@ -428,6 +474,7 @@ class WebSocketClient:
                 url = f"{self.resume_url}?v=10&encoding=json&compress=zlib-stream"
 
             self._client = await self._http._req._session.ws_connect(url, **self._options)
+            self._ratelimiter.reset()
 
             data = await self.__receive_packet(True)  # First data is the hello packet.
 
@@ -462,7 +509,7 @@ class WebSocketClient:
             packet: WSMessage = await self._client.receive()
 
             if packet.type == WSMsgType.CLOSE:
-                log.debug(f"Disconnecting from gateway = {packet.data}::{packet.extra}")
+                log.debug("Disconnecting from gateway = %s::%s", packet.data, packet.extra)
 
                 if packet.data >= 4000:
                     # This means that the error code is 4000+, which may signify Discord-provided error codes.
@@ -506,6 +553,10 @@ class WebSocketClient:
             if packet.data is None:
                 continue  # We just loop it over because it could just be processing something.
 
+            _trace: bool = tracer.sampled("gateway")
+            if _trace:
+                _start = perf_counter()
+
             if isinstance(packet.data, bytes):
                 buffer.extend(packet.data)
 
@@ -513,54 +564,110 @@ class WebSocketClient:
                     # buffer isn't done we need to wait
                     continue
 
-                msg = self._zlib.decompress(buffer)
-                msg = msg.decode("utf-8")
+                msg = self._zlib.decompress(buffer)  # the codec decodes the bytes directly
             else:
                 msg = packet.data
 
             try:
-                _msg = loads(msg)
+                _msg = self._codec.loads(msg)
             except Exception as e:
                 import traceback
 
-                log.debug(
-                    f'Error serialising message: {"".join(traceback.format_exception(type(e), e, e.__traceback__))}.'
-                )
+                if log.isEnabledFor(DEBUG):
+                    log.debug(
+                        "Error serialising message: %s.",
+                        "".join(traceback.format_exception(type(e), e, e.__traceback__)),
+                    )
                 # There's an edge case when the packet's None... or some other deserialisation error.
                 # Instead of raising an exception, we just log it to debug, so it doesn't annoy end user's console logs.
                 _msg = None
 
+            if _trace:
+                tracer.emit("gateway", "decode", _start, size=len(msg))
+
             return _msg
 
+    @property
+    def queue_stats(self) -> Dict[str, Any]:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns the metrics of the send queue, i.e. ``{"pending": 2, "oldest": 0.5, "sent": 10, "coalesced": 1,
+        "batched": 0}``. ``oldest`` is how long the oldest pending packet has been waiting for, in seconds,
+        ``coalesced`` the amount of presence updates replaced by a newer one and ``batched`` the amount of guild
+        member requests merged into another one.
+
+        :rtype: Dict[str, Any]
+        """
+        return self._queue.stats
+
+    @property
+    def ratelimiter(self) -> WSRateLimit:
+        """
+        .. versionadded:: 4.5.0
+
+        The ratelimiter of the connection, to plan around its remaining budget.
+        Packets sent through the client already wait for it.
+
+        :rtype: WSRateLimit
+        """
+        return self._ratelimiter
+
     async def _send_packet(self, data: Dict[str, Any]) -> None:
         """
         Sends a packet to the Gateway.
 
+        .. versionchanged:: 4.5.0
+            Packets other than heartbeats, identifies and resumes are sent through a queue, by priority.
+            Presence updates are sent first, and replace the one still waiting to be sent.
+            Guild member requests are sent last, and the ones asking for users of the same guild by ID are merged.
+
         :param Dict[str, Any] data: The data to send to the Gateway.
         """
-        _data = dumps(data) if isinstance(data, dict) else data
-        packet: str = _data.decode("utf-8") if isinstance(_data, bytes) else _data
-        log.debug(packet)
+        if data["op"] in {
+            OpCodeType.HEARTBEAT.value,
+            OpCodeType.IDENTIFY.value,
+            OpCodeType.RESUME.value,
+        }:
+            # These skip the queue and use the budget reserved for them, as they cannot wait.
+            if not self._ratelimiter.try_acquire(reserved=True):
+                log.warning("The reserved gateway ratelimit budget is exhausted, sending anyway.")
 
         if data["op"] in {OpCodeType.IDENTIFY.value, OpCodeType.RESUME.value}:
             # This can't use the reconnect lock *because* its already referenced in
             # self._reconnect(), hence an infinite hang.
+            await self.__send(data)
+        elif data["op"] == OpCodeType.HEARTBEAT.value:
+            async with self.reconnect_lock:
+                await self.__send(data)
+        else:
+            await self._queue.put(data)
 
-            if self._client is not None:
-                self._last_send = perf_counter()
+    async def _send_queued(self, data: Dict[str, Any]) -> None:
+        """
+        Sends a packet of the send queue, once the ratelimit allows it.
 
-                await self._client.send_str(packet)
-        else:
-            async with self.reconnect_lock:  # needs to lock while it reconnects.
+        :param Dict[str, Any] data: The data to send to the Gateway.
+        """
+        async with self.reconnect_lock:  # needs to lock while it reconnects.
+            await self.__send(data)
 
-                if data["op"] != OpCodeType.HEARTBEAT.value:
-                    # This is because the ratelimiter limits already accounts for this.
-                    await self._ratelimiter.block()
+    async def __send(self, data: Dict[str, Any]) -> None:
+        """
+        Writes a packet to the WebSocket.
 
-                if self._client is not None:  # this mitigates against another edge case.
-                    self._last_send = perf_counter()
+        :param Dict[str, Any] data: The data to send to the Gateway.
+        """
+        _data = self._codec.dumps(data) if isinstance(data, dict) else data
+        # JSON packets are sent as text frames, so the encoded bytes are decoded for send_str
+        packet: str = _data.decode("utf-8") if isinstance(_data, bytes) else _data
+        if log.isEnabledFor(DEBUG):
+            log.debug("%s", packet)
+
+        if self._client is not None:  # this mitigates against another edge case.
+            self._last_send = perf_counter()
 
-                    await self._client.send_str(packet)
+            await self._client.send_str(packet)
 
     async def __identify(
         self, shard: Optional[List[Tuple[int]]] = None, presence: Optional[ClientPresence] = None
@@ -592,7 +699,8 @@ class WebSocketClient:
         if isinstance(presence, ClientPresence):
             payload["d"]["presence"] = presence._json
 
-        log.debug(f"IDENTIFYING: {payload}")
+        if log.isEnabledFor(DEBUG):
+            log.debug("IDENTIFYING: %s", payload)
         await self._send_packet(payload)
         log.debug("IDENTIFY")
 
@@ -602,7 +710,8 @@ class WebSocketClient:
             "op": OpCodeType.RESUME.value,
             "d": {"token": self._http.token, "seq": self.sequence, "session_id": self.session_id},
         }
-        log.debug(f"RESUMING: {payload}")
+        if log.isEnabledFor(DEBUG):
+            log.debug("RESUMING: %s", payload)
         await self._send_packet(payload)
         log.debug("RESUME")
 
@@ -628,15 +737,15 @@ class WebSocketClient:
 
         .. note::
             There is a ratelimit to using this method (5 per minute).
-            As there's no gateway ratelimiter yet, breaking this ratelimit
-            will force your bot to disconnect.
+            A presence update still waiting to be sent is replaced by a newer one,
+            but sending them too often will force your bot to disconnect.
 
         :param ClientPresence presence: The presence to change the bot to on identify.
         """
         _presence = presence._json
         payload: dict = {"op": OpCodeType.PRESENCE.value, "d": _presence}
         await self._send_packet(payload)
-        log.debug(f"UPDATE_PRESENCE: {_presence}")
+        log.debug("UPDATE_PRESENCE: %s", _presence)
         self.__presence = presence
 
     async def request_guild_members(
@@ -669,12 +778,19 @@ class WebSocketClient:
         payload: dict = {"op": OpCodeType.REQUEST_MEMBERS.value, "d": data}
 
         await self._send_packet(payload)
-        log.debug(f"REQUEST_MEMBERS: {payload}")
+        log.debug("REQUEST_MEMBERS: %s", payload)
 
-    async def close(self) -> None:
+    async def close(self, code: int = 1000) -> None:
         """
         Closes the current connection.
+
+        .. versionchanged:: 4.5.0
+            Added the ``code`` argument. Closing with ``1000`` or ``1001`` invalidates the session,
+            any other code keeps it resumable.
+
+        :param int code: The close code to send. Defaults to ``1000``.
         """
+        self._queue.close()
         if self._client:
-            await self._client.close()
+            await self._client.close(code=code)
         self.__closed.set()
@@ -34,11 +34,18 @@ class BaseProcessor:
     ) -> Tuple[Optional[T], T]:
         obj: DictSerializerMixin = model(**data)
         _id = obj.id if hasattr(obj, "id") and not id else id
-        cached_object: DictSerializerMixin = self._cache[model].get(_id)
+        storage = self._cache[model]
+        cached_object: DictSerializerMixin = storage.get(_id)
 
         if cached_object:
             before = model(**cached_object._json, _client=self._http)
             cached_object.update(data)
+
+            if storage.ttl(_id) is not None:
+                # fetched over HTTP by `get`, which fetches it again next time
+                storage.pop(_id)
+            else:
+                storage.write_back(cached_object, _id)
         else:
             before = None
             cached_object = obj
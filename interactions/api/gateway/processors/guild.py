@@ -17,7 +17,7 @@ class GuildProcessor(BaseProcessor):
         return self._update_event(Guild, data)
 
     def guild_delete(self, data: dict) -> tuple:
-        guild = self._delete_event(Guild, id=Snowflake(data["id"]))
+        guild = self._delete_event(Guild, data, id=Snowflake(data["id"]))
         return (guild,)
 
     def guild_ban_add(self, data: dict) -> tuple:
@@ -35,6 +35,7 @@ class GuildProcessor(BaseProcessor):
         for emoji in guild_emojis.emojis:
             guild._emoji_ids.add(emoji.id)
             self._cache[Emoji].merge(emoji)
+        self._cache._store_guild(guild)
 
         return (guild_emojis,)
 
@@ -46,6 +47,7 @@ class GuildProcessor(BaseProcessor):
         for sticker in guild_stickers.stickers:
             guild._sticker_ids.add(sticker.id)
             self._cache[Sticker].merge(sticker)
+        self._cache._store_guild(guild)
 
         return (guild_stickers,)
 
@@ -90,4 +92,4 @@ class GuildProcessor(BaseProcessor):
         return self._update_event(Role, data["role"])
 
     def guild_role_delete(self, data: dict) -> tuple:
-        return (self._delete_event(Role, id=data["role_id"]),)
+        return (self._delete_event(Role, data, id=Snowflake(data["role_id"])),)
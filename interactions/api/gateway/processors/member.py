@@ -20,6 +20,7 @@ class MemberProcessor(BaseProcessor):
 
         if guild := self._cache.get_guild(guild_id):
             guild._member_ids.add(after.id)
+            self._cache._store_guild(guild)
 
         return before, after
 
@@ -43,6 +44,10 @@ class MemberProcessor(BaseProcessor):
             cache.add(
                 member, id=(guild_members.guild_id, member.id)
             )  # With `merge` method it will take a long time
-            guild._member_ids.add(member.id)
+            if guild is not None:
+                guild._member_ids.add(member.id)
+
+        if guild is not None:
+            self._cache._store_guild(guild)
 
         return (guild_members,)
@@ -0,0 +1,232 @@
+from asyncio import CancelledError, Future, Task, create_task
+from heapq import heappop, heappush
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..tracing import tracer
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
+    from .ratelimit import WSRateLimit
+
+__all__ = ("_SendQueue",)
+
+# Gateway opcodes, see OpCodeType. Lower priorities are sent first, the default one is 1.
+_PRESENCE: int = 3
+_VOICE_STATE: int = 4
+_REQUEST_MEMBERS: int = 8
+_PRIORITIES: Dict[int, int] = {_PRESENCE: 0, _VOICE_STATE: 0, _REQUEST_MEMBERS: 2}
+
+# The maximum amount of users a single REQUEST_MEMBERS packet may ask for.
+_MAX_USER_IDS: int = 100
+
+
+class _Packet:
+    """An internal class representing a packet waiting in the send queue."""
+
+    __slots__ = ("op", "data", "futures", "queued_at")
+
+    def __init__(self, op: int, data: Any, future: Future) -> None:
+        self.op: int = op
+        self.data: Any = data
+        self.futures: List[Future] = [future]
+        self.queued_at: float = perf_counter()
+
+    @property
+    def cancelled(self) -> bool:
+        return all(future.cancelled() for future in self.futures)
+
+    def batch_key(self) -> Optional[Tuple]:
+        """
+        Returns the key of the ``REQUEST_MEMBERS`` packets the packet can be merged with, if any.
+        Only packets asking for users by ID, without a nonce, can be merged, as their chunks cannot be told apart.
+        """
+        data: dict = self.data["d"] if self.op == _REQUEST_MEMBERS else {}
+        if "nonce" in data or "user_ids" not in data:
+            return None
+        return data["guild_id"], data.get("query"), data.get("presences")
+
+
+def _set_closed(packet: _Packet) -> None:
+    """Fails the callers waiting for a packet, as the connection was closed before it was sent."""
+    for future in packet.futures:
+        if not future.done():
+            future.set_exception(ConnectionError("The gateway connection was closed."))
+
+
+class _SendQueue:
+    """
+    An internal class representing the outbound packets of a WebSocket connection.
+
+    Packets are sent one at a time by priority, and in order of arrival within the same priority: presence and
+    voice state updates first, then every other packet, then guild member requests.
+    A presence update replaces the one still waiting to be sent, if any, and guild member requests asking for users
+    of the same guild by ID are merged into one packet of up to 100 users.
+    Heartbeats, identifies and resumes do not go through the queue, so they cannot be delayed by it.
+
+    :ivar int sent: The amount of packets sent.
+    :ivar int coalesced: The amount of presence updates replaced by a newer one before being sent.
+    :ivar int batched: The amount of guild member requests merged into another one.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_ratelimiter",
+        "_send",
+        "_heap",
+        "_counter",
+        "_presence",
+        "_batches",
+        "_task",
+        "sent",
+        "coalesced",
+        "batched",
+    )
+
+    def __init__(
+        self,
+        loop: "AbstractEventLoop",
+        ratelimiter: "WSRateLimit",
+        send: Callable[[Any], Awaitable[None]],
+    ) -> None:
+        """
+        :param AbstractEventLoop loop: The event loop of the connection.
+        :param WSRateLimit ratelimiter: The ratelimiter every packet of the queue waits for.
+        :param Callable[[Any], Awaitable[None]] send: The coroutine function sending a packet.
+        """
+        self._loop = loop
+        self._ratelimiter = ratelimiter
+        self._send = send
+        self._heap: List[Tuple[int, int, _Packet]] = []  # heap of (priority, arrival, packet)
+        self._counter = count()
+        self._presence: Optional[_Packet] = None
+        self._batches: Dict[Tuple, _Packet] = {}  # batch key: packet with room left
+        self._task: Optional[Task] = None
+        self.sent: int = 0
+        self.coalesced: int = 0
+        self.batched: int = 0
+
+    def __len__(self) -> int:
+        return sum(not packet.cancelled for _, _, packet in self._heap)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the metrics of the queue, i.e. ``{"pending": 2, "oldest": 0.5, "sent": 10, ...}``.
+        ``oldest`` is how long the oldest pending packet has been waiting for, in seconds.
+
+        :rtype: Dict[str, Any]
+        """
+        pending = [packet for _, _, packet in self._heap if not packet.cancelled]
+        return {
+            "pending": len(pending),
+            "oldest": (
+                perf_counter() - min(packet.queued_at for packet in pending) if pending else 0.0
+            ),
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "batched": self.batched,
+        }
+
+    def put(self, data: dict) -> Future:
+        """
+        Queues a packet.
+
+        :param dict data: The packet to send.
+        :return: A future resolved once the packet is sent.
+        :rtype: Future
+        """
+        future: Future = self._loop.create_future()
+        op: int = data["op"]
+
+        if op == _PRESENCE and self._presence is not None and not self._presence.cancelled:
+            self._presence.data = data  # only the latest presence matters
+            self._presence.futures.append(future)
+            self.coalesced += 1
+            return future
+
+        packet = _Packet(op, data, future)
+        if (key := packet.batch_key()) is not None and self._merge(key, packet):
+            return future
+
+        if op == _PRESENCE:
+            self._presence = packet
+
+        heappush(self._heap, (_PRIORITIES.get(op, 1), next(self._counter), packet))
+        if self._task is None or self._task.done():
+            self._task = create_task(self._run())
+
+        return future
+
+    def _merge(self, key: Tuple, packet: _Packet) -> bool:
+        """Merges a guild member request into a queued one of the same guild, if it has room left."""
+        user_ids = packet.data["d"]["user_ids"]
+        user_ids = user_ids if isinstance(user_ids, list) else [user_ids]
+        batch = self._batches.get(key)
+
+        if batch is not None and not batch.cancelled:
+            _user_ids: list = batch.data["d"]["user_ids"]
+            if len(_user_ids) + len(user_ids) <= _MAX_USER_IDS:
+                _user_ids.extend(user_id for user_id in user_ids if user_id not in _user_ids)
+                batch.data["d"]["limit"] = 0
+                batch.futures.extend(packet.futures)
+                self.batched += 1
+                return True
+
+        if len(user_ids) < _MAX_USER_IDS:
+            packet.data = {**packet.data, "d": {**packet.data["d"], "user_ids": list(user_ids)}}
+            self._batches[key] = packet
+        return False
+
+    def _pop(self) -> Optional[_Packet]:
+        """Pops the next packet to send, if any."""
+        while self._heap:
+            packet = heappop(self._heap)[2]
+            if packet is self._presence:
+                self._presence = None
+            if (key := packet.batch_key()) is not None and self._batches.get(key) is packet:
+                del self._batches[key]
+            if not packet.cancelled:
+                return packet
+
+    async def _run(self) -> None:
+        """Sends the queued packets until the queue is empty."""
+        while self._heap:
+            # The packet is chosen once the ratelimit allows to send it, so the ones queued meanwhile can
+            # still be sent before it, or be merged into it.
+            sent_at: float = await self._ratelimiter.acquire()
+            if (packet := self._pop()) is None:
+                self._ratelimiter.release(sent_at)  # every packet left was cancelled meanwhile
+                return
+
+            try:
+                await self._send(packet.data)
+            except CancelledError:
+                _set_closed(packet)
+                raise
+            except Exception as exc:
+                for future in packet.futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            self.sent += 1
+            if tracer.sampled("gateway"):
+                tracer.emit("gateway", "send_wait", packet.queued_at, op=packet.op)
+            for future in packet.futures:
+                if not future.done():
+                    future.set_result(None)
+
+    def close(self) -> None:
+        """Stops sending packets, failing the ones still queued with a :class:`ConnectionError`."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for _, _, packet in self._heap:
+            _set_closed(packet)
+        self._heap.clear()
+        self._batches.clear()
+        self._presence = None
@@ -1,8 +1,8 @@
 import asyncio
 import logging
-from sys import version_info
-from time import time
-from typing import Optional
+from collections import deque
+from time import monotonic
+from typing import Any, Deque, Dict, Optional
 
 log = logging.getLogger("gateway.ratelimit")
 
@@ -11,27 +11,72 @@ __all__ = ("WSRateLimit",)
 
 class WSRateLimit:
     """
-    A class that controls Gateway ratelimits using locking and a timer.
+    A class that controls Gateway ratelimits using a sliding window.
+
+    .. versionchanged:: 4.5.0
+        The window slides on a monotonic clock instead of being reset every ``per_second`` seconds, and
+        waiting for it does not lock the ratelimiter. Part of the budget is reserved for heartbeats, identifies and
+        resumes, see :meth:`try_acquire`. The ``lock`` and ``current_limit`` attributes were removed.
 
     .. note ::
-        While the docs state that the Gateway ratelimits are 120/60 (120 requests per 60 seconds),
-        this ratelimit offsets to 115 instead of 120 for room.
-
-    :ivar Lock lock: The gateway Lock object.
-    :ivar int max: The upper limit of the ratelimit in seconds. Defaults to `115`.
-    :ivar int remaining: How many requests are left per ``per_second``. This is automatically decremented and reset.
-    :ivar float current_limit: When this cooldown session began. This is defined automatically.
-    :ivar float per_second: A constant denoting how many requests can be done per unit of seconds. (i.e., per 60 seconds, per 45, etc.)
+        The Gateway ratelimits are 120/60 (120 requests per 60 seconds) per connection, so each shard has its
+        own ratelimiter. 5 of them are reserved by default, leaving 115 for the other packets.
+
+    :ivar int max: The amount of packets which can be sent per ``per_second``. Defaults to ``120``.
+    :ivar float per_second: The length of the window in seconds. Defaults to ``60``.
+    :ivar int reserved: The amount of packets of the window only reserved acquisitions can use. Defaults to ``5``.
     """
 
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        self.lock = asyncio.Lock(loop=loop) if version_info < (3, 10) else asyncio.Lock()
-        # To conserve timings, we need to do 115/60
-        # Also, credit to d.py for their ratelimiter inspiration
+    __slots__ = ("max", "per_second", "reserved", "_sent", "_limited", "_waited")
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        *,
+        max: int = 120,
+        per_second: float = 60.0,
+        reserved: int = 5,
+    ) -> None:
+        """
+        :param Optional[AbstractEventLoop] loop: Unused, kept for compatibility.
+        :param int max: The amount of packets which can be sent per ``per_second``. Defaults to ``120``.
+        :param float per_second: The length of the window in seconds. Defaults to ``60``.
+        :param int reserved: The amount of packets of the window only reserved acquisitions can use. Defaults to ``5``.
+        """
+        self.max = max
+        self.per_second = per_second
+        self.reserved = reserved
+        self._sent: Deque[float] = deque()  # monotonic times of the packets of the window
+        self._limited: int = 0
+        self._waited: float = 0.0
+
+    def _capacity(self, reserved: bool) -> int:
+        return self.max if reserved else self.max - self.reserved
+
+    def _prune(self, now: float) -> None:
+        while self._sent and self._sent[0] <= now - self.per_second:
+            self._sent.popleft()
+
+    def remaining_for(self, reserved: bool = False) -> int:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns how many packets can be sent right now.
+
+        :param bool reserved: Whether to count the reserved budget as well. Defaults to ``False``.
+        :rtype: int
+        """
+        self._prune(monotonic())
+        return max(self._capacity(reserved) - len(self._sent), 0)
+
+    @property
+    def remaining(self) -> int:
+        """
+        How many packets can be sent right now, without the reserved budget.
 
-        self.max = self.remaining = 115
-        self.per_second = 60.0
-        self.current_limit = 0.0
+        :rtype: int
+        """
+        return self.remaining_for()
 
     @property
     def ratelimited(self) -> bool:
@@ -41,41 +86,135 @@ class WSRateLimit:
         :return: Whether it's rate-limited or not.
         :rtype: bool
         """
-        current = time()
-        if current > self.current_limit + self.per_second:
-            return False
         return self.remaining == 0
 
+    def predict(self, amount: int = 1, reserved: bool = False) -> float:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns how long it will take before an amount of packets can be sent, if nothing else is sent meanwhile.
+
+        :param int amount: The amount of packets. Defaults to ``1``.
+        :param bool reserved: Whether the packets can use the reserved budget. Defaults to ``False``.
+        :return: How long to wait in seconds, if any.
+        :rtype: float
+        """
+        capacity: int = self._capacity(reserved)
+        if amount > capacity:
+            raise ValueError(
+                f"Cannot send more than {capacity} packets per {self.per_second} seconds."
+            )
+
+        now = monotonic()
+        self._prune(now)
+        excess: int = len(self._sent) + amount - capacity
+        if excess <= 0:
+            return 0.0
+        return max(self._sent[excess - 1] + self.per_second - now, 0.0)
+
     @property
     def delay(self) -> float:
         """
         An attribute that reflects how long we need to wait for ratelimit to pass, if any.
 
+        .. versionchanged:: 4.5.0
+            Reading it does not count as sending a packet anymore.
+
         :return: How long to wait in seconds, if any. Defaults to ``0.0``.
         :rtype: float
         """
-        current = time()
+        return self.predict()
 
-        if current > self.current_limit + self.per_second:
-            self.remaining = self.max
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns the metrics of the ratelimiter, i.e. ``{"remaining": 115, "reserved_remaining": 5, "delay": 0.0,
+        "limited": 0, "waited": 0.0}``. ``limited`` is how many times a packet had to wait, ``waited`` for how long
+        in total, in seconds.
+
+        :rtype: Dict[str, Any]
+        """
+        remaining: int = self.remaining
+        return {
+            "remaining": remaining,
+            "reserved_remaining": self.remaining_for(True) - remaining,
+            "delay": self.delay,
+            "limited": self._limited,
+            "waited": self._waited,
+        }
+
+    def try_acquire(self, amount: int = 1, reserved: bool = False) -> bool:
+        """
+        .. versionadded:: 4.5.0
 
-        if self.remaining == self.max:
-            self.current_limit = current
+        Counts an amount of packets as sent if the ratelimit allows it, without waiting.
 
-        if self.remaining == 0:
-            return self.per_second - (current - self.current_limit)
+        :param int amount: The amount of packets. Defaults to ``1``.
+        :param bool reserved: Whether the packets can use the reserved budget, for heartbeats, identifies and resumes. Defaults to ``False``.
+        :return: Whether the packets can be sent.
+        :rtype: bool
+        """
+        if self.predict(amount, reserved):
+            return False
 
-        self.remaining -= 1
-        if self.remaining == 0:
-            self.current_limit = current
+        self._count(amount)
+        return True
+
+    def _count(self, amount: int) -> float:
+        """Counts an amount of packets as sent now, and returns when."""
+        now = monotonic()
+        self._sent.extend(now for _ in range(amount))
+        return now
+
+    async def acquire(self, amount: int = 1, reserved: bool = False) -> float:
+        """
+        .. versionadded:: 4.5.0
 
-        return 0.0
+        Waits until an amount of packets can be sent, and counts them as sent.
+
+        :param int amount: The amount of packets. Defaults to ``1``.
+        :param bool reserved: Whether the packets can use the reserved budget. Defaults to ``False``.
+        :return: When the packets were counted as sent, to give them back with :meth:`release`.
+        :rtype: float
+        """
+        if delay := self.predict(amount, reserved):
+            self._limited += 1
+            start = monotonic()
+            log.warning("We are rate-limited. Please wait %s seconds...", round(delay, 2))
+            # something else may have been sent meanwhile, so the delay is predicted again
+            while delay := self.predict(amount, reserved):
+                await asyncio.sleep(delay)
+            self._waited += monotonic() - start
+
+        return self._count(amount)
+
+    def release(self, sent_at: float, amount: int = 1) -> None:
+        """
+        .. versionadded:: 4.5.0
+
+        Gives back packets counted as sent by :meth:`acquire`, when they were not sent after all.
+
+        :param float sent_at: When the packets were counted as sent, as returned by :meth:`acquire`.
+        :param int amount: The amount of packets. Defaults to ``1``.
+        """
+        for _ in range(amount):
+            try:
+                self._sent.remove(sent_at)
+            except ValueError:  # they left the window already
+                return
 
     async def block(self) -> None:
         """
-        A function that uses the internal Lock to check for rate-limits and cooldown whenever necessary.
+        A function that waits for the ratelimit to allow sending a packet, whenever necessary.
+        """
+        await self.acquire()
+
+    def reset(self) -> None:
+        """
+        .. versionadded:: 4.5.0
+
+        Empties the window, as a new connection has its own ratelimit.
         """
-        async with self.lock:
-            if delta := self.delay:
-                log.warning(f"We are rate-limited. Please wait {round(delta, 2)} seconds...")
-                await asyncio.sleep(delta)
+        self._sent.clear()
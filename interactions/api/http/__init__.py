@@ -12,6 +12,7 @@ from .interaction import *  # noqa: F401 F403
 from .limiter import *  # noqa: F401 F403
 from .member import *  # noqa: F401 F403
 from .message import *  # noqa: F401 F403
+from .options import *  # noqa: F401 F403
 from .reaction import *  # noqa: F401 F403
 from .request import *  # noqa: F401 F403
 from .route import *  # noqa: F401 F403
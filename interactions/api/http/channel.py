@@ -68,13 +68,13 @@ class ChannelRequest:
 
         if before:
             params["before"] = before
-        if after:
+        if after is not None:
             params["after"] = after
         if around:
             params["around"] = around
 
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/messages"), params=params
+            Route("GET", "/channels/{channel_id}/messages", channel_id=channel_id), params=params
         )
 
     async def create_channel(
@@ -7,6 +7,7 @@ from .interaction import InteractionRequest
 from .invite import InviteRequest
 from .member import MemberRequest
 from .message import MessageRequest
+from .options import HTTPOptions
 from .reaction import ReactionRequest
 from .request import _Request
 from .route import Route
@@ -18,6 +19,7 @@ from .webhook import WebhookRequest
 
 if TYPE_CHECKING:
     from ...api.cache import Cache
+    from ..codec import JSONCodec
 
 __all__ = ("HTTPClient",)
 
@@ -55,9 +57,15 @@ class HTTPClient(
     _req: _Request
     cache: "Cache"
 
-    def __init__(self, token: str, cache: "Cache"):  # noqa skip the no super imports
+    def __init__(
+        self,
+        token: str,
+        cache: "Cache",
+        codec: Optional["JSONCodec"] = None,
+        options: Optional[HTTPOptions] = None,
+    ):  # noqa skip the no super imports
         self.token = token
-        self._req = _Request(self.token)
+        self._req = _Request(self.token, codec, options)
         self.cache = cache
         self.cache._http = self  # dumb thing ik
 
@@ -4,6 +4,7 @@ from aiohttp import MultipartWriter
 
 from ..models import Snowflake
 from ..models.message import File
+from .limiter import RequestPriority
 from .request import _Request
 from .route import Route
 
@@ -254,6 +255,7 @@ class InteractionRequest:
             Route("POST", f"/interactions/{application_id}/{token}/callback"),
             json=data,
             data=file_data,
+            priority=RequestPriority.INTERACTIVE,
         )
 
     # This is still Interactions, but this also applies to webhooks
@@ -271,7 +273,8 @@ class InteractionRequest:
         """
         # ^ again, I don't know if python will let me
         return await self._req.request(
-            Route("GET", f"/webhooks/{application_id}/{token}/messages/{message_id}")
+            Route("GET", f"/webhooks/{application_id}/{token}/messages/{message_id}"),
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def edit_interaction_response(
@@ -313,6 +316,7 @@ class InteractionRequest:
             Route("PATCH", f"/webhooks/{application_id}/{token}/messages/{message_id}"),
             json=data,
             data=file_data,
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def delete_interaction_response(
@@ -330,7 +334,8 @@ class InteractionRequest:
         # because interactions are webhooks
 
         return await self._req.request(
-            Route("DELETE", f"/webhooks/{int(application_id)}/{token}/messages/{message_id}")
+            Route("DELETE", f"/webhooks/{int(application_id)}/{token}/messages/{message_id}"),
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def _post_followup(
@@ -368,4 +373,5 @@ class InteractionRequest:
             Route("POST", f"/webhooks/{application_id}/{token}"),
             json=data,
             data=file_data,
+            priority=RequestPriority.INTERACTIVE,
         )
@@ -1,28 +1,177 @@
-from asyncio import Lock
-from typing import Optional
+from asyncio import CancelledError, Future, Lock, get_running_loop
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from heapq import heappop, heappush
+from itertools import count
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
 
+from ...client.enums import IntEnum
 from ...utils.missing import MISSING
 
-__all__ = ("Limiter",)
+__all__ = ("Limiter", "PriorityLock", "PrioritySemaphore", "RequestPriority", "request_priority")
+
+
+class RequestPriority(IntEnum):
+    """
+    .. versionadded:: 4.5.0
+
+    An enumerable object representing the priority of an HTTP request. Lower values are sent first.
+
+    :ivar int INTERACTIVE: Requests answering an interaction, which have a deadline.
+    :ivar int NORMAL: Any other request. This is the default.
+    :ivar int BACKGROUND: Requests of bulk jobs, which wait while interactive requests are pending.
+    """
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority", default=RequestPriority.NORMAL
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    .. versionadded:: 4.5.0
+
+    Sets the priority of the HTTP requests made in a block of code, including the tasks it creates.
+
+    .. code-block:: python
+
+        with interactions.request_priority(interactions.RequestPriority.BACKGROUND):
+            for member in members:
+                await member.add_role(role)
+
+    :param RequestPriority priority: The priority of the requests.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class PrioritySemaphore:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing an :class:`asyncio.Semaphore` whose waiters acquire it by priority, and in order of
+    arrival within the same priority. A released slot is handed to the next waiter, so it cannot be taken over
+    by a request arriving at the same time.
+
+    :ivar int value: The amount of slots.
+    """
+
+    __slots__ = ("value", "_free", "_waiters", "_counter")
+
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+        self._free: int = value
+        self._waiters: List[Tuple[int, int, Future]] = []  # heap of (priority, arrival, future)
+        self._counter: Iterator[int] = count()
+
+    def locked(self) -> bool:
+        return self._free == 0
+
+    async def acquire(self, priority: Union[RequestPriority, int] = RequestPriority.NORMAL) -> bool:
+        """
+        Acquires a slot.
+
+        :param RequestPriority priority: The priority to wait with.
+        :rtype: bool
+        """
+        if self._free:
+            self._free -= 1
+            return True
+
+        future = get_running_loop().create_future()
+        heappush(self._waiters, (int(priority), next(self._counter), future))
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # the slot was handed over right before the cancellation
+            raise
+        return True
+
+    def release(self) -> None:
+        """Releases a slot, handing it to the waiter with the highest priority if any."""
+        if self._free == self.value:
+            raise RuntimeError("Semaphore is not acquired.")
+
+        while self._waiters:
+            future = heappop(self._waiters)[2]
+            if not future.done():
+                future.set_result(True)  # the slot stays taken for the new owner
+                return
+
+        self._free += 1
+
+    @asynccontextmanager
+    async def hold(
+        self, priority: Union[RequestPriority, int] = RequestPriority.NORMAL
+    ) -> AsyncIterator[None]:
+        """
+        Holds a slot for the duration of an ``async with`` block.
+
+        :param RequestPriority priority: The priority to wait with.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def waiting(self, priority: Optional[Union[RequestPriority, int]] = None) -> int:
+        """
+        Returns the amount of waiters.
+
+        :param Optional[RequestPriority] priority: The priority of the waiters to count. Defaults to all of them.
+        :rtype: int
+        """
+        return sum(
+            not future.done() and (priority is None or level == priority)
+            for level, _, future in self._waiters
+        )
+
+
+class PriorityLock(PrioritySemaphore):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing an :class:`asyncio.Lock` whose waiters acquire it by priority, and in order of arrival
+    within the same priority. The lock is handed to the next waiter on release, so it cannot be taken over by a
+    request arriving at the same time.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(1)
 
 
 class Limiter:
     """
     A class representing a limitation for an HTTP request.
 
-    :ivar Lock lock: The "lock" or controller of the request.
+    :ivar Union[Lock, PriorityLock] lock: The "lock" or controller of the request.
     :ivar float reset_after: The remaining time before the request can be ran.
     """
 
     __slots__ = ("lock", "reset_after")
 
-    lock: Lock
+    lock: Union[Lock, PriorityLock]
     reset_after: float
 
-    def __init__(self, *, lock: Lock, reset_after: Optional[float] = MISSING) -> None:
+    def __init__(
+        self, *, lock: Union[Lock, PriorityLock], reset_after: Optional[float] = MISSING
+    ) -> None:
         """
         :param lock: The asynchronous lock to control limits for.
-        :type lock: Lock
+        :type lock: Union[Lock, PriorityLock]
         :param reset_after: The remaining time to run the limited lock on. Defaults to ``0``.
         :type reset_after: Optional[float]
         """
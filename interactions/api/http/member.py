@@ -50,7 +50,9 @@ class MemberRequest:
         if after:
             payload["after"] = after
 
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/members"), params=payload)
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/members", guild_id=guild_id), params=payload
+        )
 
     async def search_guild_members(self, guild_id: int, query: str, limit: int = 1) -> List[dict]:
         """
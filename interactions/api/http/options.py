@@ -0,0 +1,77 @@
+from typing import Optional, Tuple
+
+from aiohttp import ClientTimeout, TCPConnector
+
+__all__ = ("HTTPOptions",)
+
+
+class HTTPOptions:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing how the HTTP client pools its connections and times out its requests.
+
+    .. code-block:: python
+
+        client = interactions.Client(http_options=interactions.HTTPOptions(limit=200, timeout=30))
+
+    :ivar int limit: The maximum amount of simultaneous connections, ``0`` for no limit. Defaults to ``100``.
+    :ivar int limit_per_host: The maximum amount of simultaneous connections to the same host, ``0`` for no limit. Defaults to ``0``.
+    :ivar Optional[float] keepalive_timeout: How long idle connections are kept open for reuse, in seconds. ``None`` closes them after every request. Defaults to ``15``.
+    :ivar Optional[int] dns_ttl: How long resolved addresses are cached, in seconds. ``None`` caches them forever. Defaults to ``10``.
+    :ivar Optional[float] timeout: The default total timeout of a request, including waiting for a free connection, in seconds. ``None`` disables it. Defaults to ``300``.
+    :ivar Optional[float] connect_timeout: The default timeout for acquiring a connection, including waiting for a free one, in seconds. Defaults to ``None``.
+    :ivar bool coalesce: Whether identical ``GET`` requests sent while one is in flight share its response instead of being sent again. Defaults to ``True``.
+    :ivar bool shared: Whether the clients of the same event loop using equal options share one session, and thus one connection pool. Defaults to ``False``.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "dns_ttl",
+        "timeout",
+        "connect_timeout",
+        "coalesce",
+        "shared",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: Optional[float] = 15.0,
+        dns_ttl: Optional[int] = 10,
+        timeout: Optional[float] = 300.0,
+        connect_timeout: Optional[float] = None,
+        coalesce: bool = True,
+        shared: bool = False,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.coalesce = coalesce
+        self.shared = shared
+
+    def __repr__(self) -> str:
+        return f"<HTTPOptions {' '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)}>"
+
+    def _key(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def _connector(self) -> TCPConnector:
+        """Creates the connector of a session. This must be called inside of the event loop."""
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            force_close=self.keepalive_timeout is None,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_ttl,
+        )
+
+    def _timeout(self) -> ClientTimeout:
+        return ClientTimeout(total=self.timeout, connect=self.connect_timeout)
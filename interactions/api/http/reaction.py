@@ -129,21 +129,17 @@ class ReactionRequest:
         :return: A list of users who sent that emoji.
         """
 
-        params_set = {
-            f"after={after}" if after else None,
-            f"limit={limit}",
-        }
-        final = "&".join([item for item in params_set if item is not None])
+        params = {"limit": limit}
+        if after:
+            params["after"] = after
 
         return await self._req.request(
             Route(
                 "GET",
-                (
-                    "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
-                    + f"{f'?{final}' if final is not None else ''}"
-                ),
+                "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}",
                 channel_id=channel_id,
                 message_id=message_id,
                 emoji=emoji,
-            )
+            ),
+            params=params,
         )
@@ -1,24 +1,57 @@
 import asyncio
 import traceback
-from asyncio import AbstractEventLoop, Lock, get_event_loop, get_running_loop, new_event_loop
-from contextlib import suppress
+from asyncio import (
+    AbstractEventLoop,
+    Event,
+    Task,
+    get_event_loop,
+    get_running_loop,
+    new_event_loop,
+    shield,
+)
+from contextlib import asynccontextmanager, suppress
 from json import dumps
-from logging import Logger
+from logging import DEBUG, Logger
 from sys import version_info
-from typing import Any, Dict, Optional
+from time import perf_counter
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from urllib.parse import quote
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout
 from aiohttp import __version__ as http_version
 
 from ...api.error import LibraryException
 from ...base import __version__, get_logger
-from .limiter import Limiter
+from ..codec import JSONCodec, default_codec
+from ..tracing import tracer
+from .limiter import Limiter, PriorityLock, PrioritySemaphore, RequestPriority, _priority
+from .options import HTTPOptions
 from .route import Route
 
 __all__ = ("_Request",)
 log: Logger = get_logger("http")
 
+# (loop, options): (session, amount of _Request using it)
+_shared_sessions: Dict[Tuple[AbstractEventLoop, Tuple], Tuple[ClientSession, int]] = {}
+
+
+def _retrieve_exception(task: Task) -> None:
+    """Marks the exception of a coalesced request as retrieved, in case all its callers were cancelled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class _Coalesced:
+    """An internal class representing a coalesced ``GET`` request being sent, and the callers sharing it."""
+
+    __slots__ = ("task", "followers", "body")
+
+    def __init__(self, task: Task) -> None:
+        self.task: Task = task
+        self.followers: int = 0  # the callers sharing the response of the first one
+        # the response, encoded for the followers before any caller resumes
+        self.body: Optional[bytes] = None
+
 
 class _Request:
     """
@@ -31,6 +64,16 @@ class _Request:
     :ivar dict _headers: The current headers for an HTTP request.
     :ivar ClientSession _session: The current session for making requests.
     :ivar Limiter _global_lock: The global rate limiter.
+    :ivar JSONCodec codec: The codec encoding the JSON bodies of requests and decoding the ones of responses.
+    :ivar HTTPOptions options: The connection pool and timeout options of the session.
+    :ivar bool _released: Whether the session was released by :meth:`close`.
+    :ivar Dict[Tuple, _Coalesced] _in_flight: The coalesced ``GET`` requests currently being sent, by path and parameters.
+    :ivar int _coalesce_requests: The amount of ``GET`` requests eligible for coalescing.
+    :ivar int _coalesce_hits: The amount of ``GET`` requests which shared the response of an identical one.
+    :ivar Dict[RequestPriority, int] _pending: The amount of requests being sent or waiting to be, per priority.
+    :ivar int _yielding: The amount of background requests waiting for the interactive ones to be done.
+    :ivar Event _interactive_idle: Set while no interactive request is pending.
+    :ivar Optional[PrioritySemaphore] _slots: The connections of the pool, handed out by priority. ``None`` if the pool has no limit.
     """
 
     __slots__ = (
@@ -41,6 +84,16 @@ class _Request:
         "_headers",
         "_session",
         "_global_lock",
+        "codec",
+        "options",
+        "_released",
+        "_in_flight",
+        "_coalesce_requests",
+        "_coalesce_hits",
+        "_pending",
+        "_yielding",
+        "_interactive_idle",
+        "_slots",
     )
     token: str
     _loop: AbstractEventLoop
@@ -48,13 +101,26 @@ class _Request:
     buckets: Dict[str, str]  # endpoint: shared_bucket
     _headers: dict
     _global_lock: Limiter
-
-    def __init__(self, token: str) -> None:
+    codec: JSONCodec
+    options: HTTPOptions
+
+    def __init__(
+        self,
+        token: str,
+        codec: Optional[JSONCodec] = None,
+        options: Optional[HTTPOptions] = None,
+    ) -> None:
         """
         :param token: The application token used for authorizing.
         :type token: str
+        :param codec?: The JSON codec to use. Defaults to orjson if installed, or the standard library otherwise.
+        :type codec?: Optional[JSONCodec]
+        :param options?: The connection pool and timeout options to use. Defaults to the default :class:`HTTPOptions`.
+        :type options?: Optional[HTTPOptions]
         """
         self.token = token
+        self.codec = codec or default_codec
+        self.options = options or HTTPOptions()
         try:
             self._loop = get_event_loop() if version_info < (3, 10) else get_running_loop()
         except RuntimeError:
@@ -67,29 +133,251 @@ class _Request:
             f"Python/{version_info[0]}.{version_info[1]} "
             f"aiohttp/{http_version}",
         }
-        self._session = ClientSession()
-        self._global_lock = (
-            Limiter(lock=Lock(loop=self._loop)) if version_info < (3, 10) else Limiter(lock=Lock())
+        self._session = self._acquire_session()
+        self._released = False
+        self._global_lock = Limiter(lock=PriorityLock())
+        self._in_flight: Dict[Tuple, _Coalesced] = {}
+        self._coalesce_requests: int = 0
+        self._coalesce_hits: int = 0
+        self._pending: Dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self._yielding: int = 0
+        self._interactive_idle: Event = (
+            Event(loop=self._loop) if version_info < (3, 10) else Event()
+        )
+        self._interactive_idle.set()
+        self._slots: Optional[PrioritySemaphore] = (
+            PrioritySemaphore(self.options.limit) if self.options.limit else None
         )
 
+    def _acquire_session(self) -> ClientSession:
+        """Opens a session configured by the options, or joins the shared one."""
+        if not self.options.shared:
+            return ClientSession(
+                connector=self.options._connector(), timeout=self.options._timeout()
+            )
+
+        key = (self._loop, self.options._key())
+        session, users = _shared_sessions.get(key, (None, 0))
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=self.options._connector(), timeout=self.options._timeout()
+            )
+        _shared_sessions[key] = (session, users + 1)
+        return session
+
+    def _release_session(self) -> bool:
+        """
+        Stops using the session.
+
+        :return: Whether the session is not used anymore and should be closed.
+        :rtype: bool
+        """
+        if not self.options.shared:
+            return True
+
+        key = (self._loop, self.options._key())
+        session, users = _shared_sessions.get(key, (None, 1))
+        if users > 1:
+            _shared_sessions[key] = (session, users - 1)
+            return False
+        _shared_sessions.pop(key, None)
+        return True
+
     def _check_session(self) -> None:
         """Ensures that we have a valid connection session."""
         if self._session.closed:
-            self._session = ClientSession()
+            log.warning("The HTTP session was closed, opening a new one.")
+            if not self._released:
+                self._release_session()
+            self._session = self._acquire_session()
+            self._released = False
+
+    @property
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns the state of the connection pool, i.e. ``{"limit": 100, "limit_per_host": 0, "in_use": 3, "idle": 5, "waiting": 0, "shared": False, "closed": False}``.
+        ``waiting`` is the amount of requests queued for a free connection.
+
+        :rtype: Dict[str, Any]
+        """
+        connector = self._session.connector
+        return {
+            "limit": self.options.limit,
+            "limit_per_host": self.options.limit_per_host,
+            "in_use": len(getattr(connector, "_acquired", ())),
+            "idle": sum(len(conns) for conns in getattr(connector, "_conns", {}).values()),
+            "waiting": sum(len(waiters) for waiters in getattr(connector, "_waiters", {}).values()),
+            "shared": self.options.shared,
+            "closed": self._session.closed,
+        }
+
+    @property
+    def coalesce_stats(self) -> Dict[str, Any]:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns how many ``GET`` requests shared the response of an identical one in flight, i.e.
+        ``{"requests": 120, "coalesced": 30, "hit_rate": 0.25, "in_flight": 2}``.
+
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "requests": self._coalesce_requests,
+            "coalesced": self._coalesce_hits,
+            "hit_rate": self._coalesce_hits / self._coalesce_requests
+            if self._coalesce_requests
+            else 0.0,
+            "in_flight": len(self._in_flight),
+        }
+
+    @property
+    def queue_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        .. versionadded:: 4.5.0
+
+        Returns the amount of requests per priority, i.e. ``{"interactive": {"pending": 1, "waiting": 0}, ...}``.
+        ``pending`` counts the requests not answered yet, ``waiting`` the ones queued behind a rate limit lock, a
+        connection of the pool or, for background requests, behind interactive ones.
+
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        locks = [self._global_lock.lock] + [limiter.lock for limiter in self.ratelimits.values()]
+        if self._slots is not None:
+            locks.append(self._slots)
+        return {
+            priority.name.lower(): {
+                "pending": self._pending[priority],
+                "waiting": sum(lock.waiting(priority) for lock in locks)
+                + (self._yielding if priority is RequestPriority.BACKGROUND else 0),
+            }
+            for priority in RequestPriority
+        }
 
-    async def _check_lock(self) -> None:
+    async def _check_lock(self, priority: RequestPriority = RequestPriority.NORMAL) -> None:
         """Checks the global lock for its current state."""
         if self._global_lock.lock.locked():
             log.warning("The HTTP client is still globally locked, waiting for it to clear.")
-            await self._global_lock.lock.acquire()
+            await self._global_lock.lock.acquire(priority)
             self._global_lock.reset_after = 0
+            self._global_lock.lock.release()  # lets the next waiter through, by priority
+
+    async def _yield_to_interactive(self, priority: RequestPriority) -> None:
+        """Makes background requests wait while interactive requests are pending."""
+        if priority is not RequestPriority.BACKGROUND or self._interactive_idle.is_set():
+            return
+
+        self._yielding += 1
+        try:
+            await self._interactive_idle.wait()
+        finally:
+            self._yielding -= 1
+
+    @asynccontextmanager
+    async def _hold_slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """
+        Holds a connection of the pool while a request is sent. Waiting for it here instead of in the connector
+        lets the requests with a higher priority through first.
+        """
+        if self._slots is None:
+            yield
+            return
+
+        async with self._slots.hold(priority):
+            yield
 
     async def request(self, route: Route, **kwargs) -> Optional[Any]:
         r"""
         Sends a request to the Discord API.
 
+        .. versionchanged:: 4.5.0
+            Identical ``GET`` requests sent while one is in flight share its response, see :attr:`HTTPOptions.coalesce`.
+            Requests are sent by ``priority``, which defaults to the one set by :func:`request_priority`.
+
+        :param route: The HTTP route to request.
+        :type route: Route
+        :param \**kwargs?: Optional keyword-only arguments to pass as information in the request. ``timeout`` may be given in seconds to override the one of the options, ``priority`` as a :class:`RequestPriority`.
+        :type \**kwargs?: dict
+        :return: The contents of the request if any.
+        :rtype: Optional[Any]
+        :raises asyncio.TimeoutError: The request timed out.
+        """
+        if (
+            route.method != "GET"
+            or not self.options.coalesce
+            or kwargs.get("json") is not None
+            or kwargs.get("data") is not None
+        ):
+            return await self._request(route, **kwargs)
+
+        params = kwargs.get("params") or ()
+        key = (
+            route.path,
+            tuple(sorted((k, str(v)) for k, v in getattr(params, "items", lambda: params)())),
+        )
+        self._coalesce_requests += 1
+
+        if (coalesced := self._in_flight.get(key)) is not None:
+            self._coalesce_hits += 1
+            coalesced.followers += 1
+            data = await shield(coalesced.task)
+            if data is None:
+                return None
+            # Every follower decodes its own copy, as the models are built by consuming the payload.
+            # The task may have finished before its done-callbacks ran, in which case no caller resumed yet.
+            return self.codec.loads(
+                coalesced.body if coalesced.body is not None else self.codec.dumps(data)
+            )
+
+        # The request runs in its own task, so that cancelling the first caller does not cancel the others.
+        task = self._loop.create_task(self._request(route, **kwargs))
+        coalesced = self._in_flight[key] = _Coalesced(task)
+
+        def _done(_: Task) -> None:
+            # Done-callbacks run before any caller resumes, so the response is still untouched here.
+            if self._in_flight.get(key) is coalesced:
+                del self._in_flight[key]
+            if coalesced.followers and not task.cancelled() and task.exception() is None:
+                data = task.result()
+                coalesced.body = None if data is None else self.codec.dumps(data)
+
+        task.add_done_callback(_done)
+        task.add_done_callback(_retrieve_exception)
+        return await shield(task)
+
+    async def _request(self, route: Route, **kwargs) -> Optional[Any]:
+        r"""
+        Sends a request to the Discord API, without coalescing it.
+
+        :param route: The HTTP route to request.
+        :type route: Route
+        :param \**kwargs?: Optional keyword-only arguments to pass as information in the request.
+        :type \**kwargs?: dict
+        :return: The contents of the request if any.
+        :rtype: Optional[Any]
+        """
+        priority = kwargs.pop("priority", None)
+        priority = RequestPriority(_priority.get() if priority is None else priority)
+
+        self._pending[priority] += 1
+        if priority is RequestPriority.INTERACTIVE:
+            self._interactive_idle.clear()
+        try:
+            return await self._send(route, priority, **kwargs)
+        finally:
+            self._pending[priority] -= 1
+            if not self._pending[RequestPriority.INTERACTIVE]:
+                self._interactive_idle.set()
+
+    async def _send(self, route: Route, priority: RequestPriority, **kwargs) -> Optional[Any]:
+        r"""
+        Sends a request to the Discord API, respecting the rate limits.
+
         :param route: The HTTP route to request.
         :type route: Route
+        :param priority: The priority of the request.
+        :type priority: RequestPriority
         :param \**kwargs?: Optional keyword-only arguments to pass as information in the request.
         :type \**kwargs?: dict
         :return: The contents of the request if any.
@@ -99,9 +387,14 @@ class _Request:
 
         kwargs["headers"] = {**self._headers, **kwargs.get("headers", {})}
 
-        if kwargs.get("json"):
+        if (payload := kwargs.pop("json", None)) is not None:
+            # encoded once here, so that retries re-send the same bytes
+            kwargs["data"] = self.codec.dumps(payload)
             kwargs["headers"]["Content-Type"] = "application/json"
 
+        if isinstance(timeout := kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = ClientTimeout(total=timeout, connect=self.options.connect_timeout)
+
         if reason := kwargs.pop("reason", None):
             kwargs["headers"]["X-Audit-Log-Reason"] = quote(reason, safe="/ ")
 
@@ -127,27 +420,47 @@ class _Request:
                 self._loop.call_later(_limiter.reset_after, _limiter.release_lock)
             _limiter.reset_after = 0
         else:
-            self.ratelimits[bucket] = (
-                Limiter(lock=Lock(loop=self._loop))
-                if version_info < (3, 10)
-                else Limiter(lock=Lock())
-            )
+            self.ratelimits[bucket] = Limiter(lock=PriorityLock())
             _limiter: Limiter = self.ratelimits.get(bucket)
 
-        await _limiter.lock.acquire()  # _limiter is the per shared bucket/route endpoint
+        _trace: bool = tracer.sampled("http")
+        if _trace:
+            _start = perf_counter()
+
+        await self._yield_to_interactive(priority)
+        await _limiter.lock.acquire(priority)  # _limiter is the per shared bucket/route endpoint
+
+        if _trace:
+            tracer.emit("http", "bucket_wait", _start, bucket=bucket, priority=priority.name)
 
         # Implement retry logic. The common seems to be 5, so this is hardcoded, for the most part.
 
         for tries in range(5):  # 3, 5? 5 seems to be common
             try:
                 self._check_session()
-                await self._check_lock()
+                await self._check_lock(priority)
+                await self._yield_to_interactive(priority)
+
+                if _trace:
+                    _start = perf_counter()
 
-                async with self._session.request(
+                async with self._hold_slot(priority), self._session.request(
                     route.method, route.__api__ + route.path, **kwargs
                 ) as response:
+                    if _trace:
+                        tracer.emit(
+                            "http",
+                            "request",
+                            _start,
+                            method=route.method,
+                            endpoint=route.endpoint,
+                            status=response.status,
+                        )
+                        _start = perf_counter()
+
                     if response.content_type == "application/json":
-                        data = await response.json()
+                        body: bytes = await response.read()
+                        data = self.codec.loads(body) if body.strip() else None
                         if isinstance(data, dict):
                             message: Optional[str] = data.get("message")
                             code: int = data.get("code", response.status)
@@ -156,6 +469,9 @@ class _Request:
                     else:
                         data, message, code = None, None, response.status
 
+                    if _trace:
+                        tracer.emit("http", "decode", _start, endpoint=route.endpoint)
+
                     reset_after: float = float(
                         response.headers.get(
                             "X-RateLimit-Reset-After", response.headers.get("Retry-After", "0.0")
@@ -165,7 +481,7 @@ class _Request:
                     _bucket: str = response.headers.get("X-RateLimit-Bucket")
                     is_global: bool = response.headers.get("X-RateLimit-Global", False)
 
-                    log.debug(f"{route.method}: {route.__api__ + route.path}: {kwargs}")
+                    log.debug("%s: %s: %s", route.method, route.__api__ + route.path, kwargs)
 
                     if _bucket is not None:
                         self.buckets[route.endpoint] = _bucket
@@ -173,21 +489,36 @@ class _Request:
                     if isinstance(data, dict) and (
                         data.get("errors") or (code and code not in {429, 31001} and message)
                     ):
-                        log.debug(
-                            f"RETURN {response.status}: {dumps(data, indent=4, sort_keys=True)}"
-                        )
+                        if log.isEnabledFor(DEBUG):
+                            log.debug(
+                                "RETURN %s: %s",
+                                response.status,
+                                dumps(data, indent=4, sort_keys=True),
+                            )
                         # This "redundant" debug line is for debug use and tracing back the error codes.
 
-                        raise LibraryException(message=message, code=code, severity=40, data=data)
-                    elif isinstance(data, dict) and code == 0 and message:
-                        log.debug(
-                            f"RETURN {response.status}: {dumps(data, indent=4, sort_keys=True)}"
+                        raise LibraryException(
+                            message=message,
+                            code=code,
+                            severity=40,
+                            data=data,
+                            status=response.status,
                         )
+                    elif isinstance(data, dict) and code == 0 and message:
+                        if log.isEnabledFor(DEBUG):
+                            log.debug(
+                                "RETURN %s: %s",
+                                response.status,
+                                dumps(data, indent=4, sort_keys=True),
+                            )
                         # This "redundant" debug line is for debug use and tracing back the error codes.
 
                         raise LibraryException(
-                            message=f"'{message}'. Make sure that your token is set properly.",
-                            severity=50,
+                            message=f"'{message}'. Make sure that your token is set properly."
+                            if response.status == 401
+                            else message,
+                            severity=50 if response.status == 401 else 40,
+                            status=response.status,
                         )
                     if code in {429, 31001}:
                         hours = int(reset_after // 3600)
@@ -201,9 +532,12 @@ class _Request:
                         )
                         if is_global:
                             self._global_lock.reset_after = reset_after
-                            self._loop.call_later(
-                                self._global_lock.reset_after, self._global_lock.lock.release
-                            )
+                            if not self._global_lock.lock.locked():
+                                await self._global_lock.lock.acquire()  # immediate, as it is unlocked
+                                self._loop.call_later(
+                                    self._global_lock.reset_after, self._global_lock.release_lock
+                                )
+                            continue
                         else:
                             _limiter.reset_after = reset_after
                             await asyncio.sleep(_limiter.reset_after)
@@ -214,12 +548,20 @@ class _Request:
                         )
                         self._loop.call_later(reset_after, _limiter.release_lock)
 
-                    log.debug(f"RETURN {response.status}: {dumps(data, indent=4, sort_keys=True)}")
+                    if log.isEnabledFor(DEBUG):
+                        log.debug(
+                            "RETURN %s: %s", response.status, dumps(data, indent=4, sort_keys=True)
+                        )
 
                     _limiter.release_lock()  # checks if its locked, then releases upon success.
 
                     return data
 
+            except asyncio.TimeoutError:
+                with suppress(RuntimeError):
+                    _limiter.lock.release()
+                raise
+
             # These account for general/specific exceptions. (Windows...)
             except OSError as e:
                 if tries < 4 and e.errno in (54, 10054):
@@ -239,5 +581,14 @@ class _Request:
                 break
 
     async def close(self) -> None:
-        """Closes the current session."""
-        await self._session.close()
+        """
+        Closes the current session.
+
+        .. versionchanged:: 4.5.0
+            A shared session is only closed once no client uses it anymore.
+        """
+        if self._released:
+            return
+        self._released = True
+        if self._release_session():
+            await self._session.close()
@@ -1,9 +1,24 @@
 # versionadded declared in docs gen file
 
-from typing import TYPE_CHECKING, List, Optional, TypeVar
+from collections import deque
+from math import inf
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from ...client.enums import IntEnum
+from ...utils.abc.base_iterators import DiscordPaginationIterator
 from ...utils.attrs_utils import DictSerializerMixin, convert_list, define, field
+from ...utils.missing import MISSING
 from .channel import Channel
 from .misc import Snowflake
 from .user import User
@@ -15,13 +30,15 @@ __all__ = (
     "AuditLogs",
     "AuditLogChange",
     "OptionalAuditEntryInfo",
+    "AsyncAuditLogIterator",
 )
 
 _T = TypeVar("_T")
 
 
 if TYPE_CHECKING:
-    from .guild import Integration, ScheduledEvents
+    from ..http.client import HTTPClient
+    from .guild import Guild, Integration, ScheduledEvents
     from .gw import AutoModerationRule
 
 
@@ -236,6 +253,7 @@ class AuditLogEntry(DictSerializerMixin):
     :ivar AuditLogEvents action_type: Type of action that occurred
     :ivar OptionalAuditEntryInfo options: Additional info for certain event types
     :ivar str reason: Reason for the change (1-512 characters)
+    :ivar Optional[User] user: The user that made the changes, if resolved by the :class:`.AsyncAuditLogIterator`
     """
 
     target_id: Optional[str] = field(default=None)
@@ -249,6 +267,7 @@ class AuditLogEntry(DictSerializerMixin):
         converter=OptionalAuditEntryInfo, default=None
     )
     reason: Optional[str] = field(default=None)
+    user: Optional[User] = field(converter=User, default=None, repr=False)
 
 
 @define()
@@ -293,3 +312,88 @@ class AuditLogs(DictSerializerMixin):
             self.auto_moderation_rules = [
                 AutoModerationRule(**rule) for rule in self.auto_moderation_rules
             ]
+
+
+class AsyncAuditLogIterator(DiscordPaginationIterator):
+    """
+    .. versionadded:: 4.5.0
+
+    A class object that allows iterating through the audit log entries of a guild, from most to least recent.
+
+    The next page is already requested while the entries of the current one are yielded.
+
+    :param HTTPClient _client: The HTTPClient of the bot
+    :param Union[int, str, Snowflake, Guild] obj: The guild to get the audit log entries from
+    :param Optional[Union[int, str, Snowflake, AuditLogEntry]] start_at: The entry to begin getting the entries before
+    :param Optional[Callable[[AuditLogEntry], Union[bool, Awaitable[bool]]]] check: A check to ignore certain entries
+    :param Optional[int] maximum: A set maximum of entries to get before stopping the iteration
+    :param Optional[Union[User, int, Snowflake]] user_id: Only get the entries of actions made by this user
+    :param Optional[Union[int, AuditLogEvents]] action_type: Only get the entries of this action type
+    :param Optional[bool] resolve_users: Whether to set :attr:`.AuditLogEntry.user` from the users of the pages. Default False
+    """
+
+    def __init__(
+        self,
+        _client: "HTTPClient",
+        obj: Union[int, str, Snowflake, "Guild"],
+        maximum: Optional[int] = inf,
+        start_at: Optional[Union[int, str, Snowflake, AuditLogEntry]] = MISSING,
+        check: Optional[Callable[[AuditLogEntry], Union[bool, Awaitable[bool]]]] = None,
+        user_id: Optional[Union[User, int, Snowflake]] = MISSING,
+        action_type: Optional[Union[int, AuditLogEvents]] = MISSING,
+        resolve_users: Optional[bool] = False,
+    ):
+        super().__init__(obj, _client, maximum=maximum, start_at=start_at, check=check)
+
+        self.before: Optional[int] = self.start_at
+        self.user_id: Optional[int] = (
+            int(user_id.id if isinstance(user_id, User) else user_id)
+            if user_id is not MISSING
+            else None
+        )
+        self.action_type: Optional[int] = None if action_type is MISSING else int(action_type)
+        self.resolve_users = resolve_users
+
+        self.users: Dict[int, User] = {}
+        self.objects: Deque[AuditLogEntry] = deque()
+        self._ids: Set[int] = set()
+
+    def _request_page(self) -> Awaitable[dict]:
+        return self._client.get_guild_auditlog(
+            guild_id=self.object_id,
+            user_id=self.user_id,
+            action_type=self.action_type,
+            before=self.before,
+            limit=self._limit,
+        )
+
+    def _parse_page(self, res: dict) -> List[AuditLogEntry]:
+        entries: List[dict] = res["audit_log_entries"]
+        new_entries = [entry for entry in entries if int(entry["id"]) not in self._ids]
+
+        if len(entries) < self._limit or not new_entries:
+            # end of the audit log reached
+            self._stopped = True
+
+        if self.object_count + len(new_entries) >= self.maximum:
+            new_entries = new_entries[: int(self.maximum - self.object_count)]
+            self._stopped = True
+        self.object_count += len(new_entries)
+
+        if entries:
+            self.before = int(entries[-1]["id"])
+
+        if self.resolve_users:
+            for user in res.get("users", []):
+                _id = int(user["id"])
+                if _id not in self.users:
+                    self.users[_id] = User(**user, _client=self._client)
+
+        objects: List[AuditLogEntry] = []
+        for entry in new_entries:
+            self._ids.add(int(entry["id"]))
+            entry = AuditLogEntry(**entry)
+            if self.resolve_users and entry.user_id is not None:
+                entry.user = self.users.get(int(entry.user_id))
+            objects.append(entry)
+        return objects
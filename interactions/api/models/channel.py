@@ -1,7 +1,19 @@
-from asyncio import Task, create_task, get_running_loop, sleep
+from asyncio import (
+    FIRST_COMPLETED,
+    Queue,
+    Semaphore,
+    Task,
+    create_task,
+    gather,
+    get_running_loop,
+    sleep,
+    wait,
+)
 from datetime import datetime
 from inspect import isawaitable
+from logging import Logger
 from math import inf
+from time import perf_counter, time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,6 +27,7 @@ from typing import (
     Union,
 )
 
+from ...base import get_logger
 from ...client.enums import IntEnum
 from ...client.models.messageable import Messageable
 from ...utils.abc.base_context_managers import BaseAsyncContextManager
@@ -30,6 +43,7 @@ from ...utils.attrs_utils import (
 from ...utils.missing import MISSING
 from ...utils.utils import search_iterable
 from ..error import LibraryException
+from ..tracing import tracer
 from .emoji import Emoji
 from .flags import Permissions
 from .misc import AllowedMentions, File, IDMixin, Overwrite, Snowflake
@@ -56,6 +70,8 @@ __all__ = (
     "ForumTag",
 )
 
+log: Logger = get_logger("channel")
+
 
 class ChannelType(IntEnum):
     """An enumerable object representing the type of channels."""
@@ -1201,262 +1217,181 @@ class Channel(ClientSerializerMixin, Messageable, IDMixin):
 
         return message
 
-    # TODO: What the fuck is it?
-    # async def purge(
-    #     self,
-    #     amount: int,
-    #     check: Optional[Callable[[Any], Union[bool, Awaitable[bool]]]] = MISSING,
-    #     before: Optional[int] = MISSING,
-    #     reason: Optional[str] = None,
-    #     bulk: Optional[bool] = True,
-    #     force_bulk: Optional[bool] = False,
-    # ) -> List["Message"]:
-    #     """
-    #     .. versionadded:: 4.1.0
-    #
-    #     Purges a given amount of messages from a channel. You can specify a check function to exclude specific messages.
-    #
-    #     .. warning:: Calling this method can lead to rate-limits when purging higher amounts of messages.
-    #
-    #     .. code-block:: python
-    #
-    #         def check_pinned(message):
-    #             return not message.pinned  # This returns `True` only if the message is the message is not pinned
-    #         await channel.purge(100, check=check_pinned)
-    #         # This will delete the newest 100 messages that are not pinned in that channel
-    #
-    #     :param int amount: The amount of messages to delete
-    #     :param Optional[Callable[[Any], Union[bool, Awaitable[bool]]]] check:
-    #         The function used to check if a message should be deleted.
-    #         The message is only deleted if the check returns `True`
-    #     :param Optional[int] before: An id of a message to purge only messages before that message
-    #     :param Optional[bool] bulk:
-    #         Whether to use the bulk delete endpoint for deleting messages. This only works for 14 days
-    #
-    #         .. versionchanged:: 4.4.0
-    #             Purge now automatically continues deleting messages even after the 14 days limit was hit. Check
-    #             ``force_bulk`` for more information. If the 14 days span is exceeded the bot will encounter rate-limits
-    #             more frequently.
-    #     :param Optional[st] reason: The reason of the deletes
-    #     :param Optional[bool] force_bulk:
-    #         .. versionadded:: 4.4.0
-    #             Whether to stop deleting messages when the 14 days bulk limit was hit, default ``False``
-    #     :return: A list of the deleted messages
-    #     :rtype: List[Message]
-    #     """
-    #     if not self._client:
-    #         raise LibraryException(code=13)
-    #
-    #     _before = None if before is MISSING else before
-    #     _all = []
-    #
-    #     async def normal_delete():
-    #         nonlocal _before, _all, amount, check, reason
-    #         while amount > 0:
-    #             messages = [
-    #                 res
-    #                 for res in await self._client.get_channel_messages(
-    #                     channel_id=int(self.id),
-    #                     limit=min(amount, 100),
-    #                     before=_before,
-    #                 )
-    #             ]
-    #             if not messages:
-    #                 return _all
-    #
-    #             amount -= min(amount, 100)
-    #             messages2 = messages.copy()
-    #             for message in messages2:
-    #                 if (
-    #                     message.flags & MessageFlags.EPHEMERAL
-    #                     or message.flags & MessageFlags.LOADING
-    #                     or not message.deletable
-    #                 ):
-    #                     messages.remove(message)
-    #                     amount += 1
-    #                     _before = int(message.id)
-    #                 elif check is not MISSING:
-    #                     _check = check(message)
-    #                     if isawaitable(_check):
-    #                         _check = await _check
-    #                     if not _check:
-    #                         messages.remove(message)
-    #                         amount += 1
-    #                         _before = int(message["id"])
-    #
-    #             for message in messages:  # show results faster
-    #                 await self._client.delete_message(
-    #                     channel_id=int(self.id),
-    #                     message_id=int(message["id"]),
-    #                     reason=reason,
-    #                 )
-    #
-    #             _all += messages
-    #
-    #         return _all
-    #
-    #     async def bulk_delete():
-    #         nonlocal _before, _all, amount, check, reason
-    #
-    #         _allowed_time = datetime.now(tz=timezone.utc) - timedelta(days=14)
-    #         _stop = False
-    #         while amount > 100:
-    #
-    #             messages = [
-    #                 res
-    #                 for res in await self._client.get_channel_messages(
-    #                     channel_id=int(self.id),
-    #                     limit=100,
-    #                     before=_before,
-    #                 )
-    #             ]
-    #             if not messages:
-    #                 return _all
-    #             messages2 = messages.copy()
-    #             for message in messages2:
-    #                 if datetime.fromisoformat(str(message.timestamp)) < _allowed_time:
-    #                     messages.remove(message)
-    #                     _stop = True
-    #
-    #                 elif (
-    #                     message["flags"] & MessageFlags.EPHEMERAL
-    #                     or message["flags"] & MessageFlags.LOADING
-    #                     or not message.deletable
-    #                 ):
-    #                     messages.remove(message)
-    #                     amount += 1
-    #                     _before = int(message.id)
-    #                 elif check is not MISSING:
-    #                     _check = check(message)
-    #                     if isawaitable(_check):
-    #                         _check = await _check
-    #                     if not _check:
-    #                         messages.remove(message)
-    #                         amount += 1
-    #                         _before = int(message.id)
-    #             _all += messages
-    #             if len(messages) > 1:
-    #                 await self._client.delete_messages(
-    #                     channel_id=int(self.id),
-    #                     message_ids=[int(message.id) for message in messages],
-    #                     reason=reason,
-    #                 )
-    #             elif len(messages) == 1:
-    #                 await self._client.delete_message(
-    #                     channel_id=int(self.id),
-    #                     message_id=int(messages[0].id),
-    #                     reason=reason,
-    #                 )
-    #             elif _stop:
-    #                 return _all
-    #             else:
-    #                 continue
-    #             if _stop:
-    #                 return _all
-    #
-    #             amount -= 100
-    #
-    #         while amount > 1:
-    #             messages = [
-    #                 self._client.cache[Message].get(Snowflake(res["id"]))
-    #                 for res in await self._client.get_channel_messages(
-    #                     channel_id=int(self.id),
-    #                     limit=amount,
-    #                     before=_before,
-    #                 )
-    #             ]
-    #             if not messages:
-    #                 return _all
-    #             amount -= amount
-    #             messages2 = messages.copy()
-    #             for message in messages2:
-    #                 if datetime.fromisoformat(str(message.timestamp)) < _allowed_time:
-    #                     messages.remove(message)
-    #                     _stop = True
-    #                 elif (
-    #                     message.flags & MessageFlags.EPHEMERAL
-    #                     or message.flags & MessageFlags.LOADING
-    #                     or not message.deletable
-    #                 ):
-    #                     messages.remove(message)
-    #                     amount += 1
-    #                     _before = int(message.id)
-    #                 elif check is not MISSING:
-    #                     _check = check(message)
-    #                     if isawaitable(_check):
-    #                         _check = await _check
-    #                     if not _check:
-    #                         messages.remove(message)
-    #                         amount += 1
-    #                         _before = int(message.id)
-    #             _all += messages
-    #             if len(messages) > 1:
-    #                 await self._client.delete_messages(
-    #                     channel_id=int(self.id),
-    #                     message_ids=[int(message.id) for message in messages],
-    #                     reason=reason,
-    #                 )
-    #             elif len(messages) == 1:
-    #                 await self._client.delete_message(
-    #                     channel_id=int(self.id),
-    #                     message_id=int(messages[0].id),
-    #                     reason=reason,
-    #                 )
-    #             elif _stop:
-    #                 return _all
-    #             else:
-    #                 continue
-    #             if _stop:
-    #                 return _all
-    #         while amount == 1:
-    #             messages = [
-    #                 self._client.cache[Message].get(Snowflake(res["id"]))
-    #                 for res in await self._client.get_channel_messages(
-    #                     channel_id=int(self.id),
-    #                     limit=amount,
-    #                     before=_before,
-    #                 )
-    #             ]
-    #             if not messages:
-    #                 return _all
-    #             amount -= 1
-    #             messages2 = messages.copy()
-    #             for message in messages2:
-    #                 if (
-    #                     message.flags & MessageFlags.EPHEMERAL
-    #                     or message.flags & MessageFlags.LOADING
-    #                     or not message.deletable
-    #                 ):
-    #                     messages.remove(message)
-    #                     amount += 1
-    #                     _before = int(message.id)
-    #                 elif check is not MISSING:
-    #                     _check = check(message)
-    #                     if isawaitable(_check):
-    #                         _check = await _check
-    #                     if not _check:
-    #                         messages.remove(message)
-    #                         amount += 1
-    #                         _before = int(message.id)
-    #             _all += messages
-    #             if not messages:
-    #                 continue
-    #             await self._client.delete_message(
-    #                 channel_id=int(self.id),
-    #                 message_id=int(messages[0].id),
-    #                 reason=reason,
-    #             )
-    #         return _all
-    #
-    #     if bulk:
-    #         await bulk_delete()
-    #         if not force_bulk:
-    #             await normal_delete()
-    #         return _all
-    #
-    #     await normal_delete()
-    #
-    #     return _all
+    async def purge(
+        self,
+        amount: int,
+        check: Optional[Callable[["Message"], Union[bool, Awaitable[bool]]]] = MISSING,
+        before: Optional[int] = MISSING,
+        reason: Optional[str] = None,
+        bulk: Optional[bool] = True,
+        force_bulk: Optional[bool] = False,
+        concurrency: Optional[int] = 5,
+    ) -> List["Message"]:
+        """
+        .. versionadded:: 4.1.0
+
+        Purges a given amount of messages from a channel. You can specify a check function to exclude specific messages.
+
+        The history of the channel is fetched while earlier pages are still being deleted. Messages younger than
+        14 days are deleted in bulk in batches of up to 100, older messages are deleted one by one with at most
+        ``concurrency`` deletions running at once. The throughput is emitted as a ``channel.purge`` span of the
+        :class:`Tracer`.
+
+        .. warning:: Calling this method can lead to rate-limits when purging higher amounts of messages.
+
+        .. code-block:: python
+
+            def check_pinned(message):
+                return not message.pinned  # This returns `True` only if the message is the message is not pinned
+            await channel.purge(100, check=check_pinned)
+            # This will delete the newest 100 messages that are not pinned in that channel
+
+        :param int amount: The amount of messages to delete
+        :param Optional[Callable[[Message], Union[bool, Awaitable[bool]]]] check:
+            The function used to check if a message should be deleted.
+            The message is only deleted if the check returns `True`
+        :param Optional[int] before: An id of a message to purge only messages before that message
+        :param Optional[bool] bulk:
+            Whether to use the bulk delete endpoint for deleting messages. This only works for 14 days
+
+            .. versionchanged:: 4.4.0
+                Purge now automatically continues deleting messages even after the 14 days limit was hit. Check
+                ``force_bulk`` for more information. If the 14 days span is exceeded the bot will encounter rate-limits
+                more frequently.
+        :param Optional[st] reason: The reason of the deletes
+        :param Optional[bool] force_bulk:
+            .. versionadded:: 4.4.0
+                Whether to stop deleting messages when the 14 days bulk limit was hit, default ``False``
+        :param Optional[int] concurrency:
+            .. versionadded:: 4.5.0
+                The maximum amount of single deletions running at once, default ``5``
+        :return: A list of the deleted messages
+        :rtype: List[Message]
+        """
+        if not self._client:
+            raise LibraryException(code=13)
+
+        from .flags import MessageFlags
+        from .message import Message
+
+        started_at = perf_counter()
+
+        # Snowflakes younger than this one can be bulk deleted. A minute of margin accounts for clock drift.
+        _bulk_cutoff = (int((time() - 14 * 24 * 60 * 60 + 60) * 1000) - 1420070400000) << 22
+
+        _pages: "Queue[List[dict]]" = Queue(maxsize=2)
+        _semaphore = Semaphore(concurrency)
+        _deleted: List[Message] = []
+        _batch: List[Message] = []
+        _singles: List[Task] = []
+
+        async def fetch_pages() -> None:
+            _before = None if before is MISSING else int(before)
+            while True:
+                msgs = await self._client.get_channel_messages(
+                    channel_id=int(self.id), limit=100, before=_before
+                )
+                await _pages.put(msgs)
+                if len(msgs) < 100:
+                    return
+                _before = int(msgs[-1]["id"])
+
+        async def next_page() -> List[dict]:
+            if not _pages.empty():
+                return _pages.get_nowait()
+            getter: Task = create_task(_pages.get())
+            await wait({getter, fetcher}, return_when=FIRST_COMPLETED)
+            if getter.done():
+                return getter.result()
+            getter.cancel()
+            fetcher.result()  # re-raises the exception of the history fetch
+            return []
+
+        async def flush_batch() -> None:
+            if len(_batch) > 1:
+                await self._client.delete_messages(
+                    channel_id=int(self.id),
+                    message_ids=[int(message.id) for message in _batch],
+                    reason=reason,
+                )
+            elif _batch:
+                await self._client.delete_message(
+                    channel_id=int(self.id), message_id=int(_batch[0].id), reason=reason
+                )
+            _deleted.extend(_batch)
+            _batch.clear()
+
+        async def delete_single(message: Message) -> None:
+            async with _semaphore:
+                await self._client.delete_message(
+                    channel_id=int(self.id), message_id=int(message.id), reason=reason
+                )
+            _deleted.append(message)
+
+        fetcher: Task = create_task(fetch_pages())
+        _selected: int = 0
+        try:
+            while _selected < amount:
+                msgs = await next_page()
+                for msg in msgs:
+                    if _selected >= amount:
+                        break
+
+                    if (msg.get("flags") or 0) & (MessageFlags.EPHEMERAL | MessageFlags.LOADING):
+                        continue
+
+                    message = Message(**msg, _client=self._client)
+                    if not message.deletable:
+                        continue
+                    if check is not MISSING:
+                        _check = check(message)
+                        if isawaitable(_check):
+                            _check = await _check
+                        if not _check:
+                            continue
+
+                    if bulk and int(message.id) > _bulk_cutoff:
+                        _batch.append(message)
+                        _selected += 1
+                    elif bulk and force_bulk:
+                        amount = _selected  # the 14 days limit was hit
+                    else:
+                        _singles.append(create_task(delete_single(message)))
+                        _selected += 1
+
+                await flush_batch()  # the next page is fetched while this one is deleted
+                if len(msgs) < 100:
+                    break
+        finally:
+            fetcher.cancel()
+            # Every single deletion is awaited even if one failed, and the exception of the history fetch is
+            # retrieved. An exception raised by the loop itself propagates as is.
+            _results = await gather(fetcher, *_singles, return_exceptions=True)
+
+        for _result in _results[1:]:
+            if isinstance(_result, BaseException):
+                raise _result
+
+        elapsed = perf_counter() - started_at
+        throughput = len(_deleted) / elapsed if elapsed else 0.0
+        log.debug(
+            "Purged %s messages from channel %s in %.2fs (%.1f messages/s)",
+            len(_deleted),
+            self.id,
+            elapsed,
+            throughput,
+        )
+        if tracer.sampled("channel"):
+            tracer.emit(
+                "channel",
+                "purge",
+                started_at,
+                channel_id=int(self.id),
+                deleted=len(_deleted),
+                throughput=throughput,
+            )
+
+        return _deleted
 
     async def create_thread(
         self,
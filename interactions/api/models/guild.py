@@ -1,11 +1,12 @@
+from collections import deque
 from datetime import datetime
-from inspect import isawaitable
 from math import inf
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
     Callable,
+    Deque,
     Dict,
     List,
     Literal,
@@ -28,7 +29,7 @@ from ...utils.attrs_utils import (
 )
 from ...utils.missing import MISSING
 from ..error import LibraryException
-from .audit_log import AuditLogEvents, AuditLogs
+from .audit_log import AsyncAuditLogIterator, AuditLogEntry, AuditLogEvents, AuditLogs
 from .channel import Channel, ChannelType, Thread, ThreadMember
 from .emoji import Emoji
 from .flags import Permissions
@@ -232,7 +233,7 @@ class AsyncMembersIterator(DiscordPaginationIterator):
     """
     .. versionadded:: 4.3.2
 
-    A class object that allows iterating through a channel's history.
+    A class object that allows iterating through the members of a guild.
 
     :param HTTPClient _client: The HTTPClient of the bot
     :param Union[int, str, Snowflake, Guild] obj: The guild to get the members from
@@ -250,89 +251,32 @@ class AsyncMembersIterator(DiscordPaginationIterator):
         check: Optional[Callable[[Member], Union[bool, Awaitable[bool]]]] = None,
     ):
 
-        self.__stop: bool = False
-
         super().__init__(obj, _client, maximum=maximum, start_at=start_at, check=check)
 
         self.after = self.start_at
 
-        self.objects: Optional[List[Member]]
-
-    async def get_first_objects(self) -> None:
+        self.objects: Deque[Member] = deque()
 
-        limit = min(self.maximum, 1000)
+    _page_size: int = 1000
 
-        if self.maximum == limit:
-            self.__stop = True
-
-        raw_members = await self._client.get_list_of_members(
-            guild_id=self.object_id, after=self.after, limit=limit
+    def _request_page(self) -> Awaitable[List[dict]]:
+        return self._client.get_list_of_members(
+            guild_id=self.object_id, after=self.after, limit=self._limit
         )
-        self.after = int(raw_members[-1]["user"]["id"])
-
-        if len(raw_members) < 1000:
-            # already all messages resolved with one operation
-            self.__stop = True
-
-        self.object_count += limit
-
-        guild_id = Snowflake(self.object_id)
-        members = self._client.cache.add_members(raw_members, guild_id)
-
-        self.objects = [*members]
-
-    async def get_objects(self) -> None:
-        limit = min(500, self.maximum - self.object_count)
-        raw_members = await self._client.get_list_of_members(
-            guild_id=self.object_id, after=self.after, limit=limit
-        )
-        self.after = int(raw_members[-1]["user"]["id"])
-
-        if len(raw_members) < limit or limit == self.maximum - self.object_count:
-            # end of messages reached again
-            self.__stop = True
-
-        self.object_count += limit
-
-        guild_id = Snowflake(self.object_id)
-        members = self._client.cache.add_members(raw_members, guild_id)
-
-        self.objects.extend(members)
 
-    async def flatten(self) -> List[Member]:
-        """Returns all remaining items of the iterator as list."""
-        return [item async for item in self]
+    def _parse_page(self, raw_members: List[dict]) -> List[Member]:
+        if len(raw_members) < self._limit:
+            # all members resolved
+            self._stopped = True
 
-    async def __anext__(self) -> Member:
-        if self.objects is None:
-            await self.get_first_objects()
+        self.object_count += len(raw_members)
+        if self.object_count >= self.maximum:
+            self._stopped = True
 
-        try:
-            obj = self.objects.pop(0)
+        if raw_members:
+            self.after = int(raw_members[-1]["user"]["id"])
 
-            if self.check:
-
-                res = self.check(obj)
-                _res = await res if isawaitable(res) else res
-                while not _res:
-                    if (
-                        not self.__stop
-                        and len(self.objects) < 5
-                        and self.object_count >= self.maximum
-                    ):
-                        await self.get_objects()
-
-                    self.object_count -= 1
-                    obj = self.objects.pop(0)
-
-                    _res = self.check(obj)
-
-            if not self.__stop and len(self.objects) < 5 and self.object_count <= self.maximum:
-                await self.get_objects()
-        except IndexError as e:
-            raise StopAsyncIteration from e
-        else:
-            return obj
+        return self._client.cache.add_members(raw_members, Snowflake(self.object_id), merge=False)
 
 
 @define()
@@ -2447,17 +2391,16 @@ class Guild(ClientSerializerMixin, IDMixin):
 
         _all_members: List[dict] = []
         _members: List[dict] = await self._client.get_list_of_members(
-            guild_id=int(self.id), limit=100
+            guild_id=int(self.id), limit=1000
         )
-        if len(_members) == 100:
-            while len(_members) >= 100:
-                _all_members.extend(_members)
-                _members = await self._client.get_list_of_members(
-                    guild_id=int(self.id), limit=100, after=int(_members[-1]["id"])
-                )
+        while len(_members) >= 1000:
+            _all_members.extend(_members)
+            _members = await self._client.get_list_of_members(
+                guild_id=int(self.id), limit=1000, after=int(_members[-1]["user"]["id"])
+            )
         _all_members.extend(_members)
 
-        return self.cache.add_members(_all_members, self.id)
+        return self.cache.add_members(_all_members, self.id, merge=False)
 
     def get_members(
         self,
@@ -2777,14 +2720,13 @@ class Guild(ClientSerializerMixin, IDMixin):
         :return: The full AuditLog of the guild
         :rtype: AuditLogs
         """
-        double = False
         _action_type = action_type if action_type is not MISSING else None
         _user_id = (
             int(user_id.id if isinstance(user_id, User) else user_id)
             if user_id is not MISSING
             else None
         )
-        _audit_log_dict: dict = {
+        _audit_log_dict: Dict[str, List[dict]] = {
             "audit_log_entries": [],
             "users": [],
             "integrations": [],
@@ -2794,29 +2736,10 @@ class Guild(ClientSerializerMixin, IDMixin):
             "application_commands": [],
             "auto_moderation_rules": [],
         }
+        _ids: Dict[str, Set[str]] = {key: set() for key in _audit_log_dict}
+        _before: Optional[int] = None
 
-        res = await self._client.get_guild_auditlog(
-            guild_id=int(self.id), user_id=_user_id, action_type=_action_type, limit=100
-        )
-
-        if len(res["audit_log_entries"]) < 100:
-            return AuditLogs(**res)
-
-        while len(res["audit_log_entries"]) == 100:
-            _before = res["audit_log_entries"][-1]["id"]
-
-            double = False
-            for key, values in res.items():
-                for value in values:
-                    if value not in _audit_log_dict[key]:
-                        _audit_log_dict[key] = value
-                    else:
-                        double = True
-                        # It is possible that an item is already present, however we should not break directly out
-                        # in case other attributes are not present yet.
-            if double:
-                break
-
+        while True:
             res = await self._client.get_guild_auditlog(
                 guild_id=int(self.id),
                 user_id=_user_id,
@@ -2825,14 +2748,64 @@ class Guild(ClientSerializerMixin, IDMixin):
                 limit=100,
             )
 
-        if not double:
+            double = False
             for key, values in res.items():
+                _key_ids = _ids.setdefault(key, set())
+                _values = _audit_log_dict.setdefault(key, [])
                 for value in values:
-                    if value not in _audit_log_dict[key]:
-                        _audit_log_dict[key] = value
+                    _id = value.get("id") if isinstance(value, dict) else None
+                    if _id is None:
+                        _values.append(value)
+                    elif _id not in _key_ids:
+                        _key_ids.add(_id)
+                        _values.append(value)
+                    elif key == "audit_log_entries":
+                        double = True
+                        # Other attributes such as users are expected to repeat across pages, entries are not.
+
+            if double or len(res["audit_log_entries"]) < 100:
+                break
+
+            _before = int(res["audit_log_entries"][-1]["id"])
 
         return AuditLogs(**_audit_log_dict)
 
+    def get_audit_log_entries(
+        self,
+        start_at: Optional[Union[int, str, Snowflake, AuditLogEntry]] = MISSING,
+        maximum: Optional[int] = inf,
+        check: Optional[Callable[[AuditLogEntry], Union[bool, Awaitable[bool]]]] = None,
+        user_id: Optional[Union[User, int, Snowflake]] = MISSING,
+        action_type: Optional[Union[int, AuditLogEvents]] = MISSING,
+        resolve_users: Optional[bool] = False,
+    ) -> AsyncAuditLogIterator:
+        """
+        .. versionadded:: 4.5.0
+
+        :param Optional[Union[int, str, Snowflake, AuditLogEntry]] start_at: The entry to begin getting the entries before
+        :param Optional[int] maximum: A set maximum of entries to get before stopping the iteration
+        :param Optional[Callable[[AuditLogEntry], Union[bool, Awaitable[bool]]]] check: A custom check to ignore certain entries
+        :param Optional[Union[User, int, Snowflake]] user_id: User ID snowflake. filter the log for actions made by a user.
+        :param Optional[Union[int, AuditLogEvents]] action_type: The type of the audit log action.
+        :param Optional[bool] resolve_users: Whether to set the ``user`` attribute of the entries. Default False
+
+        :return: An asynchronous iterator over the audit log entries of the guild
+        :rtype: AsyncAuditLogIterator
+        """
+        if not self._client:
+            raise LibraryException(code=13)
+
+        return AsyncAuditLogIterator(
+            self._client,
+            self,
+            maximum=maximum,
+            start_at=start_at,
+            check=check,
+            user_id=user_id,
+            action_type=action_type,
+            resolve_users=resolve_users,
+        )
+
     async def get_invite(
         self,
         invite_code: str,
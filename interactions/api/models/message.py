@@ -1,11 +1,15 @@
 import contextlib
+from collections import deque
 from datetime import datetime
 from io import BytesIO
-from typing import TYPE_CHECKING, List, Optional, Union
+from math import inf
+from random import randrange
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, List, Optional, Union
 
 from ...client.enums import IntEnum
 from ...client.models.component import ActionRow, Button, SelectMenu
 from ...client.models.messageable import Messageable
+from ...utils.abc.base_iterators import DiscordPaginationIterator
 from ...utils.attrs_utils import (
     ClientSerializerMixin,
     DictSerializerMixin,
@@ -47,6 +51,7 @@ __all__ = (
     "PartialSticker",
     "Sticker",
     "StickerPack",
+    "AsyncReactionUsersIterator",
 )
 
 
@@ -680,6 +685,99 @@ class ReactionObject(DictSerializerMixin):
     emoji: Emoji = field(converter=Emoji)
 
 
+class AsyncReactionUsersIterator(DiscordPaginationIterator):
+    """
+    .. versionadded:: 4.5.0
+
+    A class object that allows iterating through the users that reacted to a message with an emoji.
+
+    The next page is already requested while the users of the current one are yielded.
+
+    :param HTTPClient _client: The HTTPClient of the bot
+    :param Union[int, str, Snowflake, Message] obj: The message to get the users from
+    :param Union[int, str, Snowflake] channel_id: The channel of the message
+    :param str emoji: The emoji formatted as `name:id`
+    :param Optional[Union[int, str, Snowflake, User]] start_at: The user ID to start getting users from (gets all users after that user)
+    :param Optional[Callable[[User], Union[bool, Awaitable[bool]]]] check: A check to ignore certain users
+    :param Optional[int] maximum: A set maximum of users to get before stopping the iteration
+    """
+
+    def __init__(
+        self,
+        _client: "HTTPClient",
+        obj: Union[int, str, Snowflake, "Message"],
+        channel_id: Union[int, str, Snowflake],
+        emoji: str,
+        maximum: Optional[int] = inf,
+        start_at: Optional[Union[int, str, Snowflake, User]] = MISSING,
+        check: Optional[Callable[[User], Union[bool, Awaitable[bool]]]] = None,
+    ):
+        super().__init__(obj, _client, maximum=maximum, start_at=start_at, check=check)
+
+        self.channel_id = int(channel_id)
+        self.emoji = emoji
+        self.after: Optional[int] = self.start_at
+
+        self.objects: Deque[User] = deque()
+
+    def _request_page(self) -> Awaitable[List[dict]]:
+        return self._client.get_reactions_of_emoji(
+            channel_id=self.channel_id,
+            message_id=self.object_id,
+            emoji=self.emoji,
+            limit=self._limit,
+            after=self.after,
+        )
+
+    def _parse_page(self, res: List[dict]) -> List[User]:
+        if len(res) < self._limit:
+            # no more users reacted
+            self._stopped = True
+
+        self.object_count += len(res)
+        if self.object_count >= self.maximum:
+            self._stopped = True
+
+        if res:
+            self.after = int(res[-1]["id"])
+
+        return [User(**user, _client=self._client) for user in res]
+
+    async def flatten(self, max: Optional[int] = inf) -> List[User]:
+        """
+        Returns all remaining items of the iterator as list.
+
+        :param Optional[int] max: The maximum amount of users to return
+        :rtype: List[User]
+        """
+        users: List[User] = []
+        if max <= 0:
+            return users
+        async for user in self:
+            users.append(user)
+            if len(users) >= max:
+                self._cancel_prefetch()  # the next page is requested again if the iteration goes on
+                break
+        return users
+
+    async def sample(self, k: int) -> List[User]:
+        """
+        Returns ``k`` random users of the remaining items without keeping all of them in memory.
+
+        :param int k: The amount of users to pick
+        :rtype: List[User]
+        """
+        picked: List[User] = []
+        seen: int = 0
+        async for user in self:
+            seen += 1
+            if len(picked) < k:
+                picked.append(user)
+            elif (index := randrange(seen)) < k:
+                picked[index] = user
+        return picked
+
+
 @define()
 class Message(ClientSerializerMixin, Messageable, IDMixin):
     """
@@ -1192,28 +1290,38 @@ class Message(ClientSerializerMixin, Messageable, IDMixin):
         if not self._client:
             raise LibraryException(code=13)
 
-        _all_users: List[User] = []
-
-        _emoji = emoji.reaction_format if isinstance(emoji, Emoji) else emoji
+        return await self.get_reaction_users(emoji).flatten()
 
-        res: List[dict] = await self._client.get_reactions_of_emoji(
-            channel_id=int(self.channel_id), message_id=int(self.id), emoji=_emoji, limit=100
-        )
+    def get_reaction_users(
+        self,
+        emoji: Union[str, "Emoji"],
+        start_at: Optional[Union[int, str, Snowflake, User]] = MISSING,
+        maximum: Optional[int] = inf,
+        check: Optional[Callable[[User], Union[bool, Awaitable[bool]]]] = None,
+    ) -> AsyncReactionUsersIterator:
+        """
+        .. versionadded:: 4.5.0
 
-        while len(res) == 100:
-            _after = int(res[-1]["id"])
-            _all_users.extend(User(**_) for _ in res)
-            res: List[dict] = await self._client.get_reactions_of_emoji(
-                channel_id=int(self.channel_id),
-                message_id=int(self.id),
-                emoji=_emoji,
-                limit=100,
-                after=_after,
-            )
+        :param Union[str, Emoji] emoji: The Emoji as object or formatted as `name:id`
+        :param Optional[Union[int, str, Snowflake, User]] start_at: The user to begin getting the users after
+        :param Optional[int] maximum: A set maximum of users to get before stopping the iteration
+        :param Optional[Callable[[User], Union[bool, Awaitable[bool]]]] check: A custom check to ignore certain users
 
-        _all_users.extend(User(**_) for _ in res)
+        :return: An asynchronous iterator over the users that reacted with the emoji
+        :rtype: AsyncReactionUsersIterator
+        """
+        if not self._client:
+            raise LibraryException(code=13)
 
-        return _all_users
+        return AsyncReactionUsersIterator(
+            self._client,
+            self,
+            self.channel_id,
+            emoji.reaction_format if isinstance(emoji, Emoji) else emoji,
+            maximum=maximum,
+            start_at=start_at,
+            check=check,
+        )
 
     @classmethod
     async def get_from_url(cls, url: str, client: "HTTPClient") -> "Message":
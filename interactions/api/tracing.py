@@ -0,0 +1,157 @@
+import logging
+from random import random
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from ..base import get_logger
+
+__all__ = ("Span", "TraceSink", "LoggingSink", "Tracer", "tracer")
+
+
+class Span:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing a timed operation of the library.
+
+    :ivar str subsystem: The part of the library the operation belongs to, i.e. ``http`` or ``gateway``.
+    :ivar str name: The name of the operation, i.e. ``request`` or ``bucket_wait``.
+    :ivar float start: When the operation started, as a :func:`time.perf_counter` value.
+    :ivar float duration: How long the operation took, in seconds.
+    :ivar Dict[str, Any] attributes: Details about the operation, i.e. the route of a request.
+    """
+
+    __slots__ = ("subsystem", "name", "start", "duration", "attributes")
+
+    def __init__(
+        self, subsystem: str, name: str, start: float, duration: float, attributes: Dict[str, Any]
+    ) -> None:
+        self.subsystem = subsystem
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.attributes = attributes
+
+    def __repr__(self) -> str:
+        return f"<Span {self.subsystem}.{self.name} {self.duration * 1000:.3f}ms {self.attributes}>"
+
+
+class TraceSink:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing where the spans of the :class:`Tracer` are sent to.
+
+    Subclass it and implement :meth:`emit` to forward spans to a metrics or tracing system.
+    """
+
+    __slots__ = ()
+
+    def emit(self, span: Span) -> None:
+        """
+        Receives a finished span.
+
+        :param Span span: The finished span.
+        """
+        raise NotImplementedError
+
+
+class LoggingSink(TraceSink):
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing a :class:`TraceSink` writing spans to a logger.
+
+    :ivar logging.Logger logger: The logger to write to.
+    :ivar int level: The level to write at.
+    """
+
+    __slots__ = ("logger", "level")
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or get_logger("tracing")
+        self.level = level
+
+    def emit(self, span: Span) -> None:
+        self.logger.log(
+            self.level,
+            "%s.%s took %.3fms %s",
+            span.subsystem,
+            span.name,
+            span.duration * 1000,
+            span.attributes,
+        )
+
+
+class Tracer:
+    """
+    .. versionadded:: 4.5.0
+
+    A class representing the timings collected on the hot paths of the library.
+
+    The tracer is disabled until a sink is configured. While disabled, instrumented code only checks
+    :meth:`sampled` and computes nothing else.
+
+    .. code-block:: python
+
+        interactions.tracer.configure(interactions.LoggingSink(), subsystems=["http"], sample_rate=0.1)
+
+    The ``http`` subsystem emits ``bucket_wait``, ``request`` and ``decode`` spans, the ``gateway``
+    subsystem emits ``decode``, ``send_wait`` and ``dispatch`` spans, the ``channel`` subsystem emits a
+    ``purge`` span per :meth:`Channel.purge` call.
+
+    :ivar Optional[TraceSink] sink: Where the spans are sent to, if enabled.
+    :ivar float sample_rate: The fraction of operations traced, between ``0`` and ``1``.
+    """
+
+    __slots__ = ("sink", "sample_rate", "_subsystems")
+
+    def __init__(self) -> None:
+        self.sink: Optional[TraceSink] = None
+        self.sample_rate: float = 1.0
+        self._subsystems: Optional[FrozenSet[str]] = None
+
+    def configure(
+        self,
+        sink: Optional[TraceSink],
+        subsystems: Optional[Iterable[str]] = None,
+        sample_rate: float = 1.0,
+    ) -> None:
+        """
+        Enables the tracer, or disables it if ``sink`` is ``None``.
+
+        :param Optional[TraceSink] sink: Where to send the spans to.
+        :param Optional[Iterable[str]] subsystems: The subsystems to trace. Defaults to all of them.
+        :param float sample_rate: The fraction of operations to trace. Defaults to ``1.0``.
+        """
+        self.sink = sink
+        self._subsystems = None if subsystems is None else frozenset(subsystems)
+        self.sample_rate = sample_rate
+
+    def sampled(self, subsystem: str) -> bool:
+        """
+        Returns whether to trace an operation of a subsystem, according to the sample rate.
+
+        :param str subsystem: The subsystem of the operation.
+        :rtype: bool
+        """
+        return (
+            self.sink is not None
+            and (self._subsystems is None or subsystem in self._subsystems)
+            and (self.sample_rate >= 1 or random() < self.sample_rate)
+        )
+
+    def emit(self, subsystem: str, name: str, start: float, **attributes) -> None:
+        r"""
+        Sends a span ending now to the sink.
+
+        :param str subsystem: The subsystem of the operation.
+        :param str name: The name of the operation.
+        :param float start: When the operation started, as a :func:`time.perf_counter` value.
+        :param dict \**attributes: Details about the operation.
+        """
+        if self.sink is not None:
+            self.sink.emit(Span(subsystem, name, start, perf_counter() - start, attributes))
+
+
+tracer: Tracer = Tracer()
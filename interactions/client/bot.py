@@ -1,20 +1,34 @@
 import contextlib
+import json
 import logging
+import os
 import re
 import sys
-from asyncio import AbstractEventLoop, CancelledError, get_event_loop, iscoroutinefunction, wait_for
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Semaphore,
+    gather,
+    get_event_loop,
+    iscoroutinefunction,
+    sleep,
+    wait_for,
+)
 from functools import wraps
 from importlib import import_module
 from importlib.util import resolve_name
 from inspect import getmembers, isawaitable
 from types import ModuleType
-from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Tuple, Union, TYPE_CHECKING, Type
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Pattern, Tuple, Union, TYPE_CHECKING, Type
 from contextlib import suppress
 
 from ..api import WebSocketClient as WSClient
-from ..api.cache import Cache
+from ..api.cache import BackendFactory, Cache
+from ..api.codec import JSONCodec
+from ..api.dispatch import ComponentRouter
 from ..api.error import LibraryException
 from ..api.http.client import HTTPClient
+from ..api.http.options import HTTPOptions
 from ..api.models.channel import Channel
 from ..api.models.flags import Intents, Permissions
 from ..api.models.guild import Guild
@@ -69,6 +83,36 @@ class Client:
         .. versionadded:: 4.3.2
 
         Set to ``True`` to enable debug logging or set to a log level to use a specific level
+    :param Optional[int] sync_concurrency:
+        .. versionadded:: 4.5.0
+
+        The maximum amount of guilds whose commands are overwritten at the same time during synchronization. Defaults to ``5``.
+    :param Optional[int] sync_retries:
+        .. versionadded:: 4.5.0
+
+        How many times overwriting the commands of a guild is retried on server errors. Defaults to ``3``.
+    :param Optional[str] session_path:
+        .. versionadded:: 4.5.0
+
+        The path of a file to persist the gateway session to when the client stops, and to resume it from on the next
+        start instead of identifying. As a resumed session does not replay ``GUILD_CREATE`` events, this is best combined
+        with :meth:`.Cache.snapshot` and :meth:`.Cache.restore`.
+    :param Optional[Callable[[Cache, Type, Optional[int]], StorageBackend]] cache_backend:
+        .. versionadded:: 4.5.0
+
+        A factory creating the backend of each cache storage, such as :meth:`.SQLiteBackend.factory`. Defaults to keeping the items in memory.
+    :param Optional[JSONCodec] json_codec:
+        .. versionadded:: 4.5.0
+
+        The codec encoding and decoding the JSON payloads of the HTTP and Gateway clients. Defaults to orjson if installed, or the standard library otherwise.
+    :param Optional[HTTPOptions] http_options:
+        .. versionadded:: 4.5.0
+
+        The connection pool and timeout options of the HTTP client. Use ``HTTPOptions(shared=True)`` to share one connection pool between clients running in the same process.
+    :param Optional[float] http_cache_ttl:
+        .. versionadded:: 4.5.0
+
+        How long objects fetched over HTTP by :func:`.get` stay in the cache, in seconds, unless a gateway event updates or deletes them first. ``None`` does not cache them. Defaults to ``60``.
 
     :ivar Application me: The application representation of the client.
     """
@@ -84,6 +128,13 @@ class Client:
         disable_sync: bool = False,
         command_context: Type["_Context"] = CommandContext,
         component_context: Type["_Context"] = ComponentContext,
+        sync_concurrency: int = 5,
+        sync_retries: int = 3,
+        session_path: Optional[str] = None,
+        cache_backend: Optional[BackendFactory] = None,
+        json_codec: Optional[JSONCodec] = None,
+        http_options: Optional[HTTPOptions] = None,
+        http_cache_ttl: Optional[float] = 60.0,
         **kwargs,
     ) -> None:
         self._loop: AbstractEventLoop = get_event_loop()
@@ -95,9 +146,18 @@ class Client:
         self._presence = presence
         self._extensions = {}
         self._scopes = set()
+        self._component_router = ComponentRouter()
+        self._sync_concurrency = sync_concurrency
+        self._sync_retries = sync_retries
+        self._session_path = session_path
+        self._json_codec = json_codec
+        self._http_options = http_options
         self.__command_coroutines = []
         self.__global_commands = {}
         self.__guild_commands = {}
+        self.__command_ids: Dict[str, int] = {}  # name -> id
+        self.__defer_sync: bool = False  # set while reloading an extension
+        self.__commands_by_id: Dict[int, Union[dict, ApplicationCommand]] = {}  # id -> command
 
         self.me: Optional[Application] = None
         self.__id_autocomplete = {}
@@ -117,12 +177,13 @@ class Client:
                 Message: 1000,  # Most users won't need to cache many messages
             }
 
-        self.cache: Cache = Cache(cache_limits)
+        self.cache: Cache = Cache(cache_limits, backend=cache_backend, http_ttl=http_cache_ttl)
         self._websocket: WSClient = WSClient(
             cache=self.cache,
             intents=self._intents,
             shards=self._shards,
             presence=self._presence,
+            codec=self._json_codec,
         )
 
         if _logging := kwargs.get("logging", _logging):
@@ -168,21 +229,17 @@ class Client:
             _name = f"command_{_context.data.name}"
 
             if options := _context.data.options:
-                for option in options:
-                    _type = self.__option_type_context(
-                        _context,
-                        option.type.value,
-                    )
-                    if _type:
-                        _type[option.value]._client = self._http
-                        option.value = _type[option.value]
-                    _option = self.__sub_command_context(option, _context)
-                    __kwargs.update(_option)
+                __kwargs, _ = self.__resolve_options(_context, options)
 
             self._websocket._dispatch.dispatch("on_command", _context)
         elif data["type"] == InteractionType.MESSAGE_COMPONENT:
             _name = f"component_{_context.data.custom_id}"
 
+            if _name not in self._websocket._dispatch.events and (
+                _route := self._component_router.match(_context.data.custom_id)
+            ):
+                _name, __kwargs = _route
+
             if values := _context.data.values:
                 if _context.data.component_type.value not in {5, 6, 7, 8}:
                     __args.append(values)
@@ -196,34 +253,21 @@ class Client:
                     __args.append(_list)
 
             self._websocket._dispatch.dispatch("on_component", _context)
+            if waiters := self._websocket._dispatch.waiters.get("on_component"):
+                waiters.resolve(
+                    (
+                        ("custom_id", _context.data.custom_id),
+                        ("message_id", int(_context.message.id)),
+                    ),
+                    _context,
+                )
         elif data["type"] == InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE:
             _name = f"autocomplete_{_context.data.name}"
 
-            for option in _context.data.options:
-                if option.type not in (
-                    OptionType.SUB_COMMAND,
-                    OptionType.SUB_COMMAND_GROUP,
-                ):
-                    if option.focused:
-                        _name += f"_{option.name}"
-                        __args.append(option.value)
-                        break
-
-                elif option.type == OptionType.SUB_COMMAND:
-                    for _option in option.options:
-                        if _option.focused:
-                            _name += f"_{_option.name}"
-                            __args.append(_option.value)
-                            break
-
-                elif option.type == OptionType.SUB_COMMAND_GROUP:
-                    for _option in option.options:
-                        for __option in _option.options:
-                            if __option.focused:
-                                _name += f"_{__option.name}"
-                                __args.append(__option.value)
-                                break
-                        break
+            _, focused = self.__resolve_options(_context, _context.data.options, resolve=False)
+            if focused is not None:
+                _name += f"_{focused.name}"
+                __args.append(focused.value)
 
             self._websocket._dispatch.dispatch("on_autocomplete", _context)
         elif data["type"] == InteractionType.MODAL_SUBMIT:
@@ -238,6 +282,8 @@ class Client:
             )
 
             self._websocket._dispatch.dispatch("on_modal", _context)
+            if waiters := self._websocket._dispatch.waiters.get("on_modal"):
+                waiters.resolve((("custom_id", _context.data.custom_id),), _context)
 
         self._websocket._dispatch.dispatch(_name, *__args, **__kwargs)
         self._websocket._dispatch.dispatch("on_interaction", _context)
@@ -266,111 +312,81 @@ class Client:
         elif data["type"] == InteractionType.MESSAGE_COMPONENT:
             return self.component_context(**data)
 
-    def __sub_command_context(self, option: Option, context: "_Context") -> Union[Tuple[str], dict]:
+    def __resolve_options(
+        self, context: "_Context", options: List[Option], resolve: bool = True
+    ) -> Tuple[dict, Optional[Option]]:
         """
-        Checks if an application command schema has sub commands
-        needed for argument collection.
+        Walks the option tree of an interaction once and collects the arguments for the command.
 
-        :param Option option: The option object
-        :param _Context context: The context to refer subcommands from.
-        :return: A dictionary of the collected options, if any.
-        :rtype: Union[Tuple[str], dict]
+        :param _Context context: The context to refer resolved objects from.
+        :param List[Option] options: The options of the interaction data.
+        :param bool resolve: Whether to replace the IDs of options with their resolved objects.
+        :return: The collected keyword arguments and the focused option, if any.
+        :rtype: Tuple[dict, Optional[Option]]
         """
         __kwargs: dict = {}
+        focused: Optional[Option] = None
 
-        def _check_auto(_option: Option) -> Optional[Tuple[str]]:
-            return (_option.name, _option.value) if _option.focused else None
-
-        check = _check_auto(option)
-
-        if check:
-            return check
-        if options := option.options:
-            if option.type == OptionType.SUB_COMMAND:
-                __kwargs["sub_command"] = option.name
-
-                for sub_option in options:
-                    _check = _check_auto(sub_option)
-                    _type = self.__option_type_context(
-                        context,
-                        sub_option.type,
-                    )
-
-                    if _type:
-                        _type[sub_option.value]._client = self._http
-                        sub_option.value = _type[sub_option.value]
-                    if _check:
-                        return _check
-
-                    __kwargs[sub_option.name] = sub_option.value
-            elif option.type == OptionType.SUB_COMMAND_GROUP:
-                __kwargs["sub_command_group"] = option.name
-                for _group_option in option.options:
-                    _check_auto(_group_option)
-                    __kwargs["sub_command"] = _group_option.name
-
-                    for sub_option in _group_option.options:
-                        _check = _check_auto(sub_option)
-                        _type = self.__option_type_context(
-                            context,
-                            sub_option.type,
-                        )
+        def _walk(_options: List[Option]) -> None:
+            nonlocal focused
 
-                        if _type:
-                            _type[sub_option.value]._client = self._http
-                            sub_option.value = _type[sub_option.value]
-                        if _check:
-                            return _check
-
-                        __kwargs[sub_option.name] = sub_option.value
-
-        elif option.type == OptionType.SUB_COMMAND:
-            # sub_command_groups must have options so there is no extra check needed for those
-            __kwargs["sub_command"] = option.name
+            for option in _options:
+                if option.type == OptionType.SUB_COMMAND_GROUP:
+                    __kwargs["sub_command_group"] = option.name
+                    _walk(option.options or [])
+                elif option.type == OptionType.SUB_COMMAND:
+                    __kwargs["sub_command"] = option.name
+                    _walk(option.options or [])
+                elif option.focused:
+                    focused = option
+                elif option.name is not None and option.value is not None:
+                    if resolve:
+                        option.value = self.__resolve_option_value(context, option)
+                    __kwargs[option.name] = option.value
 
-        elif (name := option.name) is not None and (value := option.value) is not None:
-            __kwargs[name] = value
+        _walk(options)
 
-        return __kwargs
+        return __kwargs, focused
 
-    def __option_type_context(self, context: "_Context", type: int) -> dict:
+    def __resolve_option_value(self, context: "_Context", option: Option) -> Any:
         """
-        Looks up the type of option respective to the existing
-        option types.
+        Looks up the resolved object of an option in the interaction data, if its type references one.
 
-        :param _Context context: The context to refer types from.
-        :param int type: The option type.
-        :return: The option type context.
-        :rtype: dict
+        :param _Context context: The context to refer resolved objects from.
+        :param Option option: The option to resolve.
+        :return: The resolved object, or the raw value if there is none.
+        :rtype: Any
         """
-        _resolved = {}
-        if type == OptionType.USER.value:
-            _resolved = (
-                context.data.resolved.members if context.guild_id else context.data.resolved.users
-            )
-            if context.guild_id:
-                with suppress(AttributeError):  # edge-case
-                    for key in _resolved.keys():
-                        _resolved[key]._extras["guild_id"] = context.guild_id
-        elif type == OptionType.CHANNEL.value:
-            _resolved = context.data.resolved.channels
-        elif type == OptionType.ROLE.value:
-            _resolved = context.data.resolved.roles
-        elif type == OptionType.ATTACHMENT.value:
-            _resolved = context.data.resolved.attachments
-        elif type == OptionType.MENTIONABLE.value:
-            _roles = context.data.resolved.roles if context.data.resolved.roles is not None else {}
-            _members = (
-                context.data.resolved.members if context.guild_id else context.data.resolved.users
-            )
-            if context.guild_id:
-                with suppress(AttributeError):  # edge-case
-                    for member in _members.values():
-                        member._extras["guild_id"] = context.guild_id
+        _type = option.type
+        if _type not in (
+            OptionType.USER,
+            OptionType.CHANNEL,
+            OptionType.ROLE,
+            OptionType.MENTIONABLE,
+            OptionType.ATTACHMENT,
+        ) or not (resolved := context.data.resolved):
+            return option.value
+
+        _id = str(option.value)
+        _object = None
+
+        if _type in (OptionType.USER, OptionType.MENTIONABLE):
+            if context.guild_id and (_object := resolved.members.get(_id)) is not None:
+                _object._extras["guild_id"] = context.guild_id
+            else:
+                _object = resolved.users.get(_id)
+        if _type in (OptionType.ROLE, OptionType.MENTIONABLE) and _object is None:
+            _object = resolved.roles.get(_id)
+        elif _type == OptionType.CHANNEL:
+            _object = resolved.channels.get(_id)
+        elif _type == OptionType.ATTACHMENT:
+            _object = resolved.attachments.get(_id)
 
-            _resolved = _members | _roles
+        if _object is None:
+            return option.value
 
-        return _resolved
+        _object._client = self._http
+        return _object
 
     def __select_option_type_context(self, context: "_Context", type: int) -> dict:
         """
@@ -648,6 +664,8 @@ class Client:
                         if command.get(attr, None) is None and data.get(attr) == {}:
                             # This is an API/Version difference.
                             continue
+                        if command.get(attr) == data.get(attr):
+                            continue
 
                     elif (
                         attr == "dm_permission"
@@ -685,8 +703,9 @@ class Client:
             |   |___ CALLBACK
             LOOP
         """
-        self._http = HTTPClient(token, self.cache)
+        self._http = HTTPClient(token, self.cache, self._json_codec, self._http_options)
         self._websocket._http = self._http
+        self.__load_session()
 
         data = await self._http.get_current_bot_information()
         self.me = Application(**data, _client=self._http)
@@ -739,8 +758,11 @@ class Client:
         self._websocket.ready.clear()  # Clears ready state.
         self._websocket._closing_lock.set()  # Toggles the "ready-to-shutdown" state for the bot.
         # And subsequently, the processes will close itself.
+        self.__save_session()
+        # a session closed with 1000 cannot be resumed
+        await self._websocket.close(code=4000 if self._session_path else 1000)
 
-        await self._http._req._session.close()  # Closes the HTTP session associated with the client.
+        await self._http._req.close()  # Closes the HTTP session associated with the client.
 
     async def _login(self) -> None:
         """Makes a login with the Discord API."""
@@ -765,7 +787,9 @@ class Client:
                     if self._websocket._client is not None:
                         # This needs to be properly closed
                         try:
-                            await self._websocket._client.close(code=1000)
+                            await self._websocket._client.close(
+                                code=4000 if self._session_path else 1000
+                            )
                         finally:
                             self._websocket._client = None
 
@@ -849,6 +873,29 @@ class Client:
 
             self.__guild_commands[_id] = {"commands": _cmds, "clean": True}
 
+        self.__index_commands()
+
+    def __index_commands(self) -> None:
+        """
+        Rebuilds the name and ID indexes used by :meth:`_find_command` from the synchronised commands.
+
+        Global commands take precedence over guild commands sharing their name. The
+        :class:`ApplicationCommand` models are only built once they are looked up.
+        """
+        self.__command_ids = {}
+        self.__commands_by_id = {}
+
+        for commands in (
+            self.__global_commands.get("commands", []),
+            *(_guild["commands"] for _guild in self.__guild_commands.values()),
+        ):
+            for _command in commands:
+                if not _command.get("id"):
+                    continue
+                _id = int(_command["id"])
+                self.__command_ids.setdefault(_command["name"], _id)
+                self.__commands_by_id[_id] = _command
+
     def __resolve_commands(self) -> None:  # sourcery skip: low-code-quality
         """
         Resolves all commands to the command coroutines.
@@ -963,8 +1010,8 @@ class Client:
                     for _guild_command in coro._command_data:
                         _guild_id = int(_guild_command.get("guild_id"))
                         if _guild_id in __blocked_guilds:
-                            log.fatal(f"Cannot sync commands on guild with id {_guild_id}!")
-                            raise LibraryException(50001, message="Missing Access |")
+                            log.error(f"Cannot sync commands on guild with id {_guild_id}!")
+                            continue
                         if _guild_command["name"] not in __check_guild_commands[_guild_id]:
                             self.__guild_commands[_guild_id]["clean"] = False
                             self.__guild_commands[_guild_id]["commands"].append(_guild_command)
@@ -1045,25 +1092,105 @@ class Client:
                     )
                     del self.__guild_commands[_id]["commands"][_pos]
 
-        if not self.__global_commands["clean"] or any(
-            not self.__guild_commands[_id]["clean"] for _id in _guild_ids
-        ):
-            if not self.__global_commands["clean"]:
+        if not self.__global_commands["clean"]:
+            res = await self._http.overwrite_application_command(
+                application_id=int(self.me.id), data=self.__global_commands["commands"]
+            )
+            self.__global_commands["clean"] = True
+            self.__global_commands["commands"] = res
+
+        await self.__sync_guild_commands(_guild_ids, __blocked_guilds)
+
+        self.__index_commands()
+
+    async def __sync_guild_commands(
+        self, guild_ids: List[int], blocked_guilds: set
+    ) -> Dict[str, List[int]]:
+        """
+        Overwrites the commands of every guild that is not clean, ``sync_concurrency`` guilds at a time.
+
+        A guild failing to synchronise does not abort the others. The progress of each guild is dispatched
+        as ``on_command_sync_progress`` with the guild ID, its status and the amount of processed and total guilds,
+        and the aggregated results are dispatched as ``on_command_sync``.
+
+        .. warning::
+            This is an internal method. Do not call it unless you know what you are doing!
+
+        :param List[int] guild_ids: The IDs of the guilds to synchronise
+        :param set blocked_guilds: The IDs of the guilds the application cannot access
+        :return: The IDs of the guilds that succeeded, failed or were skipped
+        :rtype: Dict[str, List[int]]
+        """
+        results: Dict[str, List[int]] = {"succeeded": [], "failed": [], "skipped": []}
+        results["skipped"].extend(blocked_guilds)
+
+        _pending: List[int] = []
+        for _id in guild_ids:
+            (results["skipped"] if self.__guild_commands[_id]["clean"] else _pending).append(_id)
+
+        semaphore = Semaphore(self._sync_concurrency)
+
+        async def _sync(guild_id: int) -> None:
+            async with semaphore:
+                succeeded = await self.__overwrite_guild_commands(guild_id)
+
+            status = "succeeded" if succeeded else "failed"
+            results[status].append(guild_id)
+            self._websocket._dispatch.dispatch(
+                "on_command_sync_progress",
+                guild_id,
+                status,
+                len(results["succeeded"]) + len(results["failed"]),
+                len(_pending),
+            )
+
+        await gather(*(_sync(_id) for _id in _pending))
+
+        log.debug(
+            f"Synced commands of {len(results['succeeded'])} guilds, "
+            f"{len(results['failed'])} failed and {len(results['skipped'])} skipped"
+        )
+        self._websocket._dispatch.dispatch("on_command_sync", results)
+
+        return results
+
+    async def __overwrite_guild_commands(self, guild_id: int) -> bool:
+        """
+        Overwrites the commands of a guild, retrying on server and connection errors.
+
+        :param int guild_id: The ID of the guild to synchronise
+        :return: Whether the commands were overwritten
+        :rtype: bool
+        """
+        for tries in range(self._sync_retries + 1):
+            try:
                 res = await self._http.overwrite_application_command(
-                    application_id=int(self.me.id), data=self.__global_commands["commands"]
+                    application_id=int(self.me.id),
+                    data=self.__guild_commands[guild_id]["commands"],
+                    guild_id=guild_id,
                 )
-                self.__global_commands["clean"] = True
-                self.__global_commands["commands"] = res
-
-            for _id in _guild_ids:
-                if not self.__guild_commands[_id]["clean"]:
-                    res = await self._http.overwrite_application_command(
-                        application_id=int(self.me.id),
-                        data=self.__guild_commands[_id]["commands"],
-                        guild_id=_id,
-                    )
-                    self.__guild_commands[_id]["clean"] = True
-                    self.__guild_commands[_id]["commands"] = res
+            except LibraryException as e:
+                if not 500 <= (e.status or 0) < 600:
+                    log.error(f"Could not sync commands on guild with id {guild_id}: {e.message}")
+                    return False
+                res = None
+            except OSError:
+                res = None
+
+            # a server error without a JSON body is not raised, but returns no commands either
+            if isinstance(res, list):
+                self.__guild_commands[guild_id]["clean"] = True
+                self.__guild_commands[guild_id]["commands"] = res
+                return True
+
+            if tries < self._sync_retries:
+                await sleep(2**tries)
+
+        log.error(
+            f"Could not sync commands on guild with id {guild_id} "
+            f"after {self._sync_retries + 1} attempts!"
+        )
+        return False
 
     def event(
         self, coro: Optional[Callable[..., Coroutine]] = MISSING, *, name: Optional[str] = MISSING
@@ -1531,7 +1658,7 @@ class Client:
         return decorator
 
     def component(
-        self, component: Union[str, Button, SelectMenu]
+        self, component: Union[str, Pattern, Button, SelectMenu]
     ) -> Callable[[Callable[..., Coroutine]], Callable[..., Coroutine]]:
         """
         A decorator for listening to ``INTERACTION_CREATE`` dispatched gateway
@@ -1555,63 +1682,53 @@ class Client:
             async def button_response(ctx):
                 ...
 
+            # Method 3
+            @bot.component(interactions.ComponentPattern("page:{page}:next"))
+            async def next_page(ctx, page: str):
+                ...
+
         The context of the component callback decorator inherits the same
         as of the command decorator.
 
-        :param Union[str, Button, SelectMenu] component: The component you wish to callback for.
+        .. versionchanged:: 4.5.0
+            :class:`.ComponentPattern` s with ``{name}`` placeholders and compiled regular expressions are matched as
+            patterns by the :class:`.ComponentRouter`. Callbacks of exact ``custom_id`` s take precedence over patterns.
+
+        :param Union[str, Pattern, Button, SelectMenu] component: The component you wish to callback for.
         :return: A callable response.
         :rtype: Callable[[Callable[..., Coroutine]], Callable[..., Coroutine]]
         """
 
         def decorator(coro: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
-            payload: str = (
-                _component(component).custom_id
-                if isinstance(component, (Button, SelectMenu))
-                else component
-            )
-            return self.event(coro, name=f"component_{payload}")
+            if isinstance(component, (Button, SelectMenu)):
+                return self.event(coro, name=f"component_{_component(component).custom_id}")
+            if ComponentRouter.is_pattern(component):
+                return self.event(coro, name=self._component_router.add(component))
+            return self.event(coro, name=f"component_{component}")
 
         return decorator
 
     def _find_command(self, command: Union[str, int]) -> ApplicationCommand:
         """
-        Iterates over `commands` and returns an :class:`ApplicationCommand` if it matches the name from `command`
+        Looks up the synchronised commands and returns an :class:`ApplicationCommand` if it matches the name or ID from `command`
 
         :param Union[str, int] command: The name or ID of the command to match
         :return: An ApplicationCommand model
         :rtype: ApplicationCommand
         """
-        key = "name" if isinstance(command, str) else "id"
-        _command_obj = next(
-            (
-                ApplicationCommand(**_command)
-                for _command in self.__global_commands["commands"]
-                if str(_command[key]) == str(command)
-            ),
-            None,
-        )
+        _id = self.__command_ids.get(command) if isinstance(command, str) else int(command)
+        _command_obj = self.__commands_by_id.get(_id)
 
-        if not _command_obj:
-            for scope in self._scopes:
-                _command_obj = next(
-                    (
-                        ApplicationCommand(**_command)
-                        for _command in self.__guild_commands[scope]["commands"]
-                        if str(_command[key]) == str(command)
-                    ),
-                    None,
-                )
-                if _command_obj:
-                    break
-
-        if not _command_obj or (hasattr(_command_obj, "id") and not _command_obj.id):
+        if _command_obj is None:
             raise LibraryException(
                 6,
                 message="The command does not exist. Make sure to define"
                 + " your autocomplete callback after your commands",
             )
-        else:
-            return _command_obj
+
+        if isinstance(_command_obj, dict):
+            _command_obj = self.__commands_by_id[_id] = ApplicationCommand(**_command_obj)
+        return _command_obj
 
     def autocomplete(
         self, command: Union[ApplicationCommand, int, str, Snowflake], name: str
@@ -1794,14 +1911,13 @@ class Client:
 
         "Reloads" an extension off of current client from an import resolve.
 
-        .. warning::
-            This will remove and re-add application commands, counting towards your daily application
-            command creation limit, as long as you have the ``remove_commands`` argument set to ``True``, which it is by
-            default.
+        .. versionchanged:: 4.5.0
+            The handlers of the extension are swapped at once, and only the application commands of the extension
+            that were added, changed or removed are synchronised, instead of all of them.
 
         :param str name: The name of the extension
         :param Optional[str] package: The package of the extension
-        :param Optional[bool] remove_commands: Whether to remove commands before reloading. Defaults to True
+        :param Optional[bool] remove_commands: Whether to remove the commands that are no longer part of the extension. Defaults to True
         :param tuple \*args: Optional arguments to pass to the extension
         :param dict \**kwargs: Optional keyword-only arguments to pass to the extension.
         :return: The reloaded extension.
@@ -1814,8 +1930,171 @@ class Client:
             log.warning(f"Extension {name} could not be reloaded because it was never loaded.")
             return self.load(name, package)
 
-        self.remove(name, package=package, remove_commands=remove_commands)
-        return self.load(name, package, *args, **kwargs)
+        _old: List[Extension] = self.__get_extensions(extension)
+        _old_commands = self.__get_extension_commands(_old)
+
+        # Nothing below yields to the event loop until the new extension is loaded,
+        # so no interaction can be dispatched while neither version is registered.
+        _events = self._websocket._dispatch.events
+        _state = (
+            {event: list(funcs) for event, funcs in _events.items()},
+            list(self._commands),
+            list(self.__command_coroutines),
+            dict(self._extensions),
+            self._component_router.copy(),
+        )
+
+        for _extension in _old:
+            _extension._detach()
+        del self._extensions[_name]
+
+        self.__defer_sync = True
+        try:
+            new_extension = self.load(name, package, *args, **kwargs)
+        except Exception:
+            log.error(f"Could not reload {name}, restoring the previous version.")
+            _events.clear()
+            _events.update(_state[0])
+            self._commands[:] = _state[1]
+            self.__command_coroutines[:] = _state[2]
+            self._extensions.clear()
+            self._extensions.update(_state[3])
+            self._component_router = _state[4]
+            raise
+        finally:
+            self.__defer_sync = False
+
+        if self._websocket.ready.is_set() and self._automate_sync:
+            _new_commands = self.__get_extension_commands(
+                self.__get_extensions(self._extensions.get(_name))
+            )
+            self._loop.create_task(
+                self.__sync_extension_commands(_old_commands, _new_commands, remove_commands)
+            )
+
+        return new_extension
+
+    def __get_extensions(
+        self, extension: Union[ModuleType, "Extension", None]
+    ) -> List["Extension"]:
+        """
+        Returns the :class:`Extension` instances of a loaded module or extension.
+
+        :param Union[ModuleType, Extension, None] extension: The loaded module or extension
+        :rtype: List[Extension]
+        """
+        if isinstance(extension, Extension):
+            return [extension]
+        if not isinstance(extension, ModuleType):
+            return []
+
+        return [
+            self._extensions[ext_name]
+            for ext_name, _ in getmembers(
+                extension, lambda x: isinstance(x, type) and issubclass(x, Extension)
+            )
+            if ext_name != "Extension" and isinstance(self._extensions.get(ext_name), Extension)
+        ]
+
+    def __get_extension_commands(
+        self, extensions: List["Extension"]
+    ) -> Dict[Tuple[Optional[int], str, int], dict]:
+        """
+        Returns the data of the application commands of extensions, keyed by scope, name and type.
+
+        :param List[Extension] extensions: The extensions to get the commands of
+        :rtype: Dict[Tuple[Optional[int], str, int], dict]
+        """
+        _names = {cmd.split("_", 1)[1] for _extension in extensions for cmd in _extension._commands}
+        commands: Dict[Tuple[Optional[int], str, int], dict] = {}
+
+        for coro in self.__command_coroutines:
+            if coro._name not in _names:
+                continue
+            _data = coro._command_data
+            for data in _data if isinstance(_data, list) else [_data]:
+                _guild_id = int(data["guild_id"]) if data.get("guild_id") else None
+                commands[(_guild_id, data["name"], int(data.get("type", 1)))] = data
+
+        return commands
+
+    async def __sync_extension_commands(
+        self,
+        old: Dict[Tuple[Optional[int], str, int], dict],
+        new: Dict[Tuple[Optional[int], str, int], dict],
+        remove_commands: bool = True,
+    ) -> None:
+        """
+        Creates, edits and deletes only the application commands that changed between two versions of an extension.
+
+        .. warning::
+            This is an internal method. Do not call it unless you know what you are doing!
+
+        :param Dict[Tuple[Optional[int], str, int], dict] old: The commands of the previous version
+        :param Dict[Tuple[Optional[int], str, int], dict] new: The commands of the new version
+        :param bool remove_commands: Whether to delete the commands that are no longer part of the extension
+        """
+        _app_id = int(self.me.id)
+
+        def _find(
+            guild_id: Optional[int], name: str, type: int
+        ) -> Tuple[List[dict], Optional[dict]]:
+            _scope: dict = (
+                self.__guild_commands.setdefault(guild_id, {"commands": [], "clean": True})
+                if guild_id
+                else self.__global_commands
+            )
+            pool: List[dict] = _scope.setdefault("commands", [])
+            synced = next(
+                (
+                    _command
+                    for _command in pool
+                    if _command["name"] == name and int(_command.get("type", 1)) == type
+                ),
+                None,
+            )
+            return pool, synced
+
+        for (guild_id, name, type), data in new.items():
+            pool, synced = _find(guild_id, name, type)
+            try:
+                if synced is None:
+                    pool.append(
+                        await self._http.create_application_command(_app_id, data, guild_id)
+                    )
+                    log.debug(f"Created command {name} on scope {guild_id or 'global'}.")
+                    continue
+
+                clean, _ = await self.__compare_sync(data, [synced])
+                if not clean:
+                    pool[pool.index(synced)] = await self._http.edit_application_command(
+                        _app_id, data, int(synced["id"]), guild_id
+                    )
+                    log.debug(f"Edited command {name} on scope {guild_id or 'global'}.")
+            except LibraryException as e:
+                log.error(
+                    f"Could not sync command {name} on scope {guild_id or 'global'}: {e.message}"
+                )
+
+        if remove_commands:
+            for guild_id, name, type in old.keys() - new.keys():
+                pool, synced = _find(guild_id, name, type)
+                if synced is None:
+                    continue
+                try:
+                    await self._http.delete_application_command(
+                        _app_id, int(synced["id"]), guild_id
+                    )
+                except LibraryException as e:
+                    log.error(
+                        f"Could not delete command {name} on scope {guild_id or 'global'}: "
+                        f"{e.message}"
+                    )
+                else:
+                    pool.remove(synced)
+                    log.debug(f"Deleted command {name} on scope {guild_id or 'global'}.")
+
+        self.__index_commands()
 
     def get_extension(self, name: str) -> Optional[Union[ModuleType, "Extension"]]:
         """
@@ -1889,9 +2168,53 @@ class Client:
         )
 
     async def _logout(self) -> None:
-        await self._websocket.close()
+        # a session closed with 1000 cannot be resumed
+        await self._websocket.close(code=4000 if self._session_path else 1000)
+        self.__save_session()
         await self._http._req.close()
 
+    def __load_session(self) -> None:
+        """Loads the gateway session persisted by :meth:`__save_session`, if any."""
+        if not self._session_path:
+            return
+
+        try:
+            with open(self._session_path, "r") as file:
+                data: dict = json.load(file)
+            os.remove(self._session_path)  # a session can only be resumed once
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning(f"Could not load the session from {self._session_path}: {e}")
+            return
+
+        self._websocket.session_id = data.get("session_id")
+        self._websocket.sequence = data.get("sequence")
+        self._websocket.resume_url = data.get("resume_url")
+        log.debug(f"Loaded session {self._websocket.session_id} to resume.")
+
+    def __save_session(self) -> None:
+        """Persists the gateway session to resume it on the next start."""
+        if not self._session_path or not self._websocket.resumable:
+            return
+
+        _tmp = f"{self._session_path}.tmp"
+        try:
+            with open(_tmp, "w") as file:
+                json.dump(
+                    {
+                        "session_id": self._websocket.session_id,
+                        "sequence": self._websocket.sequence,
+                        "resume_url": self._websocket.resume_url,
+                    },
+                    file,
+                )
+            os.replace(_tmp, self._session_path)
+        except OSError as e:
+            log.warning(f"Could not save the session to {self._session_path}: {e}")
+        else:
+            log.debug(f"Saved session {self._websocket.session_id} to {self._session_path}.")
+
     async def wait_for(
         self,
         name: str,
@@ -1935,6 +2258,31 @@ class Client:
         if res:
             return res[0] if len(res) == 1 else res
 
+    async def __wait_for_indexed(
+        self,
+        name: str,
+        keys: List[Tuple[str, Union[str, int]]],
+        check: Optional[Callable[..., Union[bool, Awaitable[bool]]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Waits for an interaction event whose ``custom_id`` or message ID is one of the given keys.
+
+        Unlike :meth:`wait_for`, the waiter is only checked for interactions matching its keys and is removed
+        from the index once it is done, including after a timeout.
+
+        :param str name: The event to wait for
+        :param List[Tuple[str, Union[str, int]]] keys: The keys to index the waiter by
+        :param Optional[Callable[..., Union[bool, Awaitable[bool]]]] check: A function or coroutine to call, which should return a truthy value if the data should be returned
+        :param float timeout: How long to wait for the event before raising an error
+        :return: The value of the dispatched event
+        :rtype: Any
+        """
+        fut = self._websocket._dispatch.get_waiters(name).add(keys, check=check)
+        # asyncio's wait_for cancels the future on timeout, which drops it from the index
+        res: tuple = await wait_for(fut, timeout=timeout)
+        return res[0] if len(res) == 1 else res
+
     async def wait_for_component(
         self,
         components: Union[
@@ -2000,14 +2348,19 @@ class Client:
             else:  # account for plain ints, string, or Snowflakes
                 messages_ids.append(int(messages))
 
-        def _check(ctx: ComponentContext) -> bool:
-            if custom_ids and ctx.data.custom_id not in custom_ids:
-                return False
-            if messages_ids and int(ctx.message.id) not in messages_ids:
+        # index by the most selective key and filter the other one in the check
+        if custom_ids:
+            keys = [("custom_id", custom_id) for custom_id in custom_ids]
+        else:
+            keys = [("message_id", message_id) for message_id in messages_ids]
+        _messages_ids = set(messages_ids) if custom_ids else None
+
+        def _check(ctx: ComponentContext) -> Union[bool, Awaitable[bool]]:
+            if _messages_ids and int(ctx.message.id) not in _messages_ids:
                 return False
             return check(ctx) if check else True
 
-        return await self.wait_for("on_component", check=_check, timeout=timeout)
+        return await self.__wait_for_indexed("on_component", keys, check=_check, timeout=timeout)
 
     async def wait_for_select(
         self,
@@ -2042,8 +2395,8 @@ class Client:
         :rtype: Tuple[ComponentContext, Union[List[str], List[Member], List[User], List[Channel], List[Role]]]
         """
 
-        def _check(_ctx: ComponentContext) -> bool:
-            if _ctx.data.component_type.value not in {4, 5, 6, 7, 8}:
+        def _check(_ctx: ComponentContext) -> Union[bool, Awaitable[bool]]:
+            if _ctx.data.component_type.value not in {3, 5, 6, 7, 8}:
                 return False
             return check(_ctx) if check else True
 
@@ -2051,13 +2404,11 @@ class Client:
             components, messages, check=_check, timeout=timeout
         )
 
-        if ctx.data.component_type == 4:
+        if ctx.data.component_type == 3:
             return ctx, ctx.data.values
 
         _list = []  # temp storage for items
-        _data = self._websocket._WebSocketClient__select_option_type_context(
-            ctx, ctx.data.component_type.value
-        )  # resolved.
+        _data = self.__select_option_type_context(ctx, ctx.data.component_type.value)  # resolved.
         for value in ctx.data.values:
             _list.append(_data[value])
         return ctx, _list
@@ -2098,17 +2449,17 @@ class Client:
                 if isinstance(modal, Modal):
                     ids.append(str(modal.custom_id))
                 elif isinstance(modal, str):
-                    modals.append(modal)
+                    ids.append(modal)
 
         if not all(isinstance(id, str) for id in ids):
             raise TypeError("No modals were passed!")
 
-        def _check(ctx: CommandContext):
-            if ids and ctx.data.custom_id not in ids:
-                return False
-            return check(ctx) if check else True
-
-        ctx: CommandContext = await self.wait_for("on_modal", check=_check, timeout=timeout)
+        ctx: CommandContext = await self.__wait_for_indexed(
+            "on_modal",
+            [("custom_id", custom_id) for custom_id in ids],
+            check=check,
+            timeout=timeout,
+        )
 
         # Ed requested that it returns a result similar to the decorator
         fields: List[str] = []
@@ -2224,11 +2575,10 @@ class Extension:
 
                     component = kwargs.get("component") or args[0]
                     comp_name = (
-                        _component(component).custom_id
+                        f"component_{_component(component).custom_id}"
                         if isinstance(component, (Button, SelectMenu))
-                        else component
+                        else ComponentRouter.event_name(component)
                     )
-                    comp_name = f"component_{comp_name}"
 
                     listeners = self._listeners.get(comp_name, [])
                     listeners.append(func)
@@ -2285,22 +2635,40 @@ class Extension:
 
         self.client._Client__resolve_commands()  # noqa
 
-        if client._websocket.ready.is_set() and client._automate_sync:
+        if (
+            client._websocket.ready.is_set()
+            and client._automate_sync
+            and not client._Client__defer_sync  # noqa
+        ):
             client._loop.create_task(client._Client__sync())  # noqa
 
         return self
 
-    async def teardown(self, remove_commands: bool = True):
+    def _detach(self) -> None:
+        """Removes the listeners and commands of the extension from the client without syncing."""
+        _events = self.client._websocket._dispatch.events
+
+        _router: ComponentRouter = self.client._component_router
         for event, funcs in self._listeners.items():
             for func in funcs:
-                self.client._websocket._dispatch.events[event].remove(func)
+                with contextlib.suppress(KeyError, ValueError):
+                    _events[event].remove(func)
 
-        for cmd, funcs in self._commands.items():
+            if event.startswith("component_") and not _events.get(event):
+                # an empty list would hide the patterns from the lookup of the custom_id
+                _events.pop(event, None)
+                # the pattern is no longer matched once nothing listens to it anymore
+                _router.remove(event[len("component_") :])
+
+        for cmd in self._commands:
             _cmd: str = cmd.split("_", 1)[1]
 
-            for _coro in self.client._Client__command_coroutines:
+            for _coro in self.client._Client__command_coroutines:  # noqa
                 if _coro._name == _cmd:
                     self.client._Client__command_coroutines.remove(_coro)  # noqa
+                    # the registered coroutine is the resolved one, not the one stored in _commands
+                    with contextlib.suppress(KeyError, ValueError):
+                        _events[cmd].remove(_coro)
                     break
 
             for _command in self.client._commands:
@@ -2308,8 +2676,8 @@ class Extension:
                     self.client._commands.remove(_command)
                     break
 
-            for i in range(len(funcs)):
-                self.client._websocket._dispatch.events[cmd].pop(i)  # noqa
+    async def teardown(self, remove_commands: bool = True):
+        self._detach()
 
         if self.client._automate_sync and remove_commands:
             await self.client._Client__sync()  # noqa
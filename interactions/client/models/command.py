@@ -1,7 +1,7 @@
 import contextlib
 from asyncio import CancelledError
 from functools import wraps
-from inspect import getdoc, signature
+from inspect import Parameter, getdoc, signature
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,8 +9,10 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
     Union,
     get_type_hints,
 )
@@ -368,6 +370,62 @@ class GroupResult(DictSerializerMixin):
         return self.result
 
 
+class _CallPlan:
+    """
+    A precomputed description of how the options of an interaction are passed to a command coroutine.
+
+    :ivar Callable[..., Awaitable] coro: The wrapped coroutine to call.
+    :ivar int num: The amount of parameters before the options (context, and self for extensions).
+    :ivar int param_len: The amount of parameters of the coroutine.
+    :ivar Optional[Any] last_kind: The kind of the last parameter of the coroutine, if any.
+    :ivar bool has_args: Whether the coroutine has a ``*args`` parameter.
+    :ivar Tuple[str, ...] par_opts: The parameters that are before ``*args`` and ``**kwargs``.
+    :ivar FrozenSet[str] keyword_only_args: The parameters after ``*args``.
+    """
+
+    __slots__ = (
+        "coro",
+        "num",
+        "param_len",
+        "last_kind",
+        "has_args",
+        "par_opts",
+        "keyword_only_args",
+    )
+
+    coro: Callable[..., Awaitable]
+    num: int
+    param_len: int
+    last_kind: Optional[Any]
+    has_args: bool
+    par_opts: Tuple[str, ...]
+    keyword_only_args: FrozenSet[str]
+
+    def __init__(self, coro: Callable[..., Awaitable], wrapped: Callable[..., Awaitable], num: int):
+        params = signature(coro).parameters
+        names = list(params)
+        kinds = [param.kind for param in params.values()]
+
+        self.coro = wrapped
+        self.num = num
+        self.param_len = len(names)
+        self.last_kind = kinds[-1] if kinds else None
+        self.has_args = Parameter.VAR_POSITIONAL in kinds
+        index_of_var_pos = (
+            kinds.index(Parameter.VAR_POSITIONAL) if self.has_args else self.param_len
+        )
+        self.par_opts = tuple(
+            names[
+                num : (
+                    -1
+                    if self.last_kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+                    else index_of_var_pos
+                )
+            ]
+        )  # parameters that are before *args and **kwargs
+        self.keyword_only_args = frozenset(names[index_of_var_pos:])  # parameters after *args
+
+
 @define()
 class Command(DictSerializerMixin):
     """
@@ -425,6 +483,9 @@ class Command(DictSerializerMixin):
     extension: Optional["Extension"] = field(default=None, init=False)
     client: "Client" = field(default=None, init=False)
     listener: Optional["Listener"] = field(default=None, init=False)
+    _call_plans: Dict[Callable[..., Awaitable], _CallPlan] = field(
+        init=False, factory=dict, repr=False
+    )
 
     def __attrs_post_init__(self) -> None:
         if self.name is MISSING:
@@ -691,6 +752,10 @@ class Command(DictSerializerMixin):
         if not self.has_subcommands:
             return self.__wrap_coro(self.coro)
 
+        self._call_plans.clear()
+        for coro in (self.coro, *self.coroutines.values()):
+            self.__get_call_plan(coro)
+
         @wraps(self.coro)
         async def dispatch(
             ctx: "CommandContext",
@@ -803,34 +868,24 @@ class Command(DictSerializerMixin):
         **kwargs,
     ) -> Optional[Any]:  # sourcery skip: low-code-quality
         """Handles calling the coroutine based on parameter count."""
-        params = signature(coro).parameters
-        param_len = len(params)
+        plan = self.__get_call_plan(coro)
+        _coro = plan.coro
+        num = plan.num
+        param_len = plan.param_len
+        par_opts = plan.par_opts
         opt_len = self.num_options.get(_name, len(args) + len(kwargs))  # options of slash command
-        last = params[list(params)[-1]]  # last parameter
-        has_args = any(param.kind == param.VAR_POSITIONAL for param in params.values())  # any *args
-        index_of_var_pos = next(
-            (i for i, param in enumerate(params.values()) if param.kind == param.VAR_POSITIONAL),
-            param_len,
-        )  # index of *args
-        par_opts = list(params.keys())[
-            (num := 2 if self.extension else 1) : (
-                -1 if last.kind in (last.VAR_POSITIONAL, last.VAR_KEYWORD) else index_of_var_pos
-            )
-        ]  # parameters that are before *args and **kwargs
-        keyword_only_args = list(params.keys())[index_of_var_pos:]  # parameters after *args
 
         with contextlib.suppress(CancelledError):
-            _coro = coro if hasattr(coro, "_wrapped") else self.__wrap_coro(coro)
-
-            if last.kind == last.VAR_KEYWORD:  # foo(ctx, ..., **kwargs)
+            if plan.last_kind == Parameter.VAR_KEYWORD:  # foo(ctx, ..., **kwargs)
                 return await _coro(ctx, *args, **kwargs)
-            if last.kind == last.VAR_POSITIONAL:  # foo(ctx, ..., *args)
+            if plan.last_kind == Parameter.VAR_POSITIONAL:  # foo(ctx, ..., *args)
                 return await _coro(
                     ctx,
                     *(kwargs[opt] for opt in par_opts if opt in kwargs),
                     *args,
                 )
-            if has_args:  # foo(ctx, ..., *args, ..., **kwargs) OR foo(ctx, *args, ...)
+            if plan.has_args:  # foo(ctx, ..., *args, ..., **kwargs) OR foo(ctx, *args, ...)
+                keyword_only_args = plan.keyword_only_args
                 return await _coro(
                     ctx,
                     *(kwargs[opt] for opt in par_opts if opt in kwargs),  # pos before *args
@@ -866,6 +921,18 @@ class Command(DictSerializerMixin):
 
             return await _coro(ctx, *args, **kwargs)
 
+    def __get_call_plan(self, coro: Callable[..., Awaitable]) -> _CallPlan:
+        """Returns the call plan of a coroutine, compiling it if it does not exist yet."""
+        num = 2 if self.extension else 1
+        plan = self._call_plans.get(coro)
+
+        if plan is None or plan.num != num:
+            plan = self._call_plans[coro] = _CallPlan(
+                coro, coro if hasattr(coro, "_wrapped") else self.__wrap_coro(coro), num
+            )
+
+        return plan
+
     def __check_command(self, command_type: str) -> None:
         """Checks if subcommands, groups, or autocompletions are created on context menus."""
         if self.type != ApplicationCommandType.CHAT_INPUT:
@@ -1,6 +1,10 @@
 from abc import ABC, ABCMeta, abstractmethod
+from asyncio import Task, create_task
+from collections import deque
+from contextlib import suppress
+from inspect import isawaitable
 from math import inf
-from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, List, Optional, TypeVar, Union
 
 from ..missing import MISSING
 
@@ -85,6 +89,93 @@ class DiscordPaginationIterator(BaseAsyncIterator, metaclass=ABCMeta):
 
         self.objects: Optional[List[_O]] = None
 
+        self._stopped: bool = False
+        self._limit: int = 0
+        self._next_page: Optional[Task] = None
+
+    #: The maximum amount of objects of a page, for the iterators implementing :meth:`_request_page`.
+    _page_size: int = 100
+
+    def _request_page(self) -> Awaitable[Any]:
+        """
+        .. versionadded:: 4.5.0
+
+        Requests the page after the current one, of up to ``self._limit`` objects.
+
+        Iterators implementing it and :meth:`_parse_page` get their pages in the background: the next page is
+        already requested while the objects of the current one are yielded.
+        """
+        raise NotImplementedError
+
+    def _parse_page(self, page: Any) -> Iterable[_O]:
+        """
+        .. versionadded:: 4.5.0
+
+        Moves the iterator past a page, setting ``self._stopped`` if it is the last one, and returns its objects.
+
+        :param Any page: The page returned by :meth:`_request_page`.
+        """
+        raise NotImplementedError
+
+    def _prefetch(self) -> None:
+        self._limit = int(min(self._page_size, self.maximum - self.object_count))
+        self._next_page = create_task(self._request_page())
+
+    def _cancel_prefetch(self) -> None:
+        """Cancels the request of the next page, if any. It is requested again if the iteration goes on."""
+        if self._next_page is not None:
+            self._next_page.cancel()
+            self._next_page = None
+
+    async def get_objects(self) -> None:
+        if self._next_page is None:
+            self._prefetch()
+
+        try:
+            page = await self._next_page
+        finally:
+            self._next_page = None
+
+        objects = self._parse_page(page)
+        if not self._stopped:
+            self._prefetch()
+        self.objects.extend(objects)
+
+    async def __anext__(self) -> _O:
+        if self.objects is None:
+            self.objects = deque()
+
+        while True:
+            while not self.objects:
+                if self._stopped:
+                    raise StopAsyncIteration
+                await self.get_objects()
+
+            obj = self.objects.popleft()
+
+            if self.check:
+                res = self.check(obj)
+                if not (await res if isawaitable(res) else res):
+                    continue
+
+            return obj
+
+    async def aclose(self) -> None:
+        """
+        .. versionadded:: 4.5.0
+
+        Stops the iteration, cancelling the request of the next page if any.
+        Call it when leaving an iteration early, i.e. with ``break``.
+        """
+        self._stopped = True
+        self._cancel_prefetch()
+        if self.objects:
+            self.objects.clear()
+
+    def __del__(self) -> None:
+        with suppress(AttributeError, RuntimeError):  # the event loop may already be closed
+            self._cancel_prefetch()
+
 
 class BaseIterator(ABC):
     """
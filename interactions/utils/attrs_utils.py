@@ -2,7 +2,8 @@ from copy import deepcopy
 from datetime import datetime
 from enum import Enum
 from functools import wraps
-from typing import Any, Dict, Mapping, Optional, Tuple
+from keyword import iskeyword
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 import attrs
 
@@ -14,6 +15,73 @@ __all__ = (
 )
 
 
+_SCALARS = frozenset({str, int, float, bool})
+_serializers: Dict[type, Callable[[Any], dict]] = {}
+_Snowflake: Optional[type] = None  # resolved on first use, as the models import this module
+
+
+def _compile_serializer(cls: type) -> Callable[[Any], dict]:
+    """
+    Generates the function serializing the instances of an attrs class to a dict.
+
+    Public attributes other than ``converter`` are emitted when they are not ``None``, with Snowflakes as
+    strings, enums as their value, datetimes in ISO format and nested attrs classes serialized the same way.
+    """
+    global _Snowflake
+    if _Snowflake is None:
+        from ..api.models.misc import Snowflake
+
+        _Snowflake = Snowflake
+
+    lines = ["def serialize(inst):", "    rv = {}"]
+    for attrib in attrs.fields(cls):
+        name = attrib.name
+        if name.startswith("_") or name == "converter":
+            continue
+        lines += [
+            f"    v = getattr(inst, {name!r})" if iskeyword(name) else f"    v = inst.{name}",
+            "    if v is not None:",
+            f"        rv[{name!r}] = v if v.__class__ in _SCALARS else _to_json(v)",
+        ]
+    lines.append("    return rv")
+
+    namespace = {"_SCALARS": _SCALARS, "_to_json": _to_json}
+    exec("\n".join(lines), namespace)  # noqa: S102
+
+    serializer = _serializers[cls] = namespace["serialize"]
+    return serializer
+
+
+def _to_json(value: Any) -> Any:
+    """Converts a value of an attribute to its json representation."""
+    cls = value.__class__
+    if (serializer := _serializers.get(cls)) is not None:
+        return serializer(value)
+    if getattr(cls, "__attrs_attrs__", None) is not None:
+        return _compile_serializer(cls)(value)
+    if isinstance(value, _Snowflake):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [item if item.__class__ in _SCALARS else _to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            _key_to_json(key): item if item.__class__ in _SCALARS else _to_json(item)
+            for key, item in value.items()
+        }
+    return value
+
+
+def _key_to_json(key: Any) -> Any:
+    """Converts a key of a dict attribute to its json representation."""
+    if isinstance(key, (list, tuple, set, frozenset)):
+        return tuple(_to_json(item) for item in key)
+    return _to_json(key)
+
+
 @attrs.define(eq=False, init=False, on_setattr=attrs.setters.NO_OP)
 class DictSerializerMixin:
     _extras: dict = attrs.field(init=False, repr=False)
@@ -82,28 +150,7 @@ class DictSerializerMixin:
     @property
     def _json(self) -> dict:
         """Returns the json data of the object"""
-        from ..api.models.misc import Snowflake
-
-        def _filter(attrib: attrs.Attribute, value: Any):
-            return (
-                not attrib.name.startswith("_")
-                and attrib.name
-                not in {
-                    "converter",
-                }
-                and value is not None
-            )
-
-        def _serializer(obj: Any, attrib: attrs.Attribute, value: Any):
-            if isinstance(value, Snowflake):
-                return str(value)
-            if isinstance(value, Enum):
-                return value.value
-            if isinstance(value, datetime):
-                return value.isoformat()
-            return value
-
-        return attrs.asdict(self, filter=_filter, value_serializer=_serializer)
+        return (_serializers.get(self.__class__) or _compile_serializer(self.__class__))(self)
 
     def update(self, kwargs_dict: dict = None, /, **other_kwargs):
         """
@@ -1,10 +1,11 @@
 # versionadded declared in docs gen file
 
-from asyncio import sleep
-from inspect import isawaitable
+import asyncio
+from asyncio import Semaphore, gather, sleep, wait_for
 from logging import getLogger
+from secrets import token_hex
 from sys import version_info
-from typing import TYPE_CHECKING, Coroutine, List, Optional, Type, TypeVar, Union, get_args
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args
 
 try:
     from typing import _GenericAlias
@@ -22,6 +23,7 @@ else:
     from types import GenericAlias
 
 from ..api.error import LibraryException
+from ..api.models.flags import Intents
 from ..api.models.member import Member
 from ..api.models.message import Message
 from ..api.models.misc import Snowflake
@@ -32,6 +34,9 @@ log = getLogger("get")
 
 _T = TypeVar("_T")
 
+_MAX_CONCURRENCY: int = 10  # HTTP requests at once when getting a list
+_MEMBERS_TIMEOUT: float = 10  # seconds to wait for the chunks of a gateway member request
+
 if TYPE_CHECKING:
     from ..api.http.client import HTTPClient
     from ..client.bot import Client
@@ -188,9 +193,8 @@ def get(client: "Client", obj: Type[_T], **kwargs) -> Optional[_T]:
 
     if isinstance(obj, (_GenericAlias, GenericAlias)):
         _obj: Type[_T] = get_args(obj)[0]
-        http_name = f"get_{_obj.__name__.lower()}"
         kwarg_name = f"{_obj.__name__.lower()}_ids"
-        _objects: List[Union[_obj, Coroutine]] = (
+        _objects: List[Optional[_obj]] = (
             _get_cache(_obj, client, kwarg_name, _list=True, **kwargs) if not force_http else []
         )  # some sourcery stuff i dunno
 
@@ -201,26 +205,9 @@ def get(client: "Client", obj: Type[_T], **kwargs) -> Optional[_T]:
             return _return_cache(_objects)
 
         elif force_http:
-            _objects.clear()
-            _func = getattr(client._http, http_name)
-            for _id in kwargs.get(kwarg_name):
-                _kwargs = kwargs.copy()
-                _kwargs.pop(kwarg_name)
-                _kwargs[kwarg_name[:-1]] = _id
-                _objects.append(_func(**_kwargs))
-            return _http_request(_obj, http=client._http, request=_objects)
+            _objects = [None] * len(kwargs[kwarg_name])
 
-        else:
-            _func = getattr(client._http, http_name)
-            for _index, __obj in enumerate(_objects):
-                if __obj is None:
-                    _id = kwargs.get(kwarg_name)[_index]
-                    _kwargs = kwargs.copy()
-                    _kwargs.pop(kwarg_name)
-                    _kwargs[kwarg_name[:-1]] = _id
-                    _request = _func(**_kwargs)
-                    _objects[_index] = _request
-            return _http_request(_obj, http=client._http, request=_objects)
+        return _http_request_list(_obj, client, kwarg_name, _objects, force_http, **kwargs)
 
     http_name = f"get_{obj.__name__.lower()}"
     kwarg_name = f"{obj.__name__.lower()}_id"
@@ -239,19 +226,7 @@ def get(client: "Client", obj: Type[_T], **kwargs) -> Optional[_T]:
         return _http_request(obj=obj, http=client._http, _name=http_name, **kwargs)
 
 
-async def _http_request(
-    obj: Type[_T],
-    http: "HTTPClient",
-    request: Union[Coroutine, List[Union[_T, Coroutine]], List[Coroutine]] = None,
-    _name: str = None,
-    **kwargs,
-) -> Union[_T, List[_T]]:
-    if request:
-        return (
-            [obj(**await req, _client=http) if isawaitable(req) else req for req in request]
-            if isinstance(request, list)
-            else obj(**await request, _client=http)
-        )
+async def _http_request(obj: Type[_T], http: "HTTPClient", _name: str = None, **kwargs) -> _T:
     from ..api.models.emoji import Emoji
 
     if obj in (Role, Emoji):
@@ -260,12 +235,104 @@ async def _http_request(
         _func = getattr(_guild, _name)
         return await _func(**kwargs)
 
-    # I don't like this. This thing doesn't adds object to cache.
-    # So
-    # TODO: yeet this
     _func = getattr(http, _name)
     _obj = await _func(**kwargs)
-    return obj(**_obj, _client=http)
+    return _add_to_cache(obj, http, _obj, kwargs.get("guild_id"))
+
+
+async def _http_request_list(
+    obj: Type[_T],
+    client: "Client",
+    kwarg_name: str,
+    objects: List[Optional[_T]],
+    force_http: bool = False,
+    **kwargs,
+) -> List[_T]:
+    """
+    Fetches the objects missing from a list, concurrently.
+
+    Members are requested over the gateway in batches of 100 if possible, unless ``force_http`` is set. Anything else
+    or anything the gateway did not return is fetched over HTTP, with at most ``_MAX_CONCURRENCY`` requests at once.
+    """
+    ids: list = kwargs.pop(kwarg_name)
+    missing: List[int] = [index for index, _obj in enumerate(objects) if _obj is None]
+
+    if obj is Member and missing and not force_http:
+        members = await _request_members(client, kwargs["guild_id"], [ids[i] for i in missing])
+        for index in missing:
+            objects[index] = members.get(int(ids[index]))
+        missing = [index for index in missing if objects[index] is None]
+
+    _func = getattr(client._http, f"get_{obj.__name__.lower()}")
+    semaphore = Semaphore(_MAX_CONCURRENCY)
+
+    async def _fetch(_id: int) -> _T:
+        async with semaphore:
+            data = await _func(**kwargs, **{kwarg_name[:-1]: _id})
+        return _add_to_cache(obj, client._http, data, kwargs.get("guild_id"))
+
+    for index, _obj in zip(missing, await gather(*(_fetch(ids[index]) for index in missing))):
+        objects[index] = _obj
+
+    return objects
+
+
+async def _request_members(
+    client: "Client", guild_id: int, user_ids: List[int]
+) -> Dict[int, Member]:
+    """
+    Requests members over the gateway, which the ``GUILD_MEMBERS_CHUNK`` processor adds to the cache.
+
+    :return: The members received, by user ID. This is empty if the gateway cannot be used.
+    """
+    websocket = client._websocket
+    if not websocket.ready.is_set() or Intents.GUILD_MEMBERS not in client._intents:
+        return {}
+
+    waiters = websocket._dispatch.get_waiters("on_guild_members_chunk")
+
+    async def _request(batch: List[int]) -> List[Member]:
+        chunks: list = []
+
+        def _check(chunk) -> bool:
+            chunks.append(chunk)
+            return len(chunks) >= chunk.chunk_count
+
+        nonce: str = token_hex(16)
+        future = waiters.add((nonce,), _check)
+        await websocket.request_guild_members(
+            guild_id=int(guild_id), limit=0, user_ids=batch, nonce=nonce
+        )
+
+        try:
+            await wait_for(future, timeout=_MEMBERS_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.warning("Timed out requesting members of guild %s, using HTTP instead.", guild_id)
+
+        return [member for chunk in chunks for member in chunk.members]
+
+    user_ids = [int(_id) for _id in user_ids]
+    batches = await gather(*(_request(user_ids[i : i + 100]) for i in range(0, len(user_ids), 100)))
+
+    return {int(member.id): member for batch in batches for member in batch}
+
+
+def _add_to_cache(
+    obj: Type[_T], http: "HTTPClient", data: dict, guild_id: Optional[int] = None
+) -> _T:
+    """Builds an object fetched over HTTP and caches it for ``Cache.http_ttl`` seconds."""
+    _obj = obj(**data, _client=http)
+    if (ttl := http.cache.http_ttl) is None or not hasattr(_obj, "id"):
+        return _obj
+
+    _id = (Snowflake(guild_id), _obj.id) if obj is Member else _obj.id
+    storage = http.cache[obj]
+    if storage.get(_id) is not None and storage.ttl(_id) is None:
+        storage.merge(_obj, _id)  # kept up to date by the gateway already
+    else:
+        storage.add(_obj, _id, ttl=ttl)
+
+    return _obj
 
 
 async def _return_cache(
@@ -275,6 +342,15 @@ async def _return_cache(
     return obj
 
 
+def _set_client(
+    _object: Type[_T], obj: Optional[_T], client: "Client", id: Union[Snowflake, Tuple]
+) -> None:
+    """Gives a cached object the HTTP client, storing it again if it did not have it yet."""
+    if obj and obj._client is not client._http:
+        obj._client = client._http
+        client._http.cache[_object].write_back(obj, id)
+
+
 def _get_cache(
     _object: Type[_T], client: "Client", kwarg_name: str, _list: bool = False, **kwargs
 ) -> Union[Optional[_T], List[Optional[_T]]]:
@@ -291,15 +367,13 @@ def _get_cache(
             ]
             for item in _values:
                 _obj = client._http.cache[_object].get(item, None)
-                if _obj:
-                    _obj._client = client._http
+                _set_client(_object, _obj, client, item)
                 _objs.append(_obj)
 
         else:
             for _id in kwargs.get(kwarg_name):
                 _obj = client._http.cache[_object].get(Snowflake(_id), None)
-                if _obj:
-                    _obj._client = client._http
+                _set_client(_object, _obj, client, Snowflake(_id))
                 _objs.append(_obj)
         return _objs
     else:
@@ -312,8 +386,7 @@ def _get_cache(
             _values = Snowflake(kwargs.get(kwarg_name))
 
         _obj = client._http.cache[_object].get(_values)
-        if _obj:
-            _obj._client = client._http
+        _set_client(_object, _obj, client, _values)
         return _obj
 
 
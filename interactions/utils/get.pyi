@@ -1,4 +1,15 @@
-from typing import Awaitable, Coroutine, List, Literal, Optional, Type, TypeVar, Union, overload
+from typing import (
+    Awaitable,
+    Coroutine,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from ..client.bot import Client
 from ..client.enums import StrEnum
@@ -110,10 +121,18 @@ def _get_cache(
 async def _return_cache(
     obj: Union[Optional[_T], List[Optional[_T]]]
 ) -> Union[Optional[_T], List[Optional[_T]]]: ...
-async def _http_request(
+async def _http_request(obj: Type[_T], http: HTTPClient, _name: str = None, **kwargs) -> _T: ...
+async def _http_request_list(
     obj: Type[_T],
-    http: HTTPClient,
-    request: Union[Coroutine, List[Union[_T, Coroutine]], List[Coroutine]] = None,
-    _name: str = None,
+    client: Client,
+    kwarg_name: str,
+    objects: List[Optional[_T]],
+    force_http: bool = False,
     **kwargs,
-) -> Union[_T, List[_T]]: ...
+) -> List[_T]: ...
+async def _request_members(
+    client: Client, guild_id: int, user_ids: List[int]
+) -> Dict[int, Member]: ...
+def _add_to_cache(
+    obj: Type[_T], http: HTTPClient, data: dict, guild_id: Optional[int] = None
+) -> _T: ...
@@ -1,11 +1,15 @@
-from asyncio import Task, get_running_loop, sleep
+from asyncio import Semaphore, Task, gather, get_running_loop, sleep
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from json import dump, dumps, load
 from math import inf
+from os import PathLike, replace
 from typing import (
     TYPE_CHECKING,
     Awaitable,
     Callable,
     Coroutine,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -33,6 +37,7 @@ __all__ = (
     "search_iterable",
     "disable_components",
     "get_channel_history",
+    "archive_channels",
 )
 
 _T = TypeVar("_T")
@@ -283,6 +288,118 @@ def get_channel_history(
     )
 
 
+async def archive_channels(
+    http: Union["HTTPClient", "Client"],
+    channels: Iterable[Union[int, str, "Snowflake", "Channel"]],
+    path: Union[str, PathLike],
+    checkpoint: Optional[Union[str, PathLike]] = None,
+    concurrency: int = 5,
+    maximum: float = inf,
+) -> Dict[int, int]:
+    """
+    .. versionadded:: 4.5.0
+
+    Exports the message history of many channels at once into a JSON Lines file.
+
+    Every channel is paginated from its oldest message onwards in its own task, while at most ``concurrency``
+    requests are in flight at the same time. The per-route rate limiter of the HTTP client still applies to every
+    request, so channels only wait on each other when Discord's buckets require it.
+
+    If a ``checkpoint`` file is given, the ID of the last exported message of every channel is written to it after
+    each page, and an existing checkpoint is used to resume the export right after that message.
+    Files are written in a separate thread, so the export does not block the event loop. If a channel fails, the
+    export of the other ones is stopped and the error is raised.
+
+    .. code-block:: python
+
+        await interactions.archive_channels(bot, [channel_1, channel_2], "export.jsonl", checkpoint="export.json")
+
+    :param Union[HTTPClient, Client] http: The HTTPClient of the bot or your bot instance
+    :param Iterable[Union[int, str, Snowflake, Channel]] channels: The channels to export the history of
+    :param Union[str, PathLike] path: The file to append the raw message payloads to, one per line
+    :param Optional[Union[str, PathLike]] checkpoint: The file to store and resume the export progress from
+    :param Optional[int] concurrency: The maximum amount of history requests running at once. Defaults to ``5``
+    :param float maximum: A set maximum of messages to export per channel before stopping. Defaults to no maximum
+    :return: The amount of exported messages per channel ID
+    :rtype: Dict[int, int]
+    """
+    if concurrency < 1:
+        raise LibraryException(code=12, message="concurrency should be at least 1.")
+
+    _http: "HTTPClient" = http._http if hasattr(http, "_http") else http
+    channel_ids: List[int] = [
+        int(channel.id) if hasattr(channel, "id") else int(channel) for channel in channels
+    ]
+
+    cursors: Dict[str, int] = {}
+    if checkpoint is not None:
+        try:
+            with open(checkpoint, "r", encoding="utf-8") as fp:
+                cursors = load(fp)
+        except FileNotFoundError:
+            pass
+
+    semaphore = Semaphore(concurrency)
+    counts: Dict[int, int] = {channel_id: 0 for channel_id in channel_ids}
+    loop = get_running_loop()
+    # A single thread writes the pages in the order they are received, off the event loop.
+    writer = ThreadPoolExecutor(max_workers=1)
+
+    def write_page(lines: List[str], _cursors: Optional[Dict[str, int]]) -> None:
+        with open(path, "a", encoding="utf-8") as out:
+            out.writelines(lines)
+
+        if _cursors is not None:
+            _tmp = f"{checkpoint}.tmp"
+            with open(_tmp, "w", encoding="utf-8") as fp:
+                dump(_cursors, fp)
+            replace(_tmp, checkpoint)  # never leave a half-written checkpoint behind
+
+    async def archive(channel_id: int) -> None:
+        after: int = int(cursors.get(str(channel_id), 0))
+
+        while counts[channel_id] < maximum:
+            limit = int(min(100, maximum - counts[channel_id]))
+            async with semaphore:
+                msgs = await _http.get_channel_messages(
+                    channel_id=channel_id, after=after, limit=limit
+                )
+
+            if not msgs:
+                return
+
+            msgs.reverse()  # Discord returns the newest messages first
+            after = int(msgs[-1]["id"])
+            counts[channel_id] += len(msgs)
+            if checkpoint is not None:
+                cursors[str(channel_id)] = after
+
+            await loop.run_in_executor(
+                writer,
+                write_page,
+                [f"{dumps(msg, separators=(',', ':'))}\n" for msg in msgs],
+                None if checkpoint is None else dict(cursors),
+            )
+
+            if len(msgs) < limit:
+                return
+
+    tasks: List[Task] = [loop.create_task(archive(channel_id)) for channel_id in channel_ids]
+    try:
+        await gather(*tasks)
+    except BaseException:
+        # Stops the other channels, so the checkpoint matches what was written when one of them fails.
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        await loop.run_in_executor(writer, int)  # waits for the pages still being written
+        writer.shutdown(wait=False)
+
+    return counts
+
+
 def get_guild_members(
     http: Union["HTTPClient", "Client"],
     guild: Union[int, str, "Snowflake", "Guild"],